@@ -0,0 +1,432 @@
+#!/usr/bin/python
+# (c) 2018 Jim Hawkins. MIT licensed, see https://opensource.org/licenses/MIT
+# Part of Blender Driver, see https://github.com/sjjhsjjh/blender-driver
+"""Blender Driver Application with an HTTP server on an asyncio event loop.
+
+The event loop runs on a thread of its own, and handles all the connections
+without a thread for each. Requests are parsed on the loop. A GET that can be
+served from the published snapshot of the generic store is answered on the
+loop. Other path store operations are handed to the tick thread, and answered
+when they have been applied.
+
+This module is intended for use within Blender Driver and can only be used from
+within Blender."""
+# Exit if run other than as a module.
+if __name__ == '__main__':
+    print(__doc__)
+    raise SystemExit(1)
+
+# Standard library imports, in alphabetic order.
+#
+# Module for the event loop.
+# https://docs.python.org/3/library/asyncio.html
+import asyncio
+#
+# Module for the threads that read static files.
+# https://docs.python.org/3/library/concurrent.futures.html
+from concurrent.futures import ThreadPoolExecutor
+#
+# Module for HTTP status code reason phrases.
+# https://docs.python.org/3/library/http.html
+from http import HTTPStatus
+#
+# Module for JavaScript Object Notation (JSON) strings.
+# https://docs.python.org/3.5/library/json.html
+import json
+#
+# Module for levelled logging messages.
+# Tutorial is here: https://docs.python.org/3/howto/logging.html
+# Reference is here: https://docs.python.org/3/library/logging.html
+from logging import DEBUG, INFO, ERROR, log
+#
+# Module for the Content-Type of static files.
+# https://docs.python.org/3/library/mimetypes.html
+import mimetypes
+#
+# Modules for the paths of static files.
+# https://docs.python.org/3/library/os.html
+# https://docs.python.org/3/library/os.path.html
+import os
+import os.path
+import posixpath
+#
+# Module for starting a Thread.
+# https://docs.python.org/3/library/threading.html
+import threading
+#
+# Module for pretty printing exceptions.
+# https://docs.python.org/3/library/traceback.html#traceback-examples
+from traceback import print_exc
+#
+# Module for parsing URL strings.
+# https://docs.python.org/3/library/urllib.parse.html
+import urllib.parse
+#
+# Local imports.
+#
+# Application base class module.
+from . import http
+#
+# Path store REST module, for copying values from the generic store.
+from path_store.rest import generic_copy
+#
+# Path store utility.
+from path_store.pathstore import CompiledPath
+
+class HTTPError(Exception):
+    def __init__(self, status, message=None):
+        super().__init__(
+            HTTPStatus(status).phrase if message is None else message)
+        self.status = status
+
+class Request(object):
+    def __init__(self, method, target, version, headers, content):
+        self.method = method
+        self.target = target
+        self.version = version
+        # Dictionary of headers, with lower case names.
+        self.headers = headers
+        self.content = content
+
+    @property
+    def keepAlive(self):
+        connection = self.headers.get('connection', '').lower()
+        if self.version == 'HTTP/1.1':
+            return connection != 'close'
+        return connection == 'keep-alive'
+
+class Application(http.Application):
+    #
+    # Seconds that a connection can be idle, or take to send a request, before
+    # it is closed.
+    _idleTimeout = 5.0
+    #
+    # Limits on requests.
+    _maxHeaders = 100
+    _maxContent = 1 << 24
+    #
+    # Number of threads that read static files, so that the loop doesn't wait
+    # for the file system.
+    _staticThreads = 2
+
+    # Override.
+    def _start_server(self):
+        # The current working directory is the website directory, see the
+        # base class.
+        self._website = os.getcwd()
+        self._staticExecutor = ThreadPoolExecutor(
+            self._staticThreads, 'http_static')
+        self._connections = set()
+        self._server = None
+        self._startError = None
+        self._loop = asyncio.new_event_loop()
+        started = threading.Event()
+        self._loopThread = threading.Thread(
+            target=self._run_loop, args=(started,), name="http_asyncio")
+        self._loopThread.start()
+        started.wait()
+        if self._startError is not None:
+            raise self._startError
+
+        address = self._server.sockets[0].getsockname()
+        self._url = 'http://{}:{}'.format(
+            'localhost' if address[0] == '127.0.0.1' else address[0]
+            , int(address[1]))
+        log(INFO, 'Started asyncio HTTP server at {}', self.url)
+
+    def _run_loop(self, started):
+        loop = self._loop
+        asyncio.set_event_loop(loop)
+        try:
+            self._server = loop.run_until_complete(asyncio.start_server(
+                self._accept, 'localhost', self.arguments.port))
+        except Exception as error:
+            self._startError = error
+            loop.close()
+            return
+        finally:
+            started.set()
+
+        try:
+            loop.run_forever()
+            #
+            # The loop was stopped by _shutdown(), which cancelled all the
+            # connections. Let them finish.
+            if len(self._connections) > 0:
+                loop.run_until_complete(asyncio.gather(
+                    *self._connections, return_exceptions=True))
+            loop.run_until_complete(self._server.wait_closed())
+        finally:
+            loop.close()
+
+    # Override.
+    def _stop_server(self):
+        try:
+            self._loop.call_soon_threadsafe(self._shutdown)
+        except RuntimeError:
+            # The loop is closed already.
+            pass
+        self._loopThread.join()
+        self._staticExecutor.shutdown()
+
+    def _shutdown(self):
+        # Runs on the loop. Closing the server stops new connections, and
+        # cancelling the connections interrupts any reads and writes, and any
+        # waits for the tick.
+        self._server.close()
+        for connection in self._connections:
+            connection.cancel()
+        self._loop.stop()
+
+    def _accept(self, reader, writer):
+        # Called by the server for each new connection.
+        task = self._loop.create_task(self._connection(reader, writer))
+        self._connections.add(task)
+        task.add_done_callback(self._connections.discard)
+
+    async def _connection(self, reader, writer):
+        try:
+            while True:
+                try:
+                    request = await asyncio.wait_for(
+                        self._read_request(reader), self._idleTimeout)
+                except asyncio.TimeoutError:
+                    break
+                except HTTPError as error:
+                    self._write_response(
+                        writer, error.status, str(error), False)
+                    await writer.drain()
+                    break
+                if request is None:
+                    break
+                keepAlive = request.keepAlive
+                try:
+                    status, contentType, body = await self._respond(request)
+                except HTTPError as error:
+                    status, contentType, body = error.status, None, str(error)
+                except Exception:
+                    log(ERROR, 'Exception handling {} {}.'
+                        , request.method, request.target)
+                    print_exc()
+                    status, contentType, body = 500, None, None
+                self._write_response(
+                    writer, status, body, keepAlive, contentType
+                    , request.method == 'HEAD')
+                await writer.drain()
+                if not keepAlive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError) as error:
+            log(DEBUG, 'Connection closed. {}', error)
+        finally:
+            writer.close()
+
+    async def _read_request(self, reader):
+        # Returns a Request, or None if the connection was closed between
+        # requests.
+        try:
+            line = await reader.readline()
+            #
+            # Ignore empty lines before a request line, see RFC 7230 section
+            # 3.5.
+            while line in (b'\r\n', b'\n'):
+                line = await reader.readline()
+            if line == b'':
+                return None
+            try:
+                method, target, version = line.decode('latin-1').split()
+            except ValueError:
+                raise HTTPError(400, "Bad request line.")
+
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b'\r\n', b'\n', b''):
+                    break
+                if len(headers) >= self._maxHeaders:
+                    raise HTTPError(431)
+                name, colon, value = line.decode('latin-1').partition(':')
+                if colon == '':
+                    raise HTTPError(400, "Bad header line.")
+                headers[name.strip().lower()] = value.strip()
+        except ValueError:
+            # Raised by readline() if a line is longer than the reader limit.
+            raise HTTPError(431)
+
+        if 'transfer-encoding' in headers:
+            raise HTTPError(411)
+        try:
+            length = int(headers.get('content-length', '0'))
+        except ValueError:
+            raise HTTPError(400, "Bad Content-Length.")
+        if length < 0:
+            raise HTTPError(400, "Bad Content-Length.")
+        if length > self._maxContent:
+            raise HTTPError(413)
+        content = (await reader.readexactly(length)) if length > 0 else b''
+        return Request(method.upper(), target, version, headers, content)
+
+    async def _respond(self, request):
+        # Returns a tuple of the status code, the content type, and the body.
+        url = urllib.parse.urlsplit(request.target)
+        if url.path == '/api' or url.path.startswith('/api/'):
+            return await self._rest_api(request, url)
+        if request.method in ('GET', 'HEAD'):
+            return await self._static(url)
+        raise HTTPError(501)
+
+    def _json_response(self, value):
+        return 200, 'application/json; charset=utf-8', self._jsonEncoder.encode(
+            value)
+
+    async def _rest_api(self, request, url):
+        try:
+            # Unquote so that selector legs, like [name="value"], can be used.
+            path = (
+                CompiledPath() if url.path == '/api'
+                else CompiledPath.split(urllib.parse.unquote(url.path), skip=1))
+            content = (
+                json.loads(request.content.decode('utf-8'))
+                if len(request.content) > 0 else None)
+        except ValueError as error:
+            raise HTTPError(400, str(error))
+
+        command = request.method
+        if command == 'GET' and path == self._locksPath:
+            return self._json_response(self.pathLocks.contention)
+        if command == 'GET' and path == self._appliedPath:
+            return self._json_response(self._applied_generic())
+        if command == 'GET' and path == self._metricsPath:
+            return self._json_response(self.tickTimings.summary())
+        #
+        # All writes are deferred to the tick. If the query string has
+        # wait=false, respond straight away with the sequence number of the
+        # write, like the --deferWrites option of the base class.
+        wait = self._query_flag(url, 'wait', True)
+        if command == 'POST' and path == self._batchPath:
+            try:
+                operations, rollback = self._batch_content(content)
+            except (AttributeError, KeyError, TypeError, ValueError) as error:
+                raise HTTPError(400, str(error))
+            batch = lambda: self._rest_batch(operations, rollback)
+            if not wait and any(
+                command != 'GET' for command, path, content in operations
+            ):
+                return self._accepted(batch)
+            results, rolledBack = await self._in_tick(batch)
+            return self._json_response(
+                {'rolledBack': rolledBack, 'results': results})
+        if command not in self._restCommands:
+            raise HTTPError(501)
+        if not (command == 'PUT' or command == 'PATCH'):
+            content = None
+
+        snapshot = self._query_flag(url, 'snapshot', True)
+        if command == 'GET' and snapshot:
+            found, generic = self._published_get(path)
+            if found:
+                return self._json_response(generic)
+
+        def operation():
+            # Runs on the tick thread. If the snapshot parameter is false, the
+            # value is encoded there, which saves the copy.
+            status, generic = self._rest_operation(command, path, content)
+            if command == 'GET' and status == 200:
+                with self._restInterface.genericLock:
+                    generic = (
+                        generic_copy(generic) if snapshot
+                        else self._jsonEncoder.encode(generic))
+            return status, generic
+
+        if command != 'GET' and not wait:
+            return self._accepted(operation)
+        status, generic = await self._in_tick(operation)
+        if status != 200:
+            raise HTTPError(status)
+        if command != 'GET':
+            return 200, None, None
+        if snapshot:
+            return self._json_response(generic)
+        return 200, 'application/json; charset=utf-8', generic
+
+    def _accepted(self, function):
+        # Queue a function for the tick without waiting for it, and get a 202
+        # Accepted response with its sequence number.
+        sequence = self.call_in_tick(http.DeferredCall(function))
+        return 202, 'application/json; charset=utf-8', self._jsonEncoder.encode(
+            {'sequence': sequence})
+
+    def _in_tick(self, function):
+        # Get a future for the return value of a function that is called on the
+        # tick thread, see call_in_tick(). Call only on the loop.
+        loop = self._loop
+        future = loop.create_future()
+        def call():
+            try:
+                result = function()
+                exception = None
+            except Exception as error:
+                result = None
+                exception = error
+            try:
+                loop.call_soon_threadsafe(
+                    self._resolve, future, result, exception)
+            except RuntimeError:
+                # The loop was closed, because the application is terminating.
+                pass
+        self.call_in_tick(call)
+        return future
+
+    @staticmethod
+    def _resolve(future, result, exception):
+        # The future is cancelled if its connection was cancelled while it was
+        # waiting for the tick.
+        if future.cancelled():
+            return
+        if exception is None:
+            future.set_result(result)
+        else:
+            future.set_exception(exception)
+
+    async def _static(self, url):
+        # Serve a file from the website directory. The file is read on one of
+        # the static threads.
+        return await self._loop.run_in_executor(
+            self._staticExecutor, self._read_static, url)
+
+    def _read_static(self, url):
+        # Normalising the path as an absolute path removes any .. legs that
+        # would go above the website directory.
+        relative = posixpath.normpath(
+            urllib.parse.unquote(url.path)).lstrip('/')
+        filePath = os.path.join(self._website, *(
+            leg for leg in relative.split('/') if leg != ''))
+        if os.path.isdir(filePath):
+            filePath = os.path.join(filePath, 'index.html')
+        try:
+            with open(filePath, 'rb') as file_:
+                body = file_.read()
+        except OSError:
+            raise HTTPError(404)
+        contentType = mimetypes.guess_type(filePath)[0]
+        return 200, (
+            'application/octet-stream' if contentType is None else contentType
+        ), body
+
+    def _write_response(
+        self, writer, status, body, keepAlive, contentType=None, head=False
+    ):
+        if body is None:
+            body = b''
+        elif isinstance(body, str):
+            if contentType is None:
+                contentType = 'text/plain; charset=utf-8'
+            body = body.encode('utf-8')
+        lines = [
+            'HTTP/1.1 {} {}'.format(status, HTTPStatus(status).phrase)
+            , 'Content-Length: {}'.format(len(body))
+            , 'Connection: {}'.format('keep-alive' if keepAlive else 'close')]
+        if contentType is not None:
+            lines.append('Content-Type: {}'.format(contentType))
+        lines.extend(('', ''))
+        header = '\r\n'.join(lines).encode('latin-1')
+        writer.write(header if head else header + body)
@@ -12,6 +12,12 @@ if __name__ == '__main__':
 
 # Standard library imports, in alphabetic order.
 #
+# Modules for the WebSocket handshake.
+# https://docs.python.org/3/library/base64.html
+# https://docs.python.org/3/library/hashlib.html
+import base64
+import hashlib
+#
 # Module for command line switches.
 # https://docs.python.org/3/library/argparse.html
 # The import isn't needed because this class uses the base class to get an
@@ -51,6 +57,18 @@ import os.path
 # writing.
 from socketserver import ThreadingMixIn
 #
+# Module for the queue of connections waiting for a worker thread.
+# https://docs.python.org/3/library/queue.html
+import queue
+#
+# Module for shutting down connections that are being kept alive.
+# https://docs.python.org/3/library/socket.html
+import socket
+#
+# Module for packing and unpacking WebSocket frame headers.
+# https://docs.python.org/3/library/struct.html
+import struct
+#
 # Module for starting a Thread.
 # https://docs.python.org/3/library/threading.html
 import threading
@@ -72,18 +90,38 @@ from . import rest
 from path_store.blender_game_engine.gameobjectcollection import (
     GameObjectDict, GameObjectList)
 #
+# Path store REST module, for copying values from the generic store, and for
+# the changes between snapshots.
+from path_store.rest import generic_changes, generic_copy
+#
 # Path store utility.
-from path_store.pathstore import pathify_split, walk as pathstore_walk
+from path_store.pathstore import (
+    CompiledPath, get as pathstore_get, has_selector, walk as pathstore_walk)
 
 class Application(rest.Application):
     
+    _batchPath = CompiledPath(('_batch',))
+    _locksPath = CompiledPath(('_locks',))
+    _eventsPath = CompiledPath(('_events',))
+    _socketPath = CompiledPath(('_socket',))
+    _appliedPath = CompiledPath(('_applied',))
+    _metricsPath = CompiledPath(('_metrics',))
+    #
+    # Seconds after which an idle event stream gets a comment line, so that the
+    # client and any proxies know the connection is alive.
+    _eventsKeepAlive = 1.0
+    _restCommands = ('DELETE', 'GET', 'PATCH', 'PUT')
+    #
+    # JSON responses are written in chunks of about this many characters.
+    _jsonChunkSize = 16384
+    _jsonEncoder = json.JSONEncoder()
+
     @property
     def url(self):
         return self._url
     
     def _http_server(self):
-        while not self.terminating():
-            self._httpServer.handle_request()
+        self._httpServer.serve_forever(self._httpServer.timeout)
 
     def _point_maker(self, path, index, point):
         if (
@@ -99,6 +137,9 @@ class Application(rest.Application):
     
     def game_initialise(self):
         super().game_initialise()
+        self._eventFeed = EventFeed()
+        self._streams = 0
+        self._streamsLock = threading.Lock()
         
         self._base_point_maker = self._restInterface.point_maker
         self._restInterface.point_maker = self._point_maker
@@ -112,11 +153,19 @@ class Application(rest.Application):
         # Change to the website directory so that the HTTP handler can be a
         # subclass of SimpleHTTPRequestHandler.
         chdir(website)
-        #
+        self._start_server()
+
+    def _start_server(self):
         # Create the server object and open a port. Don't service any requests
-        # here. That will happen on the http_server thread.
-        self._httpServer = HTTPServer(
-            ("localhost", self.arguments.port), Handler)
+        # here. That will happen on the http_server thread. Override to serve
+        # HTTP in some other way. The url property must be set here.
+        if self.arguments.workers > 0:
+            self._httpServer = PooledHTTPServer(
+                ("localhost", self.arguments.port), KeepAliveHandler
+                , self.arguments.workers)
+        else:
+            self._httpServer = HTTPServer(
+                ("localhost", self.arguments.port), Handler)
         #
         # Seems necessary to set a timeout in the HTTP server to avoid the
         # request thread hanging.
@@ -139,14 +188,16 @@ class Application(rest.Application):
 
     def game_terminate(self):
         log(INFO, 'Closing HTTP server ...')
-        self._httpServer.server_close()
+        self._stop_server()
         log(INFO, 'HTTP server shut down.')
         super().game_terminate()
 
-    def dont_join_reason(self, thread):
-        if thread.name == 'http_server':
-            return "HTTP server thread, which might be hung."
-        return super().dont_join_reason(thread)
+    def _stop_server(self):
+        # Override if _start_server() is overridden. Stop the serve_forever()
+        # loop, which waits for the loop to finish, so that the http_server
+        # thread can be joined.
+        self._httpServer.shutdown()
+        self._httpServer.server_close()
 
     # Override.
     def get_argument_parser(self):
@@ -162,7 +213,26 @@ class Application(rest.Application):
             ' directory. Default is to go up two levels from where this file'
             ' is located, then down into the user_interface/demonstration/'
             ' sub-directory.')
+        parser.add_argument(
+            '--workers', type=int, default=8, help=
+            'Number of worker threads that handle HTTP connections. Connections'
+            ' are kept alive, with HTTP/1.1. Zero means to start a new thread'
+            ' for every request, with HTTP/1.0 and no keep-alive. Default: 8.')
+        parser.add_argument(
+            '--deferWrites', action='store_true', help=
+            'Queue PUT, PATCH, and DELETE requests, and batches that write, and'
+            ' apply them all at the start of the next tick, instead of applying'
+            ' each one straight away on its HTTP thread. The response is sent'
+            ' when the write has been applied, or straight away with the'
+            ' sequence number of the write if the query string has wait=false.')
         return parser
+
+    def _query_flag(self, url, name, default):
+        # Get a true or false parameter from the query string of a URL.
+        values = urllib.parse.parse_qs(url.query).get(name)
+        if values is None:
+            return default
+        return values[-1].lower() not in ('false', '0', 'no')
     
     def rest_api(self, httpHandler):
         try:
@@ -176,118 +246,750 @@ class Application(rest.Application):
     def _inner_rest_api(self, httpHandler):
         url = urllib.parse.urlsplit(httpHandler.path)
         if url.path == '/api':
-            path = list()
+            path = CompiledPath()
         elif url.path.startswith('/api/'):
-            path = list(pathify_split(url.path, skip=1))
+            # Unquote so that selector legs, like [name="value"], can be used.
+            path = CompiledPath.split(urllib.parse.unquote(url.path), skip=1)
         else:
             path = None
 
         if path is None:
             return url
         
-        with self.mainLock:
-            command = httpHandler.command.upper()
-            if command == 'DELETE':
-                try:
-                    deleted = self._restInterface.rest_delete(path)
-                    sendError = None
-                except KeyError as error:
-                    sendError = 404
-
-                if sendError is None:
-                    #
-                    # If a game object collection is deleted, delete all its
-                    # members. This will cause the endObject() method to be
-                    # called on each member, so the BGE objects actually get
-                    # deleted. It might be safe to delete in-walk but just in
-                    # case, this code does it in two steps. Only handles lists
-                    # right now.
-                    collections = []
-                    def end_object(point, path, results):
-                        if isinstance(point, GameObjectList):
-                            results.append(point)
-                    pathstore_walk(
-                        deleted, end_object, None, collections, None, True)
-                    log(DEBUG, 'Deleting {} {} {}.'
-                        , type(deleted), isinstance(deleted, GameObjectList)
-                        , len(collections))
-                    for collection in collections:
-                        del collection[:]
-    
-                    httpHandler.send_response(200)
-                    httpHandler.end_headers()
+        command = httpHandler.command.upper()
+        if command == 'POST' and path == self._batchPath:
+            self._batch_rest_api(httpHandler)
+            return None
+        if command == 'GET' and path == self._eventsPath:
+            self._events_rest_api(httpHandler, url)
+            return None
+        if command == 'GET' and path == self._socketPath:
+            self._socket_rest_api(httpHandler)
+            return None
+        if command == 'GET' and path == self._locksPath:
+            # Lock contention counters, see PathLocks.contention.
+            self._send_json(httpHandler, self.pathLocks.contention)
+            return None
+        if command == 'GET' and path == self._appliedPath:
+            # Sequence numbers of the deferred writes, see --deferWrites.
+            self._send_json(httpHandler, self._applied_generic())
+            return None
+        if command == 'GET' and path == self._metricsPath:
+            # Percentiles of the tick phase durations, see tickTimings.
+            self._send_json(httpHandler, self.tickTimings.summary())
+            return None
+        if command not in self._restCommands:
+            return url
+        #
+        # Read any content before acquiring the lock, so that the tick isn't
+        # held up by a slow client.
+        content = (
+            self._read_content(httpHandler)
+            if command == 'PUT' or command == 'PATCH' else None)
+
+        #
+        # A GET response is serialised from a snapshot of the generic store,
+        # after the lock has been released, unless the query string has
+        # snapshot=false. In that case, it is encoded straight from the generic
+        # store, while the lock is held, which saves the copy. Either way, it is
+        # sent after the lock has been released.
+        snapshot = self._query_flag(url, 'snapshot', True)
+        #
+        # In deferred-write mode, writes are applied at the start of the next
+        # tick instead.
+        if command != 'GET' and self.arguments.deferWrites:
+            def respond(status):
+                if status == 200:
+                    httpHandler.send_empty_response(200)
                 else:
-                    httpHandler.send_error(sendError)
+                    httpHandler.send_error(status)
+            self._defer(
+                httpHandler, url
+                , lambda: self._rest_operation(command, path, content)[0]
+                , respond)
+            return None
+        #
+        # The tick publishes a snapshot when anything has changed, if a GET
+        # has asked for one since the last. If the structure of the store
+        # hasn't changed since, and the path is in the snapshot, the response
+        # can be served from it without taking any lock. Otherwise, for example
+        # straight after a PUT, for a path that hasn't been got before, or on
+        # the first GET after a tick with no readers, fall through to the
+        # locked code.
+        if command == 'GET' and snapshot:
+            found, generic = self._published_get(path)
+            if found:
+                self._send_json(httpHandler, generic)
+                return None
+
+        #
+        # A GET only read locks its path, so GETs can run at the same time as
+        # each other. They can also run at the same time as the tick, unless the
+        # tick is changing the same subtree.
+        lock = (
+            self.pathLocks.read(path, owner='rest') if command == 'GET'
+            else self.pathLocks.write(path, owner='rest'))
+        with lock:
+            status, generic = self._rest_operation(command, path, content)
+
+            if command == 'GET' and status == 200:
+                # Other GETs can be changing the generic store, so hold its
+                # lock while reading from it.
+                with self._restInterface.genericLock:
+                    if snapshot:
+                        generic = generic_copy(generic)
+                    else:
+                        encoded = self._jsonEncoder.encode(generic)
+
+        if status != 200:
+            httpHandler.send_error(status)
+        elif command != 'GET':
+            httpHandler.send_empty_response(200)
+        elif snapshot:
+            self._send_json(httpHandler, generic)
+        else:
+            self._send_encoded(httpHandler, encoded)
+
+        return None
+
+    def _applied_generic(self):
+        return {
+            'queued': self.tickCallsQueued, 'applied': self.tickCallsApplied}
+
+    def _defer(self, httpHandler, url, function, respond):
+        # Queue a function to be called at the start of the next tick. If the
+        # query string has wait=false, respond straight away with the sequence
+        # number, which the client can compare with the applied number from GET
+        # /api/_applied. Otherwise, wait for the function to be called, then
+        # pass its return value to respond.
+        call = DeferredCall(function)
+        sequence = self.call_in_tick(call)
+        if not self._query_flag(url, 'wait', True):
+            self._send_json(httpHandler, {'sequence': sequence}, 202)
+            return
+        if not call.wait(self.terminating, self._eventsKeepAlive):
+            httpHandler.send_error(503, "Terminating.")
+        elif call.error is not None:
+            httpHandler.send_error(500)
+        else:
+            respond(call.result)
+
+    def _published_get(self, path):
+        # Get a value from the published snapshot, without taking any lock.
+        # Returns a tuple of whether the value was found, and the value. It
+        # isn't found if the structure of the store has changed since the
+        # snapshot was published, or if the path has a selector. It also isn't
+        # found if the snapshot isn't current, in which case the next tick
+        # publishes one.
+        published = self.published_snapshot()
+        if (
+            published is None
+            or published.version != self._restInterface.version
+            or has_selector(path)
+        ):
+            return False, None
+        try:
+            return True, published.get(path)
+        except (IndexError, KeyError, TypeError):
+            return False, None
+
+    def _events_rest_api(self, httpHandler, url):
+        '''\
+        Handle GET /api/_events?path=root/gameObjects&path=..., which is a
+        stream of server-sent events. There can be any number of path
+        parameters. The default is the whole store. The first event has the
+        current value at each path. After that, there is an event for each tick
+        in which anything under the paths changed. Every event has JSON data
+        like:
+        
+            {"changes": [
+                {"path": ["root", "gameObjects", 0, "worldPosition"],
+                 "value": [1.0, 2.0, 0.0]},
+                {"path": ["root", "gameObjects", 1], "deleted": true}
+            ]}
+        
+        A client that falls behind gets the whole value at each of its paths
+        again, instead of the changes that it missed.
+        
+        Each stream holds an HTTP worker thread, so the number of streams is
+        limited to one less than the number of workers.
+        '''
+        try:
+            paths = tuple(
+                CompiledPath.split(joined) for joined in urllib.parse.parse_qs(
+                    url.query).get('path', ('',)))
+            for path in paths:
+                if has_selector(path):
+                    raise ValueError("Selector paths can't be watched.")
+        except ValueError as error:
+            httpHandler.send_error(400, str(error))
+            return
+        if not self._acquire_stream():
+            httpHandler.send_error(503, "Too many streams.")
+            return
+        #
+        # Subscribe before getting the current values, so that no changes are
+        # missed in between.
+        subscription = self._eventFeed.subscribe(paths)
+        try:
+            changes = self._current_changes(paths)
+            httpHandler.send_response(200)
+            httpHandler.send_header('Content-Type', 'text/event-stream')
+            httpHandler.send_header('Cache-Control', 'no-cache')
+            httpHandler.send_header('Connection', 'close')
+            httpHandler.close_connection = True
+            httpHandler.end_headers()
+            httpHandler.wfile.write(EventFeed.Event(changes).data())
 
-            elif command == 'GET':
+            while not self.terminating():
                 try:
-                    generic = self._restInterface.get_generic(path)
-                    sendError = None
-                except IndexError:
-                    # This error would occur if a list or tuple was shorter than
-                    # the requested index.
-                    sendError = 404
-                except KeyError:
-                    sendError = 404
-                
-                if sendError is not None:
-                    # Path isn't in the generic object. See if it is in the
-                    # principal. This has the side effect of adding the path to
-                    # the generic.
-                    try:
-                        self._restInterface.rest_get(path)
-                        generic = self._restInterface.get_generic(path)
-                        sendError = None
-                    except IndexError:
-                        pass
-                    except KeyError:
-                        pass
-
-                if sendError is None:
-                    gameObject = self._restInterface.rest_get((
-                        'root', 'gameObjects', 0))
-                    print('_inner_rest_api', gameObject.rotation)
-                    
-                    response = bytes(json.dumps(generic), 'utf-8')
-                    httpHandler.send_response(200)
-                    httpHandler.send_header(
-                        'Content-Type', 'application/json; charset=utf-8')
-                    httpHandler.send_header(
-                        'Content-Length', '{}'.format(len(response)))
-                    httpHandler.end_headers()
-                    httpHandler.wfile.write(response)
-                else:
-                    httpHandler.send_error(sendError)
+                    event = subscription.queue.get(
+                        timeout=self._eventsKeepAlive)
+                    data = event.data()
+                except queue.Empty:
+                    data = b': keep-alive\n\n'
+                httpHandler.wfile.write(data)
+                httpHandler.wfile.flush()
+        except OSError as error:
+            # The client went away, or the server is being shut down.
+            log(DEBUG, 'Event stream closed. {}', error)
+        finally:
+            self._eventFeed.unsubscribe(subscription)
+            self._release_stream()
 
-            elif command == 'PUT' or command == 'PATCH':
-                contentLengthHeader = httpHandler.headers.get('Content-Length')
-                if contentLengthHeader is None:
-                    contentLength = 0
-                else:
-                    contentLength = int(contentLengthHeader)
-                if contentLength > 0:
-                    contentJSON = (
-                        httpHandler.rfile.read(contentLength).decode('utf-8'))
-                else:
-                    contentJSON = None
-                if contentJSON is None:
-                    content = None
-                else:
-                    content = json.loads(contentJSON)
+    def _acquire_stream(self):
+        # Event streams and WebSockets each hold an HTTP worker thread for as
+        # long as they are open. Leave at least one worker for other requests.
+        with self._streamsLock:
+            if (
+                self.arguments.workers > 0
+                and self._streams >= self.arguments.workers - 1
+            ):
+                return False
+            self._streams += 1
+            return True
 
-                # print('_inner_rest_api {} Content-Length"{}"{}.\n{}\n{}'.format(
-                #     command
-                #     , contentLengthHeader, contentLength, contentJSON, content))
-                if command == 'PUT':
-                    self._restInterface.rest_put(content, path)
-                else:
-                    self._restInterface.rest_patch(content, path)
-                httpHandler.send_response(200)
-                httpHandler.end_headers()
+    def _release_stream(self):
+        with self._streamsLock:
+            self._streams -= 1
+
+    def _current_changes(self, paths):
+        # Get the current values at some paths, in the format of the changes in
+        # an EventFeed.Event. Paths that aren't in the store are skipped.
+        changes = []
+        for path in paths:
+            with self.pathLocks.read(path, owner='rest'):
+                status, generic = self._rest_operation('GET', path, None)
+                if status == 200:
+                    with self._restInterface.genericLock:
+                        changes.append({
+                            'path': list(path), 'value': generic_copy(generic)})
+        return changes
+
+    def _socket_rest_api(self, httpHandler):
+        '''\
+        Handle GET /api/_socket, which upgrades the connection to a WebSocket.
+        Every message is a JSON object. Messages from the client can be REST
+        operations, in the same format as the operations in a batch, with an id
+        added, like:
+        
+            {"id": 1, "method": "PUT", "path": "root/a", "value": 1}
+        
+        Each operation gets a response message with the same id, like:
+        
+            {"id": 1, "status": 200}
+            {"id": 2, "status": 200, "value": 1}
+            {"id": 3, "status": 400, "error": "Unsupported method \"POST\"."}
+        
+        The client can send any number of messages without waiting for their
+        responses. Operations that have already arrived together are applied
+        under one acquisition of the pathLocks, in the same way as a batch
+        without rollback, and their responses are sent together.
+        
+        A message can also be a WATCH, which replaces the set of watched paths.
+        
+            {"id": 4, "method": "WATCH", "paths": ["root/gameObjects"]}
+        
+        After its response, the socket gets the current values, then the
+        changes in each tick, in the same messages as the data of the events
+        from GET /api/_events. A WATCH with no paths stops the changes.
+        '''
+        headers = httpHandler.headers
+        key = headers.get('Sec-WebSocket-Key')
+        if (
+            headers.get('Upgrade', '').lower() != 'websocket'
+            or 'upgrade' not in headers.get('Connection', '').lower()
+            or key is None
+        ):
+            httpHandler.send_error(400, "WebSocket upgrade required.")
+            return
+        if headers.get('Sec-WebSocket-Version') != '13':
+            httpHandler.send_response(426)
+            httpHandler.send_header('Sec-WebSocket-Version', '13')
+            httpHandler.send_header('Content-Length', '0')
+            httpHandler.end_headers()
+            return
+        if not self._acquire_stream():
+            httpHandler.send_error(503, "Too many streams.")
+            return
+
+        watcher = None
+        try:
+            # Browsers only accept the upgrade in an HTTP/1.1 response.
+            httpHandler.protocol_version = 'HTTP/1.1'
+            httpHandler.send_response(101)
+            httpHandler.send_header('Upgrade', 'websocket')
+            httpHandler.send_header('Connection', 'Upgrade')
+            httpHandler.send_header(
+                'Sec-WebSocket-Accept', WebSocket.accept_key(key))
+            httpHandler.end_headers()
+            httpHandler.wfile.flush()
+            httpHandler.close_connection = True
+
+            httpHandler.connection.settimeout(self._eventsKeepAlive)
+            webSocket = WebSocket(httpHandler.connection)
+            while not self.terminating():
+                messages = webSocket.receive()
+                if messages is None:
+                    break
+                if len(messages) > 0:
+                    watcher = self._socket_messages(
+                        webSocket, messages, watcher)
             else:
-                return url
+                webSocket.close(1001)
+        except OSError as error:
+            # The client went away, or the server is being shut down.
+            log(DEBUG, 'WebSocket closed. {}', error)
+        finally:
+            if watcher is not None:
+                watcher.stop()
+            self._release_stream()
 
-        return None
+    def _socket_messages(self, webSocket, messages, watcher):
+        # Handle the messages received together on a WebSocket. Returns the
+        # SocketWatcher for the watched paths, which could be None. Responses
+        # are collected as JSON text.
+        responses = []
+        operations = []
+        ids = []
+
+        def apply():
+            # Apply the operations collected so far, like a batch.
+            if len(operations) == 0:
+                return
+            paths = [path for command, path, content in operations]
+            lock = (
+                self.pathLocks.read(*paths, owner='rest')
+                if all(command == 'GET'
+                       for command, path, content in operations)
+                else self.pathLocks.write(*paths, owner='rest'))
+            with lock:
+                results, rolledBack = self._rest_batch(operations, False)
+            for id, result in zip(ids, results):
+                result['id'] = id
+                responses.append(json.dumps(result))
+            del operations[:]
+            del ids[:]
+
+        for message in messages:
+            id = None
+            try:
+                message = json.loads(message)
+                id = message.get('id')
+                if str(message.get('method')).upper() == 'WATCH':
+                    # Operations before the WATCH are applied first, so that the
+                    # current values include them.
+                    apply()
+                    paths = tuple(
+                        CompiledPath.split(path) if isinstance(path, str)
+                        else CompiledPath(path)
+                        for path in message.get('paths', ()))
+                    for path in paths:
+                        if has_selector(path):
+                            raise ValueError("Selector paths can't be watched.")
+                    if watcher is not None:
+                        watcher.stop()
+                        watcher = None
+                    responses.append(json.dumps({'id': id, 'status': 200}))
+                    if len(paths) > 0:
+                        subscription = self._eventFeed.subscribe(paths)
+                        watcher = SocketWatcher(
+                            self._eventFeed, subscription, webSocket
+                            , self._eventsKeepAlive)
+                        responses.append(EventFeed.Event(
+                            self._current_changes(paths)).text())
+                        # Send the responses so far before starting the
+                        # watcher, so that the current values come before any
+                        # changes.
+                        webSocket.send(*responses)
+                        del responses[:]
+                        watcher.start()
+                    continue
+                operations.append(self._batch_operation(message))
+                ids.append(id)
+            except (AttributeError, KeyError, TypeError, ValueError) as error:
+                apply()
+                responses.append(json.dumps(
+                    {'id': id, 'status': 400, 'error': str(error)}))
+        apply()
+        if len(responses) > 0:
+            webSocket.send(*responses)
+        return watcher
+
+    # Override.
+    def snapshot_wanted(self):
+        return super().snapshot_wanted() or self._eventFeed.subscribers > 0
+
+    # Override.
+    def snapshot_published(self, previous, snapshot):
+        super().snapshot_published(previous, snapshot)
+        self._eventFeed.publish(previous, snapshot)
+
+    def _read_content(self, httpHandler):
+        contentLengthHeader = httpHandler.headers.get('Content-Length')
+        if contentLengthHeader is None:
+            contentLength = 0
+        else:
+            contentLength = int(contentLengthHeader)
+        if contentLength > 0:
+            contentJSON = (
+                httpHandler.rfile.read(contentLength).decode('utf-8'))
+        else:
+            contentJSON = None
+        if contentJSON is None:
+            content = None
+        else:
+            content = json.loads(contentJSON)
+        # print('_read_content Content-Length"{}"{}.\n{}\n{}'.format(
+        #     contentLengthHeader, contentLength, contentJSON, content))
+        return content
+
+    def _send_encoded(self, httpHandler, encoded, status=200):
+        # Send a JSON response that has already been encoded to a string, with a
+        # Content-Length header.
+        response = bytes(encoded, 'utf-8')
+        httpHandler.send_response(status)
+        httpHandler.send_header(
+            'Content-Type', 'application/json; charset=utf-8')
+        httpHandler.send_header('Content-Length', '{}'.format(len(response)))
+        httpHandler.end_headers()
+        httpHandler.wfile.write(response)
+
+    def _send_json(self, httpHandler, value, status=200):
+        '''\
+        Send value as a JSON response, which is encoded incrementally. A small
+        response is sent with a Content-Length header. A response that is larger
+        than the chunk size is written as it is encoded, using chunked transfer
+        encoding if the connection is HTTP/1.1, or by closing the connection at
+        the end otherwise.
+        '''
+        encoded = self._jsonEncoder.iterencode(value)
+        buffer = []
+        size = 0
+        for chunk in encoded:
+            buffer.append(chunk)
+            size += len(chunk)
+            if size >= self._jsonChunkSize:
+                break
+        else:
+            self._send_encoded(httpHandler, ''.join(buffer), status)
+            return
+
+        chunked = (
+            httpHandler.protocol_version == 'HTTP/1.1'
+            and httpHandler.request_version == 'HTTP/1.1')
+        httpHandler.send_response(status)
+        httpHandler.send_header(
+            'Content-Type', 'application/json; charset=utf-8')
+        if chunked:
+            httpHandler.send_header('Transfer-Encoding', 'chunked')
+        else:
+            httpHandler.send_header('Connection', 'close')
+            httpHandler.close_connection = True
+        httpHandler.end_headers()
+
+        def write(text):
+            data = bytes(text, 'utf-8')
+            if chunked:
+                httpHandler.wfile.write(b''.join((
+                    '{:X}\r\n'.format(len(data)).encode('ascii'), data
+                    , b'\r\n')))
+            else:
+                httpHandler.wfile.write(data)
+
+        write(''.join(buffer))
+        buffer = []
+        size = 0
+        for chunk in encoded:
+            buffer.append(chunk)
+            size += len(chunk)
+            if size >= self._jsonChunkSize:
+                write(''.join(buffer))
+                buffer = []
+                size = 0
+        if size > 0:
+            write(''.join(buffer))
+        if chunked:
+            httpHandler.wfile.write(b'0\r\n\r\n')
+
+    def _rest_operation(self, command, path, content):
+        '''\
+        Apply one REST operation to the rest interface. Call only after locking
+        the path in pathLocks, read for a GET, or write otherwise. Returns a
+        tuple of:
+        
+        -   HTTP status code.
+        -   Generic value, for a successful GET, or None otherwise.
+        '''
+        if command == 'DELETE':
+            try:
+                deleted = self._restInterface.rest_delete(path)
+            except KeyError as error:
+                return 404, None
+            if isinstance(deleted, Exception):
+                # The holder of the point exists, but the point doesn't, in
+                # which case the path store returns the error instead of raising
+                # it.
+                return 404, None
+            #
+            # If a game object collection is deleted, delete all its members.
+            # This will cause the endObject() method to be called on each
+            # member, so the BGE objects actually get deleted. It might be safe
+            # to delete in-walk but just in case, this code does it in two
+            # steps. Only handles lists right now.
+            collections = []
+            def end_object(point, path, results):
+                if isinstance(point, GameObjectList):
+                    results.append(point)
+            pathstore_walk(deleted, end_object, None, collections, None, True)
+            log(DEBUG, 'Deleting {} {} {}.'
+                , type(deleted), isinstance(deleted, GameObjectList)
+                , len(collections))
+            for collection in collections:
+                del collection[:]
+            return 200, None
+
+        if command == 'GET' and has_selector(path):
+            # Selector paths get an array of the matched paths and values. An
+            # empty array means that nothing matched, which isn't an error.
+            return 200, [
+                {'path': list(selected), 'value': generic}
+                for selected, generic in self._restInterface.select_generic(
+                    path)]
+
+        if command == 'GET':
+            try:
+                return 200, self._restInterface.get_generic(path)
+            except IndexError:
+                # This error would occur if a list or tuple was shorter than
+                # the requested index.
+                pass
+            except KeyError:
+                pass
+            #
+            # Path isn't in the generic object. See if it is in the principal.
+            # This has the side effect of adding the path to the generic.
+            try:
+                self._restInterface.rest_get(path)
+                return 200, self._restInterface.get_generic(path)
+            except IndexError:
+                pass
+            except KeyError:
+                pass
+            return 404, None
+
+        if command == 'PUT':
+            self._restInterface.rest_put(content, path)
+        else:
+            self._restInterface.rest_patch(content, path)
+        return 200, None
+
+    def _batch_rest_api(self, httpHandler):
+        '''\
+        Handle POST /api/_batch, which has JSON content like:
+        
+            {
+                "rollback": true,
+                "operations": [
+                    {"method": "PUT", "path": "root/a", "value": 1},
+                    {"method": "PATCH", "path": ["root", "b"], "value": {}},
+                    {"method": "DELETE", "path": "root/c/0"},
+                    {"method": "GET", "path": "root/a"}
+                ]
+            }
+        
+        The content can also be just the array of operations, in which case
+        rollback is false. The operations are applied in order, under one
+        acquisition of the pathLocks for all their paths. The response is JSON
+        like:
+        
+            {
+                "rolledBack": false,
+                "results": [
+                    {"status": 200}, {"status": 200}, {"status": 404},
+                    {"status": 200, "value": 1}
+                ]
+            }
+        
+        Without rollback, every operation is attempted. With rollback, the
+        first failure stops the batch, and the operations already applied are
+        undone, in reverse order. Operations that weren't attempted get status
+        424. Undoing puts back the points that were replaced, and inserts back
+        the points that were deleted. Game objects that were ended by a DELETE
+        can't be brought back though.
+        '''
+        try:
+            operations, rollback = self._batch_content(
+                self._read_content(httpHandler))
+        except (AttributeError, KeyError, TypeError, ValueError) as error:
+            log(INFO, 'Bad batch request. {}', error)
+            httpHandler.send_error(400, str(error))
+            return
+
+        reads = all(command == 'GET' for command, path, content in operations)
+        if self.arguments.deferWrites and not reads:
+            def respond(result):
+                results, rolledBack = result
+                self._send_json(
+                    httpHandler, {'rolledBack': rolledBack, 'results': results})
+            self._defer(
+                httpHandler, urllib.parse.urlsplit(httpHandler.path)
+                , lambda: self._rest_batch(operations, rollback), respond)
+            return
+
+        paths = [path for command, path, content in operations]
+        lock = (
+            self.pathLocks.read(*paths, owner='rest') if reads
+            else self.pathLocks.write(*paths, owner='rest'))
+        with lock:
+            results, rolledBack = self._rest_batch(operations, rollback)
+        
+        self._send_json(
+            httpHandler, {'rolledBack': rolledBack, 'results': results})
+
+    def _batch_content(self, content):
+        # Parse the content of a batch request. Returns a tuple of the list of
+        # operations and the rollback flag.
+        if isinstance(content, dict):
+            rollback = bool(content.get('rollback', False))
+            content = content.get('operations')
+        else:
+            rollback = False
+        if not isinstance(content, list):
+            raise ValueError("Operations must be an array.")
+        return [
+            self._batch_operation(operation) for operation in content
+        ], rollback
+
+    def _batch_operation(self, operation):
+        # Parse one operation in a batch, or in a WebSocket message. Returns a
+        # tuple of command, path, and content.
+        command = operation['method'].upper()
+        if command not in self._restCommands:
+            raise ValueError('Unsupported method "{}".'.format(command))
+        path = operation.get('path')
+        path = (
+            CompiledPath.split(path) if isinstance(path, str)
+            else CompiledPath(path))
+        return command, path, operation.get('value')
+
+    def _rest_batch(self, operations, rollback):
+        # Call only after locking all the paths. Returns a tuple of the list of
+        # results and whether the batch was rolled back.
+        results = []
+        #
+        # Journal of subroutines that undo the operations applied so far.
+        journal = []
+        for command, path, content in operations:
+            try:
+                if rollback:
+                    self._journal_operation(command, path, content, journal)
+                status, generic = self._rest_operation(command, path, content)
+            except Exception as error:
+                log(ERROR, 'Exception in batch {} {}. {}'
+                    , command, path, error)
+                status, generic = 500, None
+
+            result = {'status': status}
+            if command == 'GET' and status == 200:
+                # The results are serialised after the lock is released, so
+                # take a snapshot.
+                with self._restInterface.genericLock:
+                    result['value'] = generic_copy(generic)
+            results.append(result)
+
+            if rollback and status != 200:
+                break
+
+        if not (rollback and len(results) > 0 and results[-1]['status'] != 200):
+            return results, False
+
+        for undo in reversed(journal):
+            try:
+                undo()
+            except Exception as error:
+                log(ERROR, 'Exception undoing batch. {}', error)
+        results.extend(
+            {'status': 424} for index in range(len(operations) - len(results)))
+        return results, True
+
+    def _journal_operation(self, command, path, content, journal):
+        # Append subroutines to the journal that will undo an operation, based
+        # on the current state of the store.
+        restInterface = self._restInterface
+        if command == 'GET':
+            return
+        if has_selector(path):
+            # Journal in the order that rest_delete() or the other operation
+            # will apply to the selected points, so that undo is in reverse.
+            selections = restInterface.rest_select(path)
+            if command == 'DELETE':
+                selections.reverse()
+            for selected, point in selections:
+                self._journal_operation(command, selected, content, journal)
+            return
+        if command == 'DELETE':
+            try:
+                point = pathstore_get(restInterface.principal, path)
+            except (IndexError, KeyError, TypeError):
+                # Deletion will fail, and there will be nothing to undo.
+                return
+            if len(path) > 0 and isinstance(path[-1], int):
+                journal.append(lambda: restInterface.rest_insert(point, path))
+            else:
+                journal.append(lambda: restInterface.rest_put(point, path))
+            return
+        #
+        # PUT or PATCH. Points are read from the principal directly, because
+        # rest_get() would add the path to the generic store.
+        #
+        # A PATCH merges dictionaries and lists item by item, so
+        # it can be undone item by item. Anything else is replaced, and so can
+        # be undone by putting back what was there before.
+        try:
+            point = pathstore_get(restInterface.principal, path)
+            exists = True
+        except (IndexError, KeyError, TypeError):
+            point = None
+            exists = False
+
+        if exists and command == 'PATCH' and point is not None:
+            if isinstance(content, dict):
+                legs = content.keys()
+            elif isinstance(content, list):
+                legs = range(len(content))
+            else:
+                legs = None
+            if legs is not None:
+                for leg in legs:
+                    self._journal_operation(
+                        command, path + (leg,), content[leg], journal)
+                return
+
+        if exists:
+            journal.append(lambda: restInterface.rest_put(point, path))
+        else:
+            journal.append(lambda: restInterface.rest_delete(path))
 
 # HTTP Server subclass. This class holds a reference to the Application object
 # so that any handlers that are spawned have a route to it.
@@ -299,7 +1001,472 @@ class HTTPServer(ThreadingMixIn, HTTPServer):
     def application(self, application):
         self._application = application
     
+# HTTP Server subclass that handles connections on a fixed number of worker
+# threads, instead of a new thread for each request. Connections that are kept
+# alive stay on their worker until the client closes them, they time out, or the
+# server is closed.
+class PooledHTTPServer(HTTPServer):
+    #
+    # Seconds for which the accept loop waits for a worker before checking
+    # whether the server is shutting down.
+    _putTimeout = 0.5
+
+    @property
+    def workers(self):
+        return len(self._workers)
+
+    # Override.
+    def process_request(self, request, client_address):
+        # If all the workers are busy, this blocks the accept loop, and further
+        # connections wait in the listen backlog. The wait is a series of
+        # timeouts, so that a shutdown isn't held up by a full queue.
+        while True:
+            try:
+                self._connections.put(
+                    (request, client_address), timeout=self._putTimeout)
+                return
+            except queue.Full:
+                if self._closing:
+                    self.shutdown_request(request)
+                    return
+
+    def _worker(self):
+        while True:
+            connection = self._connections.get()
+            if connection is None:
+                return
+            request, client_address = connection
+            #
+            # Check for closing under the same lock as adding to the active
+            # set, so that a connection can't start being served after the
+            # active connections have been shut down.
+            with self._activeLock:
+                closing = self._closing
+                if not closing:
+                    self._active.add(request)
+            if closing:
+                self.shutdown_request(request)
+                continue
+            try:
+                self.finish_request(request, client_address)
+            except Exception:
+                self.handle_error(request, client_address)
+            finally:
+                with self._activeLock:
+                    self._active.discard(request)
+                self.shutdown_request(request)
+
+    def _close_connections(self):
+        # Stop serving new connections, and shut down any connections that are
+        # being kept alive, so that their workers see the end of the stream and
+        # finish.
+        with self._activeLock:
+            self._closing = True
+            for request in self._active:
+                try:
+                    request.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+
+    # Override.
+    def shutdown(self):
+        # Close the connections first, otherwise the serve_forever() loop could
+        # be waiting for a worker, which could be waiting for a kept-alive
+        # connection to time out.
+        self._close_connections()
+        super().shutdown()
+
+    # Override.
+    def server_close(self):
+        super().server_close()
+        self._close_connections()
+        for worker in self._workers:
+            self._connections.put(None)
+        for worker in self._workers:
+            worker.join(1.0)
+            if worker.is_alive():
+                log(WARNING, 'HTTP worker "{}" didn\'t finish.', worker.name)
+
+    def __init__(self, server_address, RequestHandlerClass, workers):
+        super().__init__(server_address, RequestHandlerClass)
+        self._connections = queue.Queue(workers)
+        self._active = set()
+        self._activeLock = threading.Lock()
+        self._closing = False
+        self._workers = [
+            threading.Thread(
+                target=self._worker, name="http_worker_{}".format(index))
+            for index in range(workers)]
+        for worker in self._workers:
+            worker.start()
+
+# Feed of the changes in each tick, for the GET /api/_events endpoint. The
+# changes are found on the tick thread, once for each path that is watched, and
+# then shared by all the subscriptions that watch the path. Each event is
+# encoded as JSON once, by whichever HTTP worker sends it first.
+class EventFeed(object):
+    class Event(object):
+        def text(self):
+            # JSON of the event.
+            if self._text is None:
+                self._text = json.dumps({'changes': self._changes})
+            return self._text
+
+        def data(self):
+            # Server-sent event, with the JSON as its data.
+            if self._data is None:
+                self._data = b''.join((
+                    b'data: ', self.text().encode('utf-8'), b'\n\n'))
+            return self._data
+
+        def __init__(self, changes):
+            self._changes = changes
+            self._text = None
+            self._data = None
+
+    class Subscription(object):
+        def __init__(self, paths, size):
+            self.paths = paths
+            self.queue = queue.Queue(size)
+            self.resync = False
+
+    # Maximum number of events waiting to be sent to one subscription.
+    _queueSize = 8
+    _missing = object()
+
+    @property
+    def subscribers(self):
+        return len(self._subscriptions)
+
+    def subscribe(self, paths):
+        subscription = self.Subscription(paths, self._queueSize)
+        with self._lock:
+            # Replace the list instead of changing it, so that publish() can
+            # iterate it without holding the lock.
+            self._subscriptions = self._subscriptions + [subscription]
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            self._subscriptions = [
+                other for other in self._subscriptions
+                if other is not subscription]
+
+    def _get(self, snapshot, path):
+        try:
+            return snapshot.get(path)
+        except (IndexError, KeyError, TypeError):
+            return self._missing
+
+    def _changes(self, previous, snapshot, path):
+        # If there's no previous snapshot, the whole value is sent, or a
+        # deletion if there is no value.
+        new = self._get(snapshot, path)
+        if previous is None:
+            old = None if new is self._missing else self._missing
+        else:
+            old = self._get(previous, path)
+        if new is self._missing:
+            if old is self._missing:
+                return []
+            return [{'path': list(path), 'deleted': True}]
+        if old is self._missing:
+            return [{'path': list(path), 'value': new}]
+        return [
+            {'path': list(changed), 'deleted': True} if deleted
+            else {'path': list(changed), 'value': value}
+            for changed, deleted, value in generic_changes(old, new, path)]
+
+    def publish(self, previous, snapshot):
+        subscriptions = self._subscriptions
+        if len(subscriptions) == 0:
+            return
+        #
+        # Events by path, for changes, and for whole values.
+        events = {}
+        wholes = {}
+        for subscription in subscriptions:
+            if subscription.resync:
+                changes = []
+                for path in subscription.paths:
+                    if path not in wholes:
+                        wholes[path] = self._changes(None, snapshot, path)
+                    changes.extend(wholes[path])
+            else:
+                changes = []
+                for path in subscription.paths:
+                    if path not in events:
+                        events[path] = self._changes(previous, snapshot, path)
+                    changes.extend(events[path])
+                if len(changes) == 0:
+                    continue
+            try:
+                subscription.queue.put_nowait(self.Event(changes))
+                subscription.resync = False
+            except queue.Full:
+                subscription.resync = True
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscriptions = []
+
+# Function queued by call_in_tick(), for an HTTP thread that waits for its
+# return value.
+class DeferredCall(object):
+    def __call__(self):
+        try:
+            self.result = self._function()
+        except Exception as error:
+            log(ERROR, 'Exception in deferred call. {}', error)
+            print_exc()
+            self.error = error
+        finally:
+            self._done.set()
+
+    def wait(self, terminating, interval):
+        # Wait for the call, checking every interval seconds whether the
+        # application is terminating. Queued calls are made when it terminates,
+        # so wait one more interval for that, then give up. Returns whether the
+        # call happened.
+        while not self._done.wait(interval):
+            if terminating():
+                return self._done.wait(interval)
+        return True
+
+    def __init__(self, function):
+        self._function = function
+        self._done = threading.Event()
+        self.result = None
+        self.error = None
+
+# Server side of a WebSocket connection, see RFC 6455.
+# https://tools.ietf.org/html/rfc6455
+# Reads from the socket directly, instead of from the rfile of the request
+# handler, so that all the messages that have arrived can be returned together.
+# Sending can be done from any thread.
+class WebSocket(object):
+    _GUID = b'258EAFA5-E914-47DA-95CA-C5AB0DC85B11'
+    #
+    # Opcodes.
+    CONTINUATION = 0x0
+    TEXT = 0x1
+    BINARY = 0x2
+    CLOSE = 0x8
+    PING = 0x9
+    PONG = 0xA
+    #
+    # Largest message that will be received, in bytes.
+    maxMessage = 1 << 24
+    _receiveSize = 65536
+
+    class _ProtocolError(Exception):
+        def __init__(self, code, message):
+            super().__init__(message)
+            self.code = code
+
+    @classmethod
+    def accept_key(cls, key):
+        '''Value of the Sec-WebSocket-Accept header for a handshake.'''
+        return base64.b64encode(hashlib.sha1(
+            key.strip().encode('ascii') + cls._GUID).digest()).decode('ascii')
+
+    @staticmethod
+    def _unmask(payload, mask):
+        # XOR the whole payload with the repeated mask in one operation, which
+        # is much quicker than a loop over the bytes.
+        length = len(payload)
+        if length == 0:
+            return payload
+        repeated = (mask * (length // 4 + 1))[:length]
+        return (
+            int.from_bytes(payload, 'big') ^ int.from_bytes(repeated, 'big')
+        ).to_bytes(length, 'big')
+
+    @staticmethod
+    def _frame(opcode, payload):
+        length = len(payload)
+        if length < 126:
+            header = struct.pack('!BB', 0x80 | opcode, length)
+        elif length < 1 << 16:
+            header = struct.pack('!BBH', 0x80 | opcode, 126, length)
+        else:
+            header = struct.pack('!BBQ', 0x80 | opcode, 127, length)
+        return header + payload
+
+    @property
+    def closed(self):
+        return self._closed
+
+    def send(self, *texts):
+        '''\
+        Send any number of text messages, in one write to the socket.
+        '''
+        data = b''.join(
+            self._frame(self.TEXT, text.encode('utf-8')) for text in texts)
+        with self._sendLock:
+            self._socket.sendall(data)
+
+    def close(self, code=1000):
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            with self._sendLock:
+                self._socket.sendall(
+                    self._frame(self.CLOSE, struct.pack('!H', code)))
+        except OSError:
+            pass
+
+    def receive(self):
+        '''\
+        Wait for data, then return a list of the text messages that it
+        completed, which can be empty, for example if the socket timed out.
+        Returns None if the connection has been closed. Control frames are
+        handled here.
+        '''
+        if self._closed:
+            return None
+        try:
+            data = self._socket.recv(self._receiveSize)
+        except socket.timeout:
+            return []
+        if len(data) == 0:
+            self._closed = True
+            return None
+        self._buffer.extend(data)
+
+        messages = []
+        try:
+            while True:
+                frame = self._parse()
+                if frame is None:
+                    break
+                fin, opcode, payload = frame
+                if opcode == self.CLOSE:
+                    self.close(
+                        struct.unpack('!H', payload[:2])[0]
+                        if len(payload) >= 2 else 1000)
+                    return messages if len(messages) > 0 else None
+                if opcode == self.PING:
+                    with self._sendLock:
+                        self._socket.sendall(self._frame(self.PONG, payload))
+                    continue
+                if opcode == self.PONG:
+                    continue
+                if opcode == self.CONTINUATION:
+                    if self._fragments is None:
+                        raise self._ProtocolError(
+                            1002, "Continuation without a message.")
+                elif opcode == self.TEXT:
+                    if self._fragments is not None:
+                        raise self._ProtocolError(
+                            1002, "Message interrupted by another.")
+                    self._fragments = []
+                    self._fragmentsSize = 0
+                else:
+                    raise self._ProtocolError(
+                        1003, "Only text messages are supported.")
+                self._fragments.append(payload)
+                self._fragmentsSize += len(payload)
+                if self._fragmentsSize > self.maxMessage:
+                    raise self._ProtocolError(1009, "Message too big.")
+                if fin:
+                    messages.append(b''.join(self._fragments).decode('utf-8'))
+                    self._fragments = None
+        except self._ProtocolError as error:
+            log(INFO, 'WebSocket protocol error. {}', error)
+            self.close(error.code)
+            return None
+        except UnicodeDecodeError as error:
+            log(INFO, 'WebSocket message isn\'t UTF-8. {}', error)
+            self.close(1007)
+            return None
+        return messages
+
+    def _parse(self):
+        # Parse one frame from the start of the buffer, and remove it. Returns a
+        # tuple of the FIN flag, the opcode, and the unmasked payload, or None
+        # if the buffer doesn't have a whole frame yet.
+        buffer = self._buffer
+        if len(buffer) < 2:
+            return None
+        first, second = buffer[0], buffer[1]
+        if not second & 0x80:
+            raise self._ProtocolError(1002, "Client frames must be masked.")
+        length = second & 0x7F
+        offset = 2
+        if length == 126:
+            if len(buffer) < 4:
+                return None
+            length = struct.unpack_from('!H', buffer, 2)[0]
+            offset = 4
+        elif length == 127:
+            if len(buffer) < 10:
+                return None
+            length = struct.unpack_from('!Q', buffer, 2)[0]
+            offset = 10
+        if length > self.maxMessage:
+            raise self._ProtocolError(1009, "Message too big.")
+        end = offset + 4 + length
+        if len(buffer) < end:
+            return None
+        mask = bytes(buffer[offset:offset + 4])
+        payload = self._unmask(bytes(buffer[offset + 4:end]), mask)
+        del buffer[:end]
+        return bool(first & 0x80), first & 0x0F, payload
+
+    def __init__(self, socket_):
+        self._socket = socket_
+        self._sendLock = threading.Lock()
+        self._buffer = bytearray()
+        self._fragments = None
+        self._fragmentsSize = 0
+        self._closed = False
+
+# Sends the events of an EventFeed subscription to a WebSocket, on a thread of
+# its own, so that the connection's worker thread can wait for messages.
+class SocketWatcher(object):
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stopped = True
+        self._feed.unsubscribe(self._subscription)
+        if self._thread.is_alive():
+            self._thread.join()
+
+    def _run(self):
+        while not (self._stopped or self._webSocket.closed):
+            try:
+                event = self._subscription.queue.get(timeout=self._timeout)
+            except queue.Empty:
+                continue
+            try:
+                self._webSocket.send(event.text())
+            except OSError as error:
+                log(DEBUG, 'WebSocket watcher stopped. {}', error)
+                return
+
+    def __init__(self, feed, subscription, webSocket, timeout):
+        self._feed = feed
+        self._subscription = subscription
+        self._webSocket = webSocket
+        self._timeout = timeout
+        self._stopped = False
+        self._thread = threading.Thread(
+            target=self._run, name="websocket_watcher")
+
 class Handler(SimpleHTTPRequestHandler):
+    def send_empty_response(self, code):
+        """\
+        Send a response with no body. The Content-Length header is needed for
+        the client to know that the response has ended, if the connection is
+        being kept alive.
+        """
+        self.send_response(code)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
     def do_DELETE(self):
         if self.server.application.rest_api(self) is None:
             return
@@ -315,7 +1482,20 @@ class Handler(SimpleHTTPRequestHandler):
             return
         super().do_PATCH()
 
+    def do_POST(self):
+        if self.server.application.rest_api(self) is None:
+            return
+        # The base class has no POST handler.
+        self.send_error(501)
+
     def do_PUT(self):
         if self.server.application.rest_api(self) is None:
             return
         super().do_PUT()
+
+class KeepAliveHandler(Handler):
+    protocol_version = 'HTTP/1.1'
+    #
+    # Time out idle connections, so that a client that keeps connections open
+    # can't hold on to all the worker threads.
+    timeout = 5.0
@@ -18,6 +18,27 @@ if __name__ == '__main__':
 # object.
 # import argparse
 #
+# Module for levelled logging messages.
+# Tutorial is here: https://docs.python.org/3/howto/logging.html
+# Reference is here: https://docs.python.org/3/library/logging.html
+from logging import ERROR, log
+#
+# Module for the queue of calls to be run on the tick thread.
+# https://docs.python.org/3/library/queue.html
+import queue
+#
+# Module for the Lock that keeps the tick call sequence numbers in order.
+# https://docs.python.org/3/library/threading.html
+import threading
+#
+# Module for perf_counter_ns, which times the tick phases.
+# https://docs.python.org/3/library/time.html
+import time
+#
+# Module for pretty printing exceptions.
+# https://docs.python.org/3/library/traceback.html#traceback-examples
+from traceback import print_exc
+#
 # Local imports.
 #
 # Application base class module.
@@ -31,13 +52,44 @@ from path_store.blender_game_engine.gameobject import \
 #
 # RESTful interface base class and Animation subclass for pathstore.
 from path_store.rest import AnimatedRestInterface
+#
+# Locks for parts of the path store.
+from path_store.locking import PathLocks
 
 class Application(thread.Application):
-    
+
+    # Override.
+    # The calls phase is the functions queued by call_in_tick(). The lock phase
+    # is all the waiting for path locks, and checking that they cover the
+    # animation targets. The animate phase is the set_now_times() walk, and the
+    # completions phase is the processing of the animations that completed,
+    # including print_completions_log(). The update phase is the cursor and
+    # physics update walk, and the snapshot phase is publishing the generic
+    # snapshot, including snapshot_published().
+    tickPhases = (
+        'calls', 'lock', 'animate', 'completions', 'update', 'snapshot')
+
     @property
     def Camera(self):
         return self._Camera
 
+    @property
+    def pathLocks(self):
+        """\
+        PathLocks instance for the path store, with subtrees for the animations
+        and the game objects. The tick write locks the subtrees that its
+        animations change. REST operations lock only the paths that they access.
+        """
+        return self._pathLocks
+
+    # Override.
+    @property
+    def mainLock(self):
+        # Holding the main lock is the same as write locking the whole path
+        # store, so that code that uses the main lock excludes the tick and all
+        # REST operations, as it always has.
+        return self._pathLocks.storeLock
+
     # Override.
     def game_add_object(self, objectName):
         object_ = self._GameObject(super().game_add_object(objectName))
@@ -79,37 +131,230 @@ class Application(thread.Application):
         self._emptyName = 'empty'
 
         self._restInterface = AnimatedRestInterface()
+        self._pathLocks = PathLocks((
+            self._restInterface.animationPath
+            , self._restInterface.gameObjectPath))
+        self._tickPaths = (
+            self._restInterface.animationPath
+            , self._restInterface.gameObjectPath)
+        self._tickVersion = None
+        self._snapshotWanted = False
+        self._snapshotCurrent = False
+        self._tickCalls = queue.Queue()
+        self._tickCallsLock = threading.Lock()
+        self._tickCallsQueued = 0
+        self._tickCallsApplied = 0
 
         self._GameObject = get_game_object_subclass(self.bge)
         self._Camera = get_camera_subclass(self.bge, self._GameObject)
         self._GameText = get_game_text_subclass(self.bge, self._GameObject)
 
+    @property
+    def tickCallsQueued(self):
+        '''Sequence number of the last function queued by call_in_tick().'''
+        return self._tickCallsQueued
+
+    @property
+    def tickCallsApplied(self):
+        '''\
+        Sequence number of the last function queued by call_in_tick() that has
+        been called.
+        '''
+        return self._tickCallsApplied
+
+    def call_in_tick(self, function):
+        '''\
+        Queue a function to be called on the tick thread, at the start of the
+        next tick, with the whole path store write locked. The function is
+        called with no parameters, and its return value is discarded. Can be
+        called from any thread. All the functions queued before a tick are
+        called in order, under one acquisition of the lock.
+        
+        Functions that are still queued when the application terminates are
+        called then, after the last tick.
+        
+        Returns the sequence number of the function, which can be compared with
+        tickCallsApplied.
+        '''
+        with self._tickCallsLock:
+            self._tickCallsQueued += 1
+            sequence = self._tickCallsQueued
+            self._tickCalls.put((sequence, function))
+        return sequence
+
+    def _run_tick_calls(self):
+        if self._tickCalls.empty():
+            return
+        timings = self.tickTimings
+        waited = time.perf_counter_ns()
+        with self._pathLocks.write((), owner='tick'):
+            acquired = time.perf_counter_ns()
+            timings.record('lock', acquired - waited)
+            self._call_queued()
+            timings.record('calls', time.perf_counter_ns() - acquired)
+
+    def _call_queued(self):
+        # Call only after write locking the whole store.
+        while True:
+            try:
+                sequence, function = self._tickCalls.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                function()
+            except Exception:
+                # Functions are expected to handle their own errors, so just log
+                # this one and carry on with the rest.
+                log(ERROR, 'Exception in tick call {}.', function)
+                print_exc()
+            self._tickCallsApplied = sequence
+
+    # Override.
+    def game_terminate_lock(self):
+        super().game_terminate_lock()
+        #
+        # No more ticks will run. Call the functions that are still queued, so
+        # that writes that were accepted aren't lost, and anything waiting for
+        # one of them is released.
+        with self._pathLocks.write((), owner='tick'):
+            self._call_queued()
+
     # Override.
     def game_tick_run(self):
         # Formally, call the base class although it is a pass.
         super().game_tick_run()
-        with self.mainLock:
-            # Call the shortcut to set current time into all the current
-            # animations, which makes them animate in the scene.
-            self.print_completions_log(
-                *self._restInterface.set_now_times(self.tickPerf))
-            #
-            # Update all cursors, by updating all physics objects.
-            try:
-                walk = (self._restInterface.rest_get(self.gameObjectPath)
-                        is not None)
-            except KeyError:
-                walk = False
-            if walk:
-                def update(point, path, results):
-                    if point is not None:
-                        point.update()
-                self._restInterface.rest_walk(update, self.gameObjectPath)
+        self._run_tick_calls()
+        timings = self.tickTimings
+        paths = self._tickPaths
+        while True:
+            waited = time.perf_counter_ns()
+            with self._pathLocks.write(*paths, owner='tick'):
+                if self._restInterface.version != self._tickVersion:
+                    # The structure of the store has changed since the last
+                    # tick, so there could be animations with new targets.
+                    # Check that the locks that are held cover them.
+                    self._tickPaths = self._tick_paths(
+                        self._restInterface.animation_targets())
+                    if not self._pathLocks.covers(paths, self._tickPaths):
+                        paths = self._tickPaths
+                        timings.record('lock', time.perf_counter_ns() - waited)
+                        continue
+                timings.record('lock', time.perf_counter_ns() - waited)
+                self._tick_locked()
+                self._tickVersion = self._restInterface.version
+                break
+        #
+        # Publish a snapshot of the generic store, from which GET requests can
+        # be served without taking any lock, until the next tick. Read locking
+        # the whole store waits for any REST writes to finish, so that the
+        # snapshot is consistent. If nothing has changed since the last
+        # snapshot, it is left in place and neither the lock nor the publish is
+        # needed. A REST write that is under way now will leave the interface
+        # stale, so its changes get published by a later tick.
+        #
+        # If something has changed but nothing wants the snapshot, it isn't
+        # published either. The one in place is withdrawn instead, so that
+        # readers don't get values that are out of date, and the next reader
+        # causes the following tick to publish.
+        waited = time.perf_counter_ns()
+        if not self._restInterface.snapshotStale:
+            timings.record('snapshot', time.perf_counter_ns() - waited)
+            return
+        if not self.snapshot_wanted():
+            self._snapshotCurrent = False
+            timings.record('snapshot', time.perf_counter_ns() - waited)
+            return
+        with self._pathLocks.read((), owner='tick'):
+            acquired = time.perf_counter_ns()
+            timings.record('lock', acquired - waited)
+            self._snapshotWanted = False
+            previous = self._restInterface.snapshot
+            snapshot = self._restInterface.publish_snapshot()
+            self._snapshotCurrent = True
+        self.snapshot_published(previous, snapshot)
+        timings.record('snapshot', time.perf_counter_ns() - acquired)
+
+    def published_snapshot(self):
+        '''\
+        Get the GenericSnapshot that the tick published, if it is current, or
+        None. It is current if nothing has changed since it was published,
+        other than in the tick that is running now, if any. Getting None means
+        that the next tick will publish a snapshot. Can be called from any
+        thread, without holding any lock.
+        '''
+        if self._snapshotCurrent:
+            return self._restInterface.snapshot
+        self._snapshotWanted = True
+        return None
+
+    def snapshot_wanted(self):
+        '''\
+        Called by the tick when something has changed since the last snapshot,
+        to check whether to publish a new one. Override to return True if there
+        is something that uses snapshot_published(). The base class returns
+        whether published_snapshot() has returned None since the last snapshot.
+        '''
+        return self._snapshotWanted
+
+    def snapshot_published(self, previous, snapshot):
+        '''\
+        Called after a GenericSnapshot has been published, without any lock
+        held. A tick in which nothing changed doesn't publish, and doesn't call
+        this, and nor does a tick in which snapshot_wanted() returns False. The
+        previous snapshot is passed too, or None for the first one. Override to
+        do something with the changes, for example by calling
+        path_store.rest.generic_changes(). The base class does nothing.
+        '''
+        pass
+
+    def _tick_paths(self, targets):
+        # Get the paths that the tick has to write lock, given the targets of
+        # the animations. There will be at most one path that isn't in a
+        # subtree, because write locking it locks the whole store.
+        paths = [
+            self._restInterface.animationPath
+            , self._restInterface.gameObjectPath]
+        for target in targets:
+            if not self._pathLocks.covers(paths, (target,)):
+                paths.append(target)
+        return tuple(paths)
+
+    def _tick_locked(self):
+        # Call only after acquiring write locks on the _tickPaths.
+        #
+        # Call the shortcut to set current time into all the current
+        # animations, which makes them animate in the scene.
+        timings = self.tickTimings
+        start = time.perf_counter_ns()
+        completions = self._restInterface.set_now_times(self.tickPerf)
+        animated = time.perf_counter_ns()
+        self.print_completions_log(*completions)
+        completed = time.perf_counter_ns()
+        completionsNs = self._restInterface.completionsNs
+        timings.record('animate', animated - start - completionsNs)
+        timings.record('completions', completed - animated + completionsNs)
+        #
+        # Update all cursors, by updating all physics objects.
+        try:
+            walk = (self._restInterface.rest_get(self.gameObjectPath)
+                    is not None)
+        except KeyError:
+            walk = False
+        if walk:
+            def update(point, path, results):
+                if point is not None:
+                    point.update()
+            self._restInterface.rest_walk(update, self.gameObjectPath)
+        timings.record('update', time.perf_counter_ns() - completed)
 
     def print_completions_log(self, anyCompletions, logStore):
         '''\
         Called every tick and passed the AnimatedRestInterface.set_now_times
         return value. Override if the application requires these results for any
         reason. See the unittest application for an example.
+        
+        The logStore is a CompletionsReport. Iterating it is cheap. Its tree is
+        only built when it is converted to a string or its tree property is
+        accessed, which should be done here.
         '''
         pass
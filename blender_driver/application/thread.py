@@ -39,6 +39,9 @@ from traceback import print_exc
 #
 # Application base class module.
 from . import base
+#
+# Ring buffers for the durations of the tick phases.
+from blender_driver.timingutils import TickTimings
 
 class Application(base.Application):
     
@@ -61,6 +64,42 @@ class Application(base.Application):
         """Number of ticks skipped, reset every time a tick isn't skipped."""
         return self._skippedTicks
     
+    @property
+    def tickPolicy(self):
+        """\
+        What happens to a tick that arrives while the tick worker is busy. One
+        of the following.
+        
+        -   "skip", the tick is skipped.
+        -   "queue", the tick is queued, and run when the worker finishes. If a
+            tick is queued already, the new tick is skipped instead.
+        -   "latest", like "queue" except that, if a tick is queued already, the
+            queued tick is skipped and the new tick is queued instead.
+        
+        A skipped tick is counted in skippedTicks, and tick_skipped() is called,
+        on the main thread. For a queued tick, tickPerf is the time that it
+        arrived, instead of the time that it started running.
+        """
+        return self.arguments.tickPolicy
+
+    tickPhases = ()
+    """\
+    Names of the phases of game_tick_run() that are timed by the class, in
+    order. A subclass that times some phases itself overrides this, and records
+    each phase in tickTimings. Whatever time isn't in a phase is recorded as the
+    user phase.
+    """
+
+    @property
+    def tickTimings(self):
+        """\
+        TickTimings instance with the durations of the phases of the most
+        recent ticks. The phases are latency, which is from when the tick
+        arrived until game_tick_run() starts, run, which is all of
+        game_tick_run(), then the tickPhases, then user.
+        """
+        return self._tickTimings
+
     @property
     def tickPerf(self):
         """
@@ -82,12 +121,27 @@ class Application(base.Application):
         self._terminateLock = threading.Lock()
         self._mainLock = threading.Lock()
         self._tickLock = threading.Lock()
+        self._tickRaiseLock = threading.Lock()
         self._tickRaise = None
         self._skippedTicks = 0
+        self._tickTimings = TickTimings(
+            ('latency', 'run') + self.tickPhases + ('user',)
+            , self.arguments.tickMetrics)
         #
         # Reference time for when the game engine was started.
         self._gameInitialisePerf = time.perf_counter()
         self._tickPerf = 0.0
+        #
+        # The tick worker thread waits on the condition for a tick to be
+        # signalled, by setting _tickPending to the perf_counter() time at which
+        # the tick arrived.
+        self._tickCondition = threading.Condition()
+        self._tickPending = None
+        self._tickBusy = False
+        self._tickStop = False
+        self._tickWorker = threading.Thread(
+            target=self._tick_worker, name="game_tick")
+        self._tickWorker.start()
 
     # Override.
     def game_tick(self):
@@ -99,17 +153,54 @@ class Application(base.Application):
         # If a previous _run_with_tick_lock raised an exception, raise it now,
         # on the main thread so that the whole thing terminates.
         if self._tickRaise is not None:
-            with self._tickLock:
+            with self._tickRaiseLock:
                 exception = self._tickRaise
                 self._tickRaise = None
+            if exception is not None:
                 raise exception
 
-        threading.Thread(
-            target=self._run_with_tick_lock, name="game_tick"
-        ).start()
+        arrived = time.perf_counter()
+        skip = False
+        with self._tickCondition:
+            if self._tickStop:
+                return
+            if not self._tickBusy and self._tickPending is None:
+                self._tickPending = arrived
+                self._tickCondition.notify()
+            elif self.tickPolicy == 'skip':
+                skip = True
+            elif self._tickPending is None:
+                self._tickPending = arrived
+            elif self.tickPolicy == 'latest':
+                self._tickPending = arrived
+                skip = True
+            else:
+                skip = True
+
+        if skip:
+            self._skip_tick()
+
+    def _tick_worker(self):
+        while True:
+            with self._tickCondition:
+                while self._tickPending is None and not self._tickStop:
+                    self._tickCondition.wait()
+                if self._tickStop:
+                    return
+                arrived = self._tickPending
+                self._tickPending = None
+                self._tickBusy = True
+            try:
+                self._run_with_tick_lock(arrived)
+            finally:
+                with self._tickCondition:
+                    self._tickBusy = False
 
-    def _run_with_tick_lock(self):
-        if self._tickLock.acquire(False):
+    def _run_with_tick_lock(self, arrived):
+        # The tick lock is only ever acquired here, by the tick worker, so it
+        # can't fail to be acquired. It is kept for subclasses and test code
+        # that check for a tick in progress.
+        with self._tickLock:
             try:
                 self._skippedTicks = 0
                 with self.mainLock:
@@ -119,30 +210,43 @@ class Application(base.Application):
                     #
                     # Reference time for this tick.
                     self._tickPerf = (
-                        time.perf_counter() - self._gameInitialisePerf)
-                self.game_tick_run()
-            except Exception as exception:
-                # Catch the exception here and put it into a shared place.
-                # (It's OK while this code has acquired tickLock.) This thread
-                # can then be allowed to finish. The exception will be raised in
-                # the next tick, see game_tick, above.
-                self._tickRaise = exception
-            except:
-                self._tickRaise = Exception(
-                    "Non-Exception raised in _run_with_tick_lock")
-            finally:
-                self._tickLock.release()
-        else:
-            try:
-                self._skippedTicks += 1
-                self.tick_skipped()
+                        (time.perf_counter() if self.tickPolicy == 'skip'
+                         else arrived)
+                        - self._gameInitialisePerf)
+                timings = self._tickTimings
+                timings.begin(self._tickPerf)
+                timings.record(
+                    'latency', int((time.perf_counter() - arrived) * 1e9))
+                start = time.perf_counter_ns()
+                try:
+                    self.game_tick_run()
+                finally:
+                    run = time.perf_counter_ns() - start
+                    timings.record('run', run)
+                    timings.record(
+                        'user', run - timings.total(self.tickPhases))
             except Exception as exception:
-                with self._tickLock:
+                # Catch the exception here and put it into a shared place. The
+                # exception will be raised in the next tick, see game_tick,
+                # above.
+                with self._tickRaiseLock:
                     self._tickRaise = exception
             except:
-                with self._tickLock:
+                with self._tickRaiseLock:
                     self._tickRaise = Exception(
-                        "Non-Exception raised in tick_skipped")
+                        "Non-Exception raised in _run_with_tick_lock")
+
+    def _skip_tick(self):
+        try:
+            self._skippedTicks += 1
+            self.tick_skipped()
+        except Exception as exception:
+            with self._tickRaiseLock:
+                self._tickRaise = exception
+        except:
+            with self._tickRaiseLock:
+                self._tickRaise = Exception(
+                    "Non-Exception raised in tick_skipped")
         
     def game_tick_run(self):
         """\
@@ -155,8 +259,9 @@ class Application(base.Application):
 
     def tick_skipped(self):
         """\
-        Method that is run in a thread in every tick in which the tick lock
-        can't be acquired. Override it to print an error messsage.
+        Method that is run on the main thread in every tick that is skipped,
+        because the previous tick is still running, according to the
+        tickPolicy. Override it to print an error messsage. It should be quick.
         """
         pass
 
@@ -164,6 +269,10 @@ class Application(base.Application):
     def game_terminate(self):
         self.game_terminate_lock()
         self.game_terminate_threads()
+        if self.arguments.tickMetricsCSV is not None:
+            log(INFO, 'Writing tick metrics to "{}".'
+                , self.arguments.tickMetricsCSV)
+            self._tickTimings.write_csv(self.arguments.tickMetricsCSV)
         log(DEBUG, "Terminating game.")
         super().game_terminate()
 
@@ -171,6 +280,11 @@ class Application(base.Application):
         log(DEBUG, "Acquiring terminate lock...")
         self._terminateLock.acquire()
         log(DEBUG, "Terminate lock acquired.")
+        #
+        # Stop the tick worker, so that it can be joined.
+        with self._tickCondition:
+            self._tickStop = True
+            self._tickCondition.notify()
 
     def game_terminate_threads(self):
         log(INFO, "Number of threads: {}.", threading.active_count())
@@ -191,6 +305,28 @@ class Application(base.Application):
             else:
                 log(INFO, 'Not joining "{}". {}', thread.name, reason)
 
+    # Override.
+    def get_argument_parser(self):
+        parser = super().get_argument_parser()
+        parser.add_argument(
+            '--tickPolicy', type=str, default='skip'
+            , choices=('skip', 'queue', 'latest'), help=
+            'What happens to a tick that arrives while the previous tick is'
+            ' still running. skip: it is skipped. queue: it runs next, unless'
+            ' another tick is queued already, in which case it is skipped.'
+            ' latest: it runs next, and any other queued tick is skipped.'
+            ' Default is skip.')
+        parser.add_argument(
+            '--tickMetrics', type=int, default=1024, help=
+            'Number of ticks for which the durations of the tick phases are'
+            ' kept, for the tickTimings property. Default: 1024.')
+        parser.add_argument(
+            '--tickMetricsCSV', type=str, default=None, help=
+            'Path of a CSV file to which to write the durations of the tick'
+            ' phases, when the application terminates. Default is not to write'
+            ' them.')
+        return parser
+
     def dont_join_reason(self, thread):
         if thread is threading.main_thread():
             return "Main thread."
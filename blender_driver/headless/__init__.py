@@ -0,0 +1,51 @@
+#!/usr/bin/python
+# (c) 2018 Jim Hawkins. MIT licensed, see https://opensource.org/licenses/MIT
+# Part of Blender Driver, see https://github.com/sjjhsjjh/blender-driver
+"""\
+Headless Blender stand-in package. Has pure Python modules that stand in for
+the Blender mathutils, bge, bpy, and blf modules, so that the application tick
+path can be run, profiled, and tested without Blender. Install them before
+importing anything that imports the Blender modules, like this:
+
+    import blender_driver.headless
+    blender_driver.headless.install()
+    import blender_driver.application.rest
+
+The tick harness can be run like:
+
+    python3 -m blender_driver.headless --help
+
+Cannot be run as a program, sorry. Run the package instead, as above."""
+
+# Standard library imports, in alphabetic order.
+#
+# Module for the table of imported modules.
+# https://docs.python.org/3/library/sys.html
+import sys
+
+def install(replace=False):
+    """\
+    Install the stand-in modules as mathutils, bge, bpy, and blf, so that
+    they are imported by import statements. If there are modules with those
+    names already, for example because the code is running inside Blender, they
+    are left in place unless replace is True. Returns True if the stand-ins
+    were installed.
+    """
+    if not replace and any(
+        name in sys.modules for name in ('mathutils', 'bge', 'bpy', 'blf')
+    ):
+        return False
+    from . import bge, blf, bpy, mathutils
+    sys.modules['mathutils'] = mathutils
+    sys.modules['bge'] = bge
+    for name in ('events', 'logic', 'types'):
+        sys.modules['bge.' + name] = getattr(bge, name)
+    sys.modules['bpy'] = bpy
+    sys.modules['blf'] = blf
+    return True
+
+def reset():
+    """Discard the headless scene and Blender data, for a fresh start."""
+    from . import bge, bpy
+    bge.logic.reset()
+    bpy.reset()
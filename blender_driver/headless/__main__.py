@@ -0,0 +1,109 @@
+#!/usr/bin/python
+# (c) 2018 Jim Hawkins. MIT licensed, see https://opensource.org/licenses/MIT
+# Part of Blender Driver, see https://github.com/sjjhsjjh/blender-driver
+"""Headless tick harness script. Run like:
+
+    python3 -m blender_driver.headless --help
+"""
+
+# Standard library imports, in alphabetic order.
+#
+# Module for command line switches.
+# https://docs.python.org/3/library/argparse.html
+import argparse
+#
+# Module for JavaScript Object Notation (JSON) strings.
+# https://docs.python.org/3.5/library/json.html
+import json
+#
+# Local imports.
+#
+# Headless stand-in modules, which must be installed before the harness module
+# is imported.
+import blender_driver.headless
+blender_driver.headless.install(True)
+from blender_driver.headless import tick
+#
+# Local module for setting up Python logging.
+from blender_driver.loggingutils import initialise_logging
+
+if __name__ == '__main__':
+    argumentParser = argparse.ArgumentParser(
+        prog="python3 -m blender_driver.headless", description=
+        "Run the Blender Driver application tick on a headless scene, and"
+        " report percentiles of the tick time.")
+    argumentParser.add_argument(
+        '-n', '--objects', type=int, default=100, help=
+        "Number of game objects. Default: 100.")
+    argumentParser.add_argument(
+        '-a', '--animate', type=str, nargs='*', default=list(tick.animatable)
+        , choices=tuple(tick.animatable), help=
+        "Properties of every object to animate. Default: all.")
+    argumentParser.add_argument(
+        '--components', type=int, default=1, choices=(1, 2, 3), help=
+        "Number of components of each property to animate, each of which is"
+        " a separate animation. Default: 1.")
+    argumentParser.add_argument(
+        '--cursors', type=int, default=0, help=
+        "Number of cursors, on the first objects. Default: 0.")
+    argumentParser.add_argument(
+        '--cameras', type=int, default=0, help=
+        "Number of cameras, each tracking a cursor. Default: 0.")
+    argumentParser.add_argument(
+        '--batch', action='store_true', help=
+        "Evaluate the animations in NumPy batches.")
+    argumentParser.add_argument(
+        '--reader', action='store_true', help=
+        "Read the published snapshot every tick, like a client that sends a"
+        " GET every tick. Without this, no snapshot is published.")
+    argumentParser.add_argument(
+        '-t', '--ticks', type=int, default=300, help=
+        "Number of ticks to time. Default: 300.")
+    argumentParser.add_argument(
+        '-w', '--warmup', type=int, default=10, help=
+        "Number of ticks to run, untimed, first. Default: 10.")
+    argumentParser.add_argument(
+        '-r', '--rate', type=float, default=60.0, help=
+        "Ticks per second. Default: 60.")
+    argumentParser.add_argument(
+        '--realtime', action='store_true', help=
+        "Signal ticks by the wall clock, instead of simulating the time.")
+    argumentParser.add_argument(
+        '--tickPolicy', type=str, default='skip'
+        , choices=('skip', 'queue', 'latest'), help=
+        "Tick policy of the application, which only makes a difference with"
+        " --realtime. Default: skip.")
+    argumentParser.add_argument(
+        '-o', '--output', type=str, help=
+        "Path of a JSON file to which to write the summary.")
+    argumentParser.add_argument(
+        '-v', '--verbose', action='store_true', help="Verbose logging.")
+    arguments = argumentParser.parse_args()
+    initialise_logging(arguments.verbose)
+
+    summary = tick.run(
+        ticks=arguments.ticks, rate=arguments.rate
+        , realtime=arguments.realtime, warmup=arguments.warmup
+        , tickPolicy=arguments.tickPolicy, reader=arguments.reader
+        , objects=arguments.objects
+        , animate=arguments.animate, components=arguments.components
+        , cursors=arguments.cursors, cameras=arguments.cameras
+        , batch=arguments.batch)
+
+    print("{} ticks, {} skipped, {} over the {:.3f} ms budget.".format(
+        summary['ticks'], summary['skipped'], summary['overruns']
+        , summary['budget'] * 1e3))
+    for statistic in ('mean', 'p50', 'p95', 'p99', 'max'):
+        print("{:<5} {:>10.3f} ms".format(statistic, summary[statistic] * 1e3))
+    print()
+    print("{:<12}{}".format("phase ms", "".join(
+        "{:>10}".format(statistic)
+        for statistic in ('mean', 'p50', 'p95', 'p99', 'max'))))
+    for phase, statistics in summary['phases'].items():
+        if statistics['count'] > 0:
+            print("{:<12}{}".format(phase, "".join(
+                "{:>10.3f}".format(statistics[statistic])
+                for statistic in ('mean', 'p50', 'p95', 'p99', 'max'))))
+    if arguments.output is not None:
+        with open(arguments.output, 'w') as file_:
+            json.dump(summary, file_, indent=2, sort_keys=True)
@@ -0,0 +1,14 @@
+#!/usr/bin/python
+# (c) 2018 Jim Hawkins. MIT licensed, see https://opensource.org/licenses/MIT
+# Part of Blender Driver, see https://github.com/sjjhsjjh/blender-driver
+"""Headless stand-in for the Blender Game Engine bge module.
+
+Install it with blender_driver.headless.install() instead of importing it.
+
+Cannot be run as a program, sorry."""
+# Exit if run other than as a module.
+if __name__ == '__main__':
+    print(__doc__)
+    raise SystemExit(1)
+
+from . import events, logic, types
@@ -0,0 +1,27 @@
+#!/usr/bin/python
+# (c) 2018 Jim Hawkins. MIT licensed, see https://opensource.org/licenses/MIT
+# Part of Blender Driver, see https://github.com/sjjhsjjh/blender-driver
+"""Headless stand-in for the Blender Game Engine bge.events module. Only has
+the modifier keys that Blender Driver checks for, and EventToCharacter.
+https://docs.blender.org/api/blender_python_api_current/bge.events.html
+
+Cannot be run as a program, sorry."""
+# Exit if run other than as a module.
+if __name__ == '__main__':
+    print(__doc__)
+    raise SystemExit(1)
+
+LEFTCTRLKEY = 124
+LEFTALTKEY = 125
+RIGHTALTKEY = 126
+RIGHTCTRLKEY = 127
+RIGHTSHIFTKEY = 128
+LEFTSHIFTKEY = 129
+
+def EventToCharacter(event, shift):
+    # Key events in the headless engine are character codes.
+    if event in (LEFTCTRLKEY, LEFTALTKEY, RIGHTALTKEY, RIGHTCTRLKEY
+                 , RIGHTSHIFTKEY, LEFTSHIFTKEY):
+        return ''
+    character = chr(event)
+    return character.upper() if shift else character
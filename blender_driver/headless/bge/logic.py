@@ -0,0 +1,41 @@
+#!/usr/bin/python
+# (c) 2018 Jim Hawkins. MIT licensed, see https://opensource.org/licenses/MIT
+# Part of Blender Driver, see https://github.com/sjjhsjjh/blender-driver
+"""Headless stand-in for the Blender Game Engine bge.logic module.
+https://docs.blender.org/api/blender_python_api_current/bge.logic.html
+
+Cannot be run as a program, sorry."""
+# Exit if run other than as a module.
+if __name__ == '__main__':
+    print(__doc__)
+    raise SystemExit(1)
+
+# Local imports.
+#
+# Headless Game Engine types.
+from .types import KX_Scene
+
+KX_INPUT_NONE = 0
+KX_INPUT_JUST_ACTIVATED = 1
+KX_INPUT_ACTIVE = 2
+KX_INPUT_JUST_RELEASED = 3
+
+_scene = None
+
+def getCurrentScene():
+    global _scene
+    if _scene is None:
+        _scene = KX_Scene()
+    return _scene
+
+def getSceneList():
+    return [getCurrentScene()]
+
+def endGame():
+    if _scene is not None:
+        _scene.end()
+
+def reset():
+    """Discard the current scene, so that the next one starts empty."""
+    global _scene
+    _scene = None
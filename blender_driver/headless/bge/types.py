@@ -0,0 +1,314 @@
+#!/usr/bin/python
+# (c) 2018 Jim Hawkins. MIT licensed, see https://opensource.org/licenses/MIT
+# Part of Blender Driver, see https://github.com/sjjhsjjh/blender-driver
+"""Headless stand-in for the Blender Game Engine bge.types module.
+
+Implements enough of KX_GameObject, KX_Camera, KX_FontObject, and KX_Scene to
+run the path_store.blender_game_engine classes. There is no rendering and no
+physics. Parenting moves the children when the world position or orientation of
+the parent is set, but not when its orientation Matrix is changed in place.
+https://docs.blender.org/api/blender_python_api_current/bge.types.html
+
+Cannot be run as a program, sorry."""
+# Exit if run other than as a module.
+if __name__ == '__main__':
+    print(__doc__)
+    raise SystemExit(1)
+
+# Local imports.
+#
+# Headless Blender data, for the templates of added objects.
+from .. import bpy
+#
+# Headless maths utilities.
+from ..mathutils import Euler, Matrix, Quaternion, Vector
+
+def _orientation(value):
+    # Get a 3x3 Matrix from any value that can be set as a worldOrientation.
+    if isinstance(value, (Euler, Quaternion)):
+        return value.to_matrix()
+    if isinstance(value, Matrix):
+        return value.to_3x3()
+    return Matrix(value).to_3x3()
+
+class _State(object):
+    # The game engine state of one object. When a KX_GameObject is replaced by
+    # an instance of a subclass, the state is shared, like the way that the
+    # Game Engine hands over its underlying object.
+    __slots__ = (
+        'proxy', 'name', 'scene', 'position', 'scale', 'orientation', 'parent'
+        , 'children', 'localPosition', 'localOrientation', 'suspended'
+        , 'ended')
+
+    def set_world(self, position=None, orientation=None):
+        if position is not None:
+            self.position = [float(value) for value in position]
+            if len(self.position) != 3:
+                raise ValueError('Position must have 3 items.')
+        if orientation is not None:
+            self.orientation = _orientation(orientation)
+        if self.parent is not None:
+            self.relate()
+        for child in self.children:
+            child.follow()
+
+    def relate(self):
+        # Store the position and orientation relative to the parent.
+        inverse = self.parent.orientation.transposed()
+        self.localPosition = inverse * (
+            Vector(self.position) - Vector(self.parent.position))
+        self.localOrientation = inverse * self.orientation
+
+    def follow(self):
+        # Set the position and orientation from the parent, after it moved.
+        parent = self.parent
+        self.position = (
+            Vector(parent.position) + parent.orientation * self.localPosition
+        )._values
+        self.orientation = parent.orientation * self.localOrientation
+        for child in self.children:
+            child.follow()
+
+    def __init__(self, name, scene, position, scale, orientation):
+        self.proxy = None
+        self.name = name
+        self.scene = scene
+        self.position = [float(value) for value in position]
+        self.scale = [float(value) for value in scale]
+        self.orientation = _orientation(orientation)
+        self.parent = None
+        self.children = []
+        self.localPosition = None
+        self.localOrientation = None
+        self.suspended = False
+        self.ended = False
+
+class KX_GameObject(object):
+    """\
+    Game object. Like the Game Engine, an instance can't be constructed except
+    by KX_Scene.addObject(), or by passing an existing instance to the
+    constructor of a subclass. In the second case the new instance replaces the
+    old one in the scene.
+    """
+
+    @property
+    def name(self):
+        return self._state.name
+
+    @property
+    def scene(self):
+        return self._state.scene
+
+    @property
+    def invalid(self):
+        return self._state.ended
+
+    @property
+    def worldPosition(self):
+        # Returns a read-only copy, on which setting an item raises
+        # AttributeError, like the Game Engine.
+        return Vector(self._state.position).freeze()
+    @worldPosition.setter
+    def worldPosition(self, worldPosition):
+        self._state.set_world(position=worldPosition)
+
+    @property
+    def localPosition(self):
+        state = self._state
+        if state.parent is None:
+            return Vector(state.position).freeze()
+        return state.localPosition.copy().freeze()
+
+    @property
+    def worldScale(self):
+        return Vector(self._state.scale).freeze()
+    @worldScale.setter
+    def worldScale(self, worldScale):
+        scale = [float(value) for value in worldScale]
+        if len(scale) != 3:
+            raise ValueError('Scale must have 3 items.')
+        self._state.scale = scale
+
+    @property
+    def worldOrientation(self):
+        # Returns the Matrix itself, so that it can be changed in place, like
+        # the Game Engine.
+        return self._state.orientation
+    @worldOrientation.setter
+    def worldOrientation(self, worldOrientation):
+        self._state.set_world(orientation=worldOrientation)
+
+    @property
+    def parent(self):
+        parent = self._state.parent
+        return None if parent is None else parent.proxy
+
+    @property
+    def children(self):
+        return [child.proxy for child in self._state.children]
+
+    @property
+    def childrenRecursive(self):
+        children = []
+        for child in self._state.children:
+            children.append(child.proxy)
+            children.extend(child.proxy.childrenRecursive)
+        return children
+
+    def setParent(self, parent, compound=True, ghost=True):
+        self.removeParent()
+        state = self._state
+        state.parent = parent._state
+        parent._state.children.append(state)
+        state.relate()
+
+    def removeParent(self):
+        state = self._state
+        if state.parent is not None:
+            state.parent.children.remove(state)
+            state.parent = None
+            state.localPosition = None
+            state.localOrientation = None
+
+    @property
+    def isSuspendDynamics(self):
+        return self._state.suspended
+
+    def suspendDynamics(self, ghost=False):
+        self._state.suspended = True
+
+    def restoreDynamics(self):
+        self._state.suspended = False
+
+    def endObject(self):
+        state = self._state
+        if state.ended:
+            return
+        for child in tuple(state.children):
+            child.proxy.endObject()
+        self.removeParent()
+        state.ended = True
+        state.scene._remove(state)
+
+    def getAxisVect(self, vect):
+        return self._state.orientation * Vector(vect)
+
+    def getVectTo(self, other):
+        point = (other._state.position if isinstance(other, KX_GameObject)
+                 else other)
+        world = Vector(point) - Vector(self._state.position)
+        distance = world.magnitude
+        if distance == 0.0:
+            return 0.0, Vector(), Vector()
+        world /= distance
+        local = self._state.orientation.transposed() * world
+        return distance, world, local
+
+    def getDistanceTo(self, other):
+        return self.getVectTo(other)[0]
+
+    def alignAxisToVect(self, vect, axis=2, factor=1.0):
+        # Rotate the object by the smallest rotation that takes the specified
+        # axis onto the vector, or some of the way if factor is less than one.
+        target = Vector(vect).normalized()
+        if target.length_squared == 0.0:
+            return
+        orientation = self._state.orientation
+        current = Vector([row[axis] for row in orientation])
+        rotationAxis = current.cross(target)
+        angle = current.angle(target, 0.0) * factor
+        if rotationAxis.length_squared == 0.0:
+            if current.dot(target) > 0.0:
+                return
+            # Opposite directions, so rotate half a turn about any
+            # perpendicular axis.
+            rotationAxis = current.cross(Vector(
+                (1.0, 0.0, 0.0) if abs(current[0]) < 0.9 else (0.0, 1.0, 0.0)))
+        rotated = orientation.copy()
+        rotated.rotate(Quaternion(rotationAxis, angle))
+        self.worldOrientation = rotated
+
+    def __new__(cls, *args):
+        # Subclass construction from an existing instance. The state passes to
+        # the new instance, which replaces the existing instance in the scene.
+        if len(args) < 1 or not isinstance(args[0], KX_GameObject):
+            raise TypeError(
+                '{}() expects an existing KX_GameObject.'.format(cls.__name__))
+        instance = object.__new__(cls)
+        instance._state = args[0]._state
+        instance._state.proxy = instance
+        return instance
+
+    def __init__(self, *args):
+        pass
+
+    def __repr__(self):
+        return '{}("{}")'.format(self.__class__.__name__, self._state.name)
+
+class KX_Camera(KX_GameObject):
+    lens = 35.0
+    near = 0.1
+    far = 100.0
+
+class KX_FontObject(KX_GameObject):
+    text = ''
+
+class KX_Scene(object):
+    """\
+    Scene. Objects are added from templates in the headless bpy.data.objects
+    collection, by name. The template type sets the class of the added object,
+    FONT for KX_FontObject and CAMERA for KX_Camera. The scene starts with a
+    camera, which is the active_camera.
+    """
+
+    _classes = {'FONT': KX_FontObject, 'CAMERA': KX_Camera}
+
+    @property
+    def name(self):
+        return self._name
+
+    @property
+    def objects(self):
+        return [state.proxy for state in self._states]
+
+    @property
+    def active_camera(self):
+        return self._activeCamera._state.proxy
+
+    @property
+    def ended(self):
+        return self._ended
+
+    def _create(self, class_, name, position, scale, orientation):
+        state = _State(name, self, position, scale, orientation)
+        proxy = object.__new__(class_)
+        proxy._state = state
+        state.proxy = proxy
+        self._states.append(state)
+        return proxy
+
+    def addObject(self, name, reference=None, time=0):
+        template = bpy.data.objects[name]
+        if reference is None:
+            position = template.location
+            orientation = template.rotation_euler
+        else:
+            position = reference._state.position
+            orientation = reference._state.orientation
+        return self._create(
+            self._classes.get(template.type, KX_GameObject)
+            , name, position, template.scale, orientation)
+
+    def _remove(self, state):
+        self._states.remove(state)
+
+    def end(self):
+        self._ended = True
+
+    def __init__(self, name='Scene'):
+        self._name = name
+        self._states = []
+        self._ended = False
+        self._activeCamera = self._create(
+            KX_Camera, 'Camera', (0.0, 0.0, 10.0), (1.0, 1.0, 1.0)
+            , Matrix.Identity(3))
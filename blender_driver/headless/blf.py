@@ -0,0 +1,15 @@
+#!/usr/bin/python
+# (c) 2018 Jim Hawkins. MIT licensed, see https://opensource.org/licenses/MIT
+# Part of Blender Driver, see https://github.com/sjjhsjjh/blender-driver
+"""Headless stand-in for the Blender font drawing module, blf. Only has the
+dimensions function, for a notional monospaced font.
+https://docs.blender.org/api/blender_python_api_current/blf.html
+
+Cannot be run as a program, sorry."""
+# Exit if run other than as a module.
+if __name__ == '__main__':
+    print(__doc__)
+    raise SystemExit(1)
+
+def dimensions(fontid, text):
+    return (10.0 * len(text), 10.0)
@@ -0,0 +1,56 @@
+#!/usr/bin/python
+# (c) 2018 Jim Hawkins. MIT licensed, see https://opensource.org/licenses/MIT
+# Part of Blender Driver, see https://github.com/sjjhsjjh/blender-driver
+"""Headless stand-in for the parts of the Blender bpy module that are used in
+the game context.
+
+Only bpy.data.objects is implemented. Getting an object that hasn't been added
+gets a default cube, so that an application can add game objects from templates
+without a data context. Add an object to set up a different template, for
+example:
+
+    bpy.data.objects.add('visualiser', scale=(0.1, 0.1, 0.1))
+
+Cannot be run as a program, sorry."""
+# Exit if run other than as a module.
+if __name__ == '__main__':
+    print(__doc__)
+    raise SystemExit(1)
+
+# Local imports.
+#
+# Headless maths utilities.
+from .mathutils import Euler, Vector
+
+class Object(object):
+    def __init__(self, name, type='MESH', location=(0.0, 0.0, 0.0)
+                 , rotation=(0.0, 0.0, 0.0), scale=(1.0, 1.0, 1.0)
+                 , dimensions=None):
+        self.name = name
+        self.type = type
+        self.location = Vector(location)
+        self.rotation_euler = Euler(rotation)
+        self.scale = Vector(scale)
+        # Default dimensions are those of the Blender default cube, which is
+        # two units across, at the scale.
+        self.dimensions = Vector(
+            tuple(2.0 * value for value in scale) if dimensions is None
+            else dimensions)
+
+class _Objects(dict):
+    def add(self, name, **attributes):
+        self[name] = Object(name, **attributes)
+        return self[name]
+
+    def __missing__(self, name):
+        return self.add(name)
+
+class _Data(object):
+    def __init__(self):
+        self.objects = _Objects()
+
+data = _Data()
+
+def reset():
+    """Discard all the objects."""
+    data.objects.clear()
@@ -0,0 +1,847 @@
+#!/usr/bin/python
+# (c) 2018 Jim Hawkins. MIT licensed, see https://opensource.org/licenses/MIT
+# Part of Blender Driver, see https://github.com/sjjhsjjh/blender-driver
+"""Headless stand-in for the Blender mathutils module.
+
+Implements the parts of Vector, Matrix, Quaternion, and Euler that Blender
+Driver uses, in pure Python. The semantics follow the Blender 2.7x API, which is
+the one that has the Game Engine. For example, multiplying two Vector instances
+gives their dot product, and Matrix.rotate() multiplies on the left.
+http://www.blender.org/api/blender_python_api_current/mathutils.html
+
+Install it with blender_driver.headless.install() instead of importing it.
+
+Cannot be run as a program, sorry."""
+# Exit if run other than as a module.
+if __name__ == '__main__':
+    print(__doc__)
+    raise SystemExit(1)
+
+# Standard library imports, in alphabetic order.
+#
+# Module for the trigonometry.
+# https://docs.python.org/3/library/math.html
+from math import acos, atan2, cos, hypot, sin, sqrt
+
+# Same as FLT_EPSILON in C, which Blender uses for its near-zero checks.
+_epsilon = 1.1920929e-07
+
+# Axes of each Euler order, and whether the order has odd parity. Same as the
+# rotOrders table in Blender's math_rotation.c file.
+_orders = {
+    'XYZ': ((0, 1, 2), False),
+    'XZY': ((0, 2, 1), True),
+    'YXZ': ((1, 0, 2), True),
+    'YZX': ((1, 2, 0), False),
+    'ZXY': ((2, 0, 1), False),
+    'ZYX': ((2, 1, 0), True)}
+
+_axes = {'X': (1.0, 0.0, 0.0), 'Y': (0.0, 1.0, 0.0), 'Z': (0.0, 0.0, 1.0)}
+
+def _euler_rows(angles, order):
+    # Get the rows of the 3x3 rotation matrix for an Euler. Blender's C code
+    # indexes matrices by column then row, so its mat[a][b] is rows[b][a] here.
+    (i, j, k), parity = _orders[order]
+    if parity:
+        ti, tj, th = -angles[i], -angles[j], -angles[k]
+    else:
+        ti, tj, th = angles[i], angles[j], angles[k]
+    ci, cj, ch = cos(ti), cos(tj), cos(th)
+    si, sj, sh = sin(ti), sin(tj), sin(th)
+    cc, cs, sc, ss = ci * ch, ci * sh, si * ch, si * sh
+    rows = [[0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]]
+    rows[i][i] = cj * ch
+    rows[i][j] = sj * sc - cs
+    rows[i][k] = sj * cc + ss
+    rows[j][i] = cj * sh
+    rows[j][j] = sj * ss + cc
+    rows[j][k] = sj * cs - sc
+    rows[k][i] = -sj
+    rows[k][j] = cj * si
+    rows[k][k] = cj * ci
+    return rows
+
+def _rows_euler(rows, order):
+    # Decompose a 3x3 rotation matrix into Euler angles, by choosing the
+    # smaller of the two possible solutions, like Blender's
+    # mat3_normalized_to_eulO() function.
+    (i, j, k), parity = _orders[order]
+    #
+    # Normalise the columns, in case the matrix has scale.
+    columns = []
+    for column in range(3):
+        length = sqrt(sum(rows[row][column] ** 2 for row in range(3)))
+        columns.append(1.0 if length == 0.0 else 1.0 / length)
+    rows = [[rows[row][column] * columns[column] for column in range(3)]
+            for row in range(3)]
+
+    first = [0.0, 0.0, 0.0]
+    cy = hypot(rows[i][i], rows[j][i])
+    if cy > 16.0 * _epsilon:
+        second = [0.0, 0.0, 0.0]
+        first[i] = atan2(rows[k][j], rows[k][k])
+        first[j] = atan2(-rows[k][i], cy)
+        first[k] = atan2(rows[j][i], rows[i][i])
+        second[i] = atan2(-rows[k][j], -rows[k][k])
+        second[j] = atan2(-rows[k][i], -cy)
+        second[k] = atan2(-rows[j][i], -rows[i][i])
+    else:
+        first[i] = atan2(-rows[j][k], rows[j][j])
+        first[j] = atan2(-rows[k][i], cy)
+        second = first
+    if parity:
+        first = [-angle for angle in first]
+        second = [-angle for angle in second]
+    if sum(abs(angle) for angle in first) > sum(abs(angle) for angle in second):
+        return second
+    return first
+
+def _quaternion_rows(w, x, y, z):
+    xx, yy, zz = x * x, y * y, z * z
+    xy, xz, yz = x * y, x * z, y * z
+    wx, wy, wz = w * x, w * y, w * z
+    return [
+        [1.0 - 2.0 * (yy + zz), 2.0 * (xy - wz), 2.0 * (xz + wy)],
+        [2.0 * (xy + wz), 1.0 - 2.0 * (xx + zz), 2.0 * (yz - wx)],
+        [2.0 * (xz - wy), 2.0 * (yz + wx), 1.0 - 2.0 * (xx + yy)]]
+
+def _rotation_rows(value):
+    # Get the rows of a 3x3 rotation matrix from any rotation value.
+    if isinstance(value, Matrix):
+        return [row._values[0:3] for row in value._rows[0:3]]
+    if isinstance(value, Quaternion):
+        return _quaternion_rows(*value._values)
+    if isinstance(value, Euler):
+        return _euler_rows(value._values, value._order)
+    raise TypeError(
+        'Expected a Matrix, Quaternion, or Euler, not "{}".'.format(
+            type(value).__name__))
+
+def _multiply_rows(left, right):
+    columns = range(len(right[0]))
+    return [[sum(row[index] * right[index][column]
+                  for index in range(len(row))) for column in columns]
+            for row in left]
+
+def _apply_rows(rows, values):
+    # Multiply a vector by a matrix. A 4x4 matrix can multiply a 3D vector, in
+    # which case the vector is treated as a point.
+    if len(values) == 3 and len(rows) == 4:
+        x, y, z = values
+        return [row[0] * x + row[1] * y + row[2] * z + row[3]
+                for row in rows[0:3]]
+    if len(values) != len(rows[0]):
+        raise ValueError(
+            'Matrix with {} columns and Vector of length {} cannot be'
+            ' multiplied.'.format(len(rows[0]), len(values)))
+    return [sum(row[index] * value for index, value in enumerate(values))
+            for row in rows]
+
+class Vector(object):
+    __slots__ = ('_values', '_readOnly')
+
+    @property
+    def x(self):
+        return self._values[0]
+    @x.setter
+    def x(self, x):
+        self[0] = x
+
+    @property
+    def y(self):
+        return self._values[1]
+    @y.setter
+    def y(self, y):
+        self[1] = y
+
+    @property
+    def z(self):
+        return self._values[2]
+    @z.setter
+    def z(self, z):
+        self[2] = z
+
+    @property
+    def w(self):
+        return self._values[3]
+    @w.setter
+    def w(self, w):
+        self[3] = w
+
+    @property
+    def is_frozen(self):
+        return self._readOnly
+
+    def _check_write(self):
+        # The Vector properties of a game object, like worldPosition, are
+        # read-only copies. The Game Engine raises AttributeError on an attempt
+        # to change one, and so does this class.
+        if self._readOnly:
+            raise AttributeError('Vector is read-only, cannot be modified.')
+
+    def __len__(self):
+        return len(self._values)
+
+    def __iter__(self):
+        return iter(self._values)
+
+    def __getitem__(self, specifier):
+        if isinstance(specifier, slice):
+            return tuple(self._values[specifier])
+        return self._values[specifier]
+
+    def __setitem__(self, specifier, value):
+        self._check_write()
+        if isinstance(specifier, slice):
+            values = [float(item) for item in value]
+            if len(values) != len(range(*specifier.indices(len(self._values)))):
+                raise ValueError('Vector slice assignment size mismatch.')
+            self._values[specifier] = values
+        else:
+            self._values[specifier] = float(value)
+
+    def __delitem__(self, specifier):
+        raise TypeError('Vector items cannot be deleted.')
+
+    def copy(self):
+        return Vector(self._values)
+
+    def freeze(self):
+        self._readOnly = True
+        return self
+
+    def to_tuple(self, precision=-1):
+        if precision < 0:
+            return tuple(self._values)
+        return tuple(round(value, precision) for value in self._values)
+
+    def to_2d(self):
+        return Vector(self._values[0:2])
+    def to_3d(self):
+        return Vector((self._values + [0.0])[0:3])
+    def to_4d(self):
+        if len(self._values) == 4:
+            return self.copy()
+        return Vector((self._values + [0.0])[0:3] + [1.0])
+
+    @property
+    def length_squared(self):
+        return sum(value * value for value in self._values)
+
+    @property
+    def magnitude(self):
+        return sqrt(sum(value * value for value in self._values))
+    @magnitude.setter
+    def magnitude(self, magnitude):
+        self._check_write()
+        length = self.magnitude
+        if length != 0.0:
+            self._values = [
+                value * magnitude / length for value in self._values]
+
+    length = magnitude
+
+    def normalize(self):
+        self._check_write()
+        length = self.magnitude
+        if length != 0.0:
+            self._values = [value / length for value in self._values]
+
+    def normalized(self):
+        vector = self.copy()
+        vector.normalize()
+        return vector
+
+    def resize(self, size):
+        self._check_write()
+        if size < len(self._values):
+            del self._values[size:]
+        else:
+            self._values.extend([0.0] * (size - len(self._values)))
+
+    def resized(self, size):
+        vector = self.copy()
+        vector.resize(size)
+        return vector
+
+    def zero(self):
+        self._check_write()
+        self._values = [0.0] * len(self._values)
+
+    def dot(self, other):
+        if len(other) != len(self._values):
+            raise ValueError('Vectors must have the same length.')
+        return sum(value * item for value, item in zip(self._values, other))
+
+    def cross(self, other):
+        if len(self._values) != 3 or len(other) != 3:
+            raise ValueError('Vector.cross() is only defined for 3D vectors.')
+        ax, ay, az = self._values
+        bx, by, bz = other
+        return Vector((ay * bz - az * by, az * bx - ax * bz, ax * by - ay * bx))
+
+    _missing = object()
+
+    def angle(self, other, fallback=_missing):
+        lengths = self.length_squared * sum(item * item for item in other)
+        if lengths == 0.0:
+            if fallback is self._missing:
+                raise ValueError(
+                    'Vector.angle(other): zero length vectors have no valid'
+                    ' angle.')
+            return fallback
+        return acos(max(-1.0, min(1.0, self.dot(other) / sqrt(lengths))))
+
+    def angle_signed(self, other, fallback=_missing):
+        if len(self._values) != 2 or len(other) != 2:
+            raise ValueError(
+                'Vector.angle_signed() is only defined for 2D vectors.')
+        if self.length_squared == 0.0 or other[0] == 0.0 == other[1]:
+            if fallback is self._missing:
+                raise ValueError(
+                    'Vector.angle_signed(other): zero length vectors have no'
+                    ' valid angle.')
+            return fallback
+        x, y = self._values
+        return atan2(y * other[0] - x * other[1], x * other[0] + y * other[1])
+
+    def rotate(self, other):
+        self._check_write()
+        if len(self._values) != 3:
+            raise ValueError('Vector must be 3D to be rotated.')
+        self._values = _apply_rows(_rotation_rows(other), self._values)
+
+    def __eq__(self, other):
+        try:
+            return (len(other) == len(self._values)
+                    and all(value == item
+                            for value, item in zip(self._values, other)))
+        except TypeError:
+            return NotImplemented
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    __hash__ = None
+
+    def _sequence(self, other):
+        if isinstance(other, Vector):
+            other = other._values
+        if len(other) != len(self._values):
+            raise ValueError('Vectors must have the same length.')
+        return other
+
+    def __add__(self, other):
+        other = self._sequence(other)
+        return Vector([value + item for value, item in zip(self._values, other)])
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        other = self._sequence(other)
+        return Vector([value - item for value, item in zip(self._values, other)])
+
+    def __rsub__(self, other):
+        other = self._sequence(other)
+        return Vector([item - value for value, item in zip(self._values, other)])
+
+    def __mul__(self, other):
+        if isinstance(other, (int, float)):
+            return Vector([value * other for value in self._values])
+        if isinstance(other, Vector):
+            return self.dot(other)
+        return NotImplemented
+
+    def __rmul__(self, other):
+        if isinstance(other, (int, float)):
+            return Vector([value * other for value in self._values])
+        return NotImplemented
+
+    def __truediv__(self, other):
+        if other == 0:
+            raise ZeroDivisionError('Vector division by zero.')
+        return Vector([value / other for value in self._values])
+
+    def __neg__(self):
+        return Vector([-value for value in self._values])
+
+    def __iadd__(self, other):
+        self._check_write()
+        other = self._sequence(other)
+        self._values = [value + item for value, item in zip(self._values, other)]
+        return self
+
+    def __isub__(self, other):
+        self._check_write()
+        other = self._sequence(other)
+        self._values = [value - item for value, item in zip(self._values, other)]
+        return self
+
+    def __imul__(self, other):
+        self._check_write()
+        if not isinstance(other, (int, float)):
+            return NotImplemented
+        self._values = [value * other for value in self._values]
+        return self
+
+    def __itruediv__(self, other):
+        self._check_write()
+        self._values = [value / other for value in self._values]
+        return self
+
+    def __repr__(self):
+        return 'Vector(({}))'.format(
+            ', '.join('{:.4f}'.format(value) for value in self._values))
+
+    def __init__(self, values=(0.0, 0.0, 0.0)):
+        self._values = [float(value) for value in values]
+        if len(self._values) < 2 or len(self._values) > 4:
+            raise ValueError('Vector must have between 2 and 4 items.')
+        self._readOnly = False
+
+class Matrix(object):
+    __slots__ = ('_rows',)
+
+    @staticmethod
+    def Identity(size):
+        return Matrix([[1.0 if row == column else 0.0 for column in range(size)]
+                       for row in range(size)])
+
+    @staticmethod
+    def Rotation(angle, size, axis=None):
+        cosine = cos(angle)
+        sine = sin(angle)
+        if size == 2:
+            return Matrix(((cosine, -sine), (sine, cosine)))
+        if size not in (3, 4):
+            raise ValueError('Matrix.Rotation(): size must be 2, 3, or 4.')
+        if isinstance(axis, str):
+            if axis not in _axes:
+                raise ValueError(
+                    'Matrix.Rotation(): axis must be "X", "Y", or "Z".')
+            axis = _axes[axis]
+        if axis is None or len(axis) != 3:
+            raise ValueError('Matrix.Rotation(): a 3D axis is required.')
+        rows = Quaternion(axis, angle).to_matrix()
+        if size == 4:
+            rows = rows.to_4x4()
+        return rows
+
+    @staticmethod
+    def Translation(vector):
+        matrix = Matrix.Identity(4)
+        for row, value in enumerate(vector):
+            matrix._rows[row]._values[3] = float(value)
+        return matrix
+
+    @property
+    def translation(self):
+        return Vector([row._values[3] for row in self._rows[0:3]])
+    @translation.setter
+    def translation(self, translation):
+        for row, value in enumerate(translation):
+            self._rows[row]._values[3] = float(value)
+
+    @property
+    def row(self):
+        return tuple(self._rows)
+
+    @property
+    def col(self):
+        return tuple(Vector(column) for column in zip(*self._lists()))
+
+    def _lists(self):
+        return [row._values for row in self._rows]
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __iter__(self):
+        return iter(self._rows)
+
+    def __getitem__(self, specifier):
+        # Rows are returned by reference, so that setting an item in a row sets
+        # it in the matrix, like Blender.
+        if isinstance(specifier, slice):
+            return tuple(self._rows[specifier])
+        return self._rows[specifier]
+
+    def __setitem__(self, specifier, value):
+        self._rows[specifier][:] = value
+
+    def copy(self):
+        return Matrix(self._lists())
+
+    def identity(self):
+        size = len(self._rows)
+        for rowIndex, row in enumerate(self._rows):
+            row._values = [
+                1.0 if rowIndex == column else 0.0 for column in range(size)]
+
+    def zero(self):
+        for row in self._rows:
+            row._values = [0.0] * len(row._values)
+
+    def transposed(self):
+        return Matrix(list(zip(*self._lists())))
+
+    def transpose(self):
+        for row, values in zip(self._rows, zip(*self._lists())):
+            row._values = list(values)
+
+    def inverted(self, fallback=Vector._missing):
+        # Gauss-Jordan elimination with partial pivoting.
+        size = len(self._rows)
+        if size != len(self._rows[0]):
+            raise ValueError('Matrix.inverted(): only square matrices.')
+        work = [row._values[:] + [1.0 if row_ == column else 0.0
+                                  for column in range(size)]
+                for row_, row in enumerate(self._rows)]
+        for column in range(size):
+            pivot = max(range(column, size), key=lambda row: abs(work[row][column]))
+            if abs(work[pivot][column]) < _epsilon:
+                if fallback is Vector._missing:
+                    raise ValueError(
+                        'Matrix.inverted(): matrix does not have an inverse.')
+                return fallback
+            work[column], work[pivot] = work[pivot], work[column]
+            divisor = work[column][column]
+            work[column] = [value / divisor for value in work[column]]
+            for row in range(size):
+                if row != column and work[row][column] != 0.0:
+                    factor = work[row][column]
+                    work[row] = [value - factor * pivotValue
+                                 for value, pivotValue in zip(
+                                     work[row], work[column])]
+        return Matrix([row[size:] for row in work])
+
+    def invert(self, fallback=None):
+        inverse = self.inverted(
+            Vector._missing if fallback is None else fallback)
+        for row, values in zip(self._rows, inverse._lists()):
+            row._values = list(values)
+
+    def to_3x3(self):
+        return Matrix([row._values[0:3] for row in self._rows[0:3]])
+
+    def to_4x4(self):
+        rows = [row._values[0:3] + [0.0] for row in self._rows[0:3]]
+        if len(self._rows) == 4:
+            rows = [row._values[:] for row in self._rows]
+        else:
+            rows.append([0.0, 0.0, 0.0, 1.0])
+        return Matrix(rows)
+
+    def to_euler(self, order='XYZ', euler_compat=None):
+        return Euler(_rows_euler(_rotation_rows(self), order), order)
+
+    def to_quaternion(self):
+        rows = _rotation_rows(self)
+        trace = rows[0][0] + rows[1][1] + rows[2][2]
+        if trace > 0.0:
+            scale = sqrt(trace + 1.0) * 2.0
+            w = 0.25 * scale
+            x = (rows[2][1] - rows[1][2]) / scale
+            y = (rows[0][2] - rows[2][0]) / scale
+            z = (rows[1][0] - rows[0][1]) / scale
+        elif rows[0][0] > rows[1][1] and rows[0][0] > rows[2][2]:
+            scale = sqrt(1.0 + rows[0][0] - rows[1][1] - rows[2][2]) * 2.0
+            w = (rows[2][1] - rows[1][2]) / scale
+            x = 0.25 * scale
+            y = (rows[0][1] + rows[1][0]) / scale
+            z = (rows[0][2] + rows[2][0]) / scale
+        elif rows[1][1] > rows[2][2]:
+            scale = sqrt(1.0 + rows[1][1] - rows[0][0] - rows[2][2]) * 2.0
+            w = (rows[0][2] - rows[2][0]) / scale
+            x = (rows[0][1] + rows[1][0]) / scale
+            y = 0.25 * scale
+            z = (rows[1][2] + rows[2][1]) / scale
+        else:
+            scale = sqrt(1.0 + rows[2][2] - rows[0][0] - rows[1][1]) * 2.0
+            w = (rows[1][0] - rows[0][1]) / scale
+            x = (rows[0][2] + rows[2][0]) / scale
+            y = (rows[1][2] + rows[2][1]) / scale
+            z = 0.25 * scale
+        quaternion = Quaternion((w, x, y, z))
+        return quaternion if w >= 0.0 else -quaternion
+
+    def rotate(self, other):
+        # Same as Blender: self becomes other * self.
+        if len(self._rows) != 3 or len(self._rows[0]) != 3:
+            raise ValueError('Matrix must have 3x3 dimensions.')
+        for row, values in zip(self._rows, _multiply_rows(
+            _rotation_rows(other), self._lists())
+        ):
+            row._values = values
+
+    def __mul__(self, other):
+        if isinstance(other, Matrix):
+            if len(self._rows[0]) != len(other._rows):
+                raise ValueError('Matrix multiplication: dimension mismatch.')
+            return Matrix(_multiply_rows(self._lists(), other._lists()))
+        if isinstance(other, Vector):
+            return Vector(_apply_rows(self._lists(), other._values))
+        if isinstance(other, (int, float)):
+            return Matrix([[value * other for value in row._values]
+                           for row in self._rows])
+        return NotImplemented
+    __matmul__ = __mul__
+
+    def __rmul__(self, other):
+        if isinstance(other, (int, float)):
+            return self.__mul__(other)
+        return NotImplemented
+
+    def __eq__(self, other):
+        if not isinstance(other, Matrix):
+            return NotImplemented
+        return self._lists() == other._lists()
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    __hash__ = None
+
+    def __repr__(self):
+        return 'Matrix(({}))'.format(', '.join(
+            '({})'.format(', '.join('{:.4f}'.format(value) for value in row))
+            for row in self._lists()))
+
+    def __init__(self, rows=None):
+        if rows is None:
+            rows = ((1.0, 0.0, 0.0, 0.0), (0.0, 1.0, 0.0, 0.0),
+                    (0.0, 0.0, 1.0, 0.0), (0.0, 0.0, 0.0, 1.0))
+        self._rows = [Vector(row) for row in rows]
+        size = len(self._rows[0])
+        if any(len(row) != size for row in self._rows):
+            raise ValueError('Matrix rows must all be the same length.')
+
+class Quaternion(object):
+    __slots__ = ('_values',)
+
+    @property
+    def w(self):
+        return self._values[0]
+    @property
+    def x(self):
+        return self._values[1]
+    @property
+    def y(self):
+        return self._values[2]
+    @property
+    def z(self):
+        return self._values[3]
+
+    @property
+    def magnitude(self):
+        return sqrt(sum(value * value for value in self._values))
+
+    @property
+    def angle(self):
+        return 2.0 * acos(max(-1.0, min(1.0, self.normalized()._values[0])))
+
+    @property
+    def axis(self):
+        w, x, y, z = self.normalized()._values
+        axis = Vector((x, y, z))
+        axis.normalize()
+        return axis if axis.length_squared > 0.0 else Vector((1.0, 0.0, 0.0))
+
+    def __len__(self):
+        return 4
+
+    def __iter__(self):
+        return iter(self._values)
+
+    def __getitem__(self, specifier):
+        if isinstance(specifier, slice):
+            return tuple(self._values[specifier])
+        return self._values[specifier]
+
+    def __setitem__(self, specifier, value):
+        if isinstance(specifier, slice):
+            self._values[specifier] = [float(item) for item in value]
+        else:
+            self._values[specifier] = float(value)
+
+    def copy(self):
+        return Quaternion(self._values)
+
+    def identity(self):
+        self._values = [1.0, 0.0, 0.0, 0.0]
+
+    def normalize(self):
+        length = self.magnitude
+        if length != 0.0:
+            self._values = [value / length for value in self._values]
+
+    def normalized(self):
+        quaternion = self.copy()
+        quaternion.normalize()
+        return quaternion
+
+    def conjugated(self):
+        w, x, y, z = self._values
+        return Quaternion((w, -x, -y, -z))
+
+    def inverted(self):
+        lengthSquared = sum(value * value for value in self._values)
+        w, x, y, z = self._values
+        return Quaternion((w / lengthSquared, -x / lengthSquared
+                           , -y / lengthSquared, -z / lengthSquared))
+
+    def to_matrix(self):
+        return Matrix(_quaternion_rows(*self._values))
+
+    def to_euler(self, order='XYZ', euler_compat=None):
+        return Euler(_rows_euler(_quaternion_rows(*self._values), order), order)
+
+    def rotate(self, other):
+        rotation = (other if isinstance(other, Quaternion)
+                    else Matrix(_rotation_rows(other)).to_quaternion())
+        self._values = (rotation * self)._values
+
+    def __mul__(self, other):
+        if isinstance(other, Quaternion):
+            aw, ax, ay, az = self._values
+            bw, bx, by, bz = other._values
+            return Quaternion((
+                aw * bw - ax * bx - ay * by - az * bz,
+                aw * bx + ax * bw + ay * bz - az * by,
+                aw * by - ax * bz + ay * bw + az * bx,
+                aw * bz + ax * by - ay * bx + az * bw))
+        if isinstance(other, Vector):
+            return Vector(_apply_rows(
+                _quaternion_rows(*self._values), other._values))
+        if isinstance(other, (int, float)):
+            return Quaternion([value * other for value in self._values])
+        return NotImplemented
+    __matmul__ = __mul__
+
+    def __neg__(self):
+        return Quaternion([-value for value in self._values])
+
+    def __eq__(self, other):
+        if not isinstance(other, Quaternion):
+            return NotImplemented
+        return self._values == other._values
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    __hash__ = None
+
+    def __repr__(self):
+        return 'Quaternion(({}))'.format(
+            ', '.join('{:.4f}'.format(value) for value in self._values))
+
+    def __init__(self, values=None, angle=None):
+        if values is None:
+            self._values = [1.0, 0.0, 0.0, 0.0]
+        elif angle is None:
+            self._values = [float(value) for value in values]
+            if len(self._values) != 4:
+                raise ValueError('Quaternion must have 4 items.')
+        else:
+            # Axis and angle, like Blender's axis_angle_to_quat().
+            x, y, z = (float(value) for value in values)
+            length = sqrt(x * x + y * y + z * z)
+            if length == 0.0:
+                self._values = [1.0, 0.0, 0.0, 0.0]
+            else:
+                sine = sin(angle / 2.0) / length
+                self._values = [cos(angle / 2.0), x * sine, y * sine, z * sine]
+
+class Euler(object):
+    __slots__ = ('_values', '_order')
+
+    @property
+    def order(self):
+        return self._order
+    @order.setter
+    def order(self, order):
+        if order not in _orders:
+            raise ValueError('Euler order "{}" not valid.'.format(order))
+        self._order = order
+
+    @property
+    def x(self):
+        return self._values[0]
+    @x.setter
+    def x(self, x):
+        self._values[0] = float(x)
+
+    @property
+    def y(self):
+        return self._values[1]
+    @y.setter
+    def y(self, y):
+        self._values[1] = float(y)
+
+    @property
+    def z(self):
+        return self._values[2]
+    @z.setter
+    def z(self, z):
+        self._values[2] = float(z)
+
+    def __len__(self):
+        return 3
+
+    def __iter__(self):
+        return iter(self._values)
+
+    def __getitem__(self, specifier):
+        if isinstance(specifier, slice):
+            return tuple(self._values[specifier])
+        return self._values[specifier]
+
+    def __setitem__(self, specifier, value):
+        if isinstance(specifier, slice):
+            values = [float(item) for item in value]
+            if len(values) != len(range(*specifier.indices(3))):
+                raise ValueError('Euler slice assignment size mismatch.')
+            self._values[specifier] = values
+        else:
+            self._values[specifier] = float(value)
+
+    def copy(self):
+        return Euler(self._values, self._order)
+
+    def zero(self):
+        self._values = [0.0, 0.0, 0.0]
+
+    def to_matrix(self):
+        return Matrix(_euler_rows(self._values, self._order))
+
+    def to_quaternion(self):
+        return self.to_matrix().to_quaternion()
+
+    def rotate(self, other):
+        rows = _multiply_rows(
+            _rotation_rows(other), _euler_rows(self._values, self._order))
+        self._values = _rows_euler(rows, self._order)
+
+    def __eq__(self, other):
+        if not isinstance(other, Euler):
+            return NotImplemented
+        return self._values == other._values and self._order == other._order
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    __hash__ = None
+
+    def __repr__(self):
+        return "Euler(({}), '{}')".format(
+            ', '.join('{:.4f}'.format(value) for value in self._values)
+            , self._order)
+
+    def __init__(self, angles=(0.0, 0.0, 0.0), order='XYZ'):
+        self._values = [float(angle) for angle in angles]
+        if len(self._values) != 3:
+            raise ValueError('Euler must have 3 items.')
+        self.order = order
@@ -0,0 +1,277 @@
+#!/usr/bin/python
+# (c) 2018 Jim Hawkins. MIT licensed, see https://opensource.org/licenses/MIT
+# Part of Blender Driver, see https://github.com/sjjhsjjh/blender-driver
+"""Headless tick harness module.
+
+Runs the tick of the REST application, with its animations, cursor update walk,
+and camera tracking, on a scene of headless game objects. The stand-in modules
+must have been installed before this module is imported, see the
+blender_driver.headless package.
+
+Cannot be run as a program, sorry. Run the package instead."""
+# Exit if run other than as a module.
+if __name__ == '__main__':
+    print(__doc__)
+    raise SystemExit(1)
+
+# Standard library imports, in alphabetic order.
+#
+# Module for degrees to radians conversion.
+# https://docs.python.org/3/library/math.html
+from math import ceil, radians
+#
+# Module for the Event that signals the end of each tick.
+# https://docs.python.org/3/library/threading.html
+import threading
+#
+# Module for perf_counter and sleep.
+# https://docs.python.org/3/library/time.html
+import time
+#
+# Blender library imports, in alphabetic order.
+#
+# Blender Game Engine, which is the headless stand-in here.
+import bge
+#
+# Local imports.
+#
+# Application with REST, which runs the tick.
+import blender_driver.application.rest
+#
+# Percentile of the tick times.
+from blender_driver.timingutils import percentile
+
+# Animated properties, and the animation speeds for them. The rotation speed
+# is in radians per second.
+animatable = {
+    'position': ('worldPosition', 0.5, 0),
+    'scale': ('worldScale', 0.1, 0),
+    'rotation': ('rotation', radians(45), radians(360))}
+
+class Application(blender_driver.application.rest.Application):
+
+    @property
+    def simulatedPerf(self):
+        """\
+        Simulated time for the current tick, in seconds from the start, or
+        None to use the real time.
+        """
+        return self._simulatedPerf
+    @simulatedPerf.setter
+    def simulatedPerf(self, simulatedPerf):
+        self._simulatedPerf = simulatedPerf
+
+    # Override.
+    @property
+    def tickPerf(self):
+        if self._simulatedPerf is None:
+            return super().tickPerf
+        return self._simulatedPerf
+
+    @property
+    def snapshotReader(self):
+        """\
+        True to get the published snapshot at the end of every tick, like a
+        client that sends a GET every tick. If the store changes every tick,
+        every other tick then publishes a snapshot, and the ones between
+        withdraw it.
+        """
+        return self._snapshotReader
+    @snapshotReader.setter
+    def snapshotReader(self, snapshotReader):
+        self._snapshotReader = snapshotReader
+
+    @property
+    def tickTimes(self):
+        """List of the duration of every tick that ran, in seconds."""
+        return self._tickTimes
+
+    @property
+    def ticksSkipped(self):
+        """Total number of ticks skipped, according to the tickPolicy."""
+        return self._ticksSkipped
+
+    @property
+    def tickDone(self):
+        """threading.Event that is set at the end of every tick."""
+        return self._tickDone
+
+    @property
+    def tickError(self):
+        """Exception raised by the last tick that raised one, or None."""
+        return self._tickError
+
+    # Override.
+    def game_initialise(self):
+        super().game_initialise()
+        self._simulatedPerf = None
+        self._snapshotReader = False
+        self._tickTimes = []
+        self._ticksSkipped = 0
+        self._tickDone = threading.Event()
+        self._tickError = None
+        self._cameras = []
+        #
+        # Templates for the objects that the cursors add.
+        self.bpy.data.objects.add(
+            self._visualiserName, scale=(0.1, 0.1, 0.1))
+        self.bpy.data.objects.add(self._emptyName, type='EMPTY')
+        self.bpy.data.objects.add('camera', type='CAMERA')
+
+    def populate(self, objects, animate=tuple(animatable), components=1
+                 , cursors=0, cameras=0, batch=False):
+        """\
+        Add game objects in a grid, with animations of the specified number of
+        components of each of the animate properties. Add cursors to some of
+        the objects, and cameras that track the cursors. There must be at least
+        one cursor if there are any cameras. If batch is True, the animations
+        are evaluated in NumPy batches, see AnimatedRestInterface.
+        """
+        if cameras > 0 and cursors <= 0:
+            raise ValueError("Cameras need at least one cursor to track.")
+        restInterface = self._restInterface
+        restInterface.batchAnimations = batch
+        width = max(1, ceil(objects ** 0.5))
+        with self.mainLock:
+            for index in range(objects):
+                object_ = self.game_add_object('cube')
+                path = self.gameObjectPath + (index,)
+                restInterface.rest_put(object_, path)
+                restInterface.rest_put(
+                    (4.0 * (index % width), 4.0 * (index // width), 0.0)
+                    , path + ('worldPosition',))
+                for name in animate:
+                    property_, speed, modulo = animatable[name]
+                    for dimension in range(components):
+                        animationPath = (
+                            'animations', name + str(dimension), index)
+                        restInterface.rest_put({
+                            'subjectPath': path,
+                            'valuePath': path + (property_, dimension),
+                            'speed': speed,
+                            'modulo': modulo,
+                            'targetValue': None
+                        }, animationPath)
+                        restInterface.rest_put(
+                            self.tickPerf, animationPath + ('startTime',))
+
+            for index in range(cursors):
+                subjectPath = self.gameObjectPath + (index % objects,)
+                restInterface.rest_get(subjectPath).tether = self._add_empty()
+                cursorPath = ('root', 'cursors', index)
+                restInterface.rest_put(self.game_add_cursor(), cursorPath)
+                restInterface.rest_patch({
+                    'subjectPath': subjectPath,
+                    'origin': (0, 0, 0), 'offset': 1.0, 'length': 4.0,
+                    'radius': 2.0, 'rotation': 0.0,
+                    'selfPath': cursorPath
+                }, cursorPath)
+                restInterface.rest_put(True, cursorPath + ('visible',))
+
+            for index in range(cameras):
+                camera = self.Camera(
+                    self.gameScene.addObject('camera', self.gameGateway))
+                camera.restInterface = restInterface
+                path = ('root', 'cameras', index)
+                restInterface.rest_put(camera, path)
+                restInterface.rest_patch({
+                    'animationPath': (
+                        'animations', 'cameraTracking{}'.format(index)),
+                    'selfPath': path,
+                    'trackSpeed': radians(135.0),
+                    'worldPosition': (-10.0, -10.0 - 5.0 * index, 10.0)
+                }, path)
+                restInterface.rest_put(
+                    ('root', 'cursors', index % cursors)
+                    , path + ('subjectPath',))
+                self._cameras.append(camera)
+
+    # Override.
+    def game_tick_run(self):
+        start = time.perf_counter()
+        try:
+            super().game_tick_run()
+            if len(self._cameras) > 0:
+                with self.mainLock:
+                    for camera in self._cameras:
+                        camera.tick(self.tickPerf)
+            if self._snapshotReader:
+                self.published_snapshot()
+        except Exception as exception:
+            self._tickError = exception
+            raise
+        finally:
+            self._tickTimes.append(time.perf_counter() - start)
+            self._tickDone.set()
+
+    # Override.
+    def tick_skipped(self):
+        self._ticksSkipped += 1
+
+def summary(tickTimes, rate, skipped=0, warmup=0):
+    """\
+    Get a dictionary of statistics of tick times in seconds, discarding the
+    specified number of warm up ticks first. A tick that took longer than the
+    interval at the rate is an overrun.
+    """
+    times = tickTimes[warmup:]
+    budget = 1.0 / rate
+    return {
+        'ticks': len(times),
+        'skipped': skipped,
+        'budget': budget,
+        'overruns': sum(1 for value in times if value > budget),
+        'mean': sum(times) / len(times) if len(times) > 0 else None,
+        'p50': percentile(times, 0.5),
+        'p95': percentile(times, 0.95),
+        'p99': percentile(times, 0.99),
+        'max': max(times) if len(times) > 0 else None}
+
+def run(ticks=300, rate=60.0, realtime=False, warmup=10, tickPolicy='skip'
+        , reader=False, **population):
+    """\
+    Create and populate an Application, run it for a number of ticks at the
+    rate in ticks per second, terminate it, and return the summary of its tick
+    times. The summary also has the statistics of the tick phases, from the
+    tickTimings of the Application, under the phases key. The other keyword
+    parameters are passed to Application.populate().
+
+    If realtime is False, which is the default, time is simulated. Each tick
+    starts as soon as the previous one finishes, but the animations see a tick
+    time that advances by exactly one interval every tick. If realtime is True,
+    ticks are signalled at the rate by the wall clock, and could be skipped
+    according to the tickPolicy. If reader is True, the snapshot is read every
+    tick, see Application.snapshotReader.
+    """
+    scene = bge.logic.getCurrentScene()
+    application = Application({'arguments': {'applicationSwitches': [
+        '--tickPolicy', tickPolicy, '--tickMetrics', str(ticks)]}})
+    application.game_constructor(scene, scene.addObject('gateway'))
+    application.game_initialise()
+    try:
+        if not realtime:
+            application.simulatedPerf = 0.0
+        application.snapshotReader = reader
+        application.populate(**population)
+        interval = 1.0 / rate
+        due = time.perf_counter()
+        for tick in range(warmup + ticks):
+            if realtime:
+                wait = due - time.perf_counter()
+                if wait > 0.0:
+                    time.sleep(wait)
+                due += interval
+                application.game_tick()
+            else:
+                application.simulatedPerf = (tick + 1) * interval
+                application.tickDone.clear()
+                application.game_tick()
+                application.tickDone.wait()
+            if application.tickError is not None:
+                raise application.tickError
+    finally:
+        application.game_terminate()
+    summary_ = summary(
+        application.tickTimes, rate, application.ticksSkipped, warmup)
+    summary_['phases'] = application.tickTimings.summary()['phases']
+    return summary_
@@ -89,6 +89,15 @@ def initialise_logging(verbose):
         logger.addHandler(defaultHandler)
         logger.addHandler(warningHandler)
         logger.setLevel(logging.INFO)
+    #
+    # Set the guards on debug logging in the Path Store hot paths from the new
+    # level, if the Path Store is available in this context.
+    try:
+        from path_store import logguard
+    except ImportError:
+        logguard = None
+    if logguard is not None:
+        logguard.refresh()
 
     return "Logging level: {}.".format(
         logging.getLevelName(logger.getEffectiveLevel()))
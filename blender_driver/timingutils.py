@@ -0,0 +1,162 @@
+#!/usr/bin/python
+# (c) 2018 Jim Hawkins. MIT licensed, see https://opensource.org/licenses/MIT
+# Part of Blender Driver, see https://github.com/sjjhsjjh/blender-driver
+"""Python module for the Blender Driver tick timing utilities.
+
+This module has no Blender dependencies, so it can be used in the Blender Game
+Engine context and outside Blender.
+
+Can only be imported as a module, not run as a script, sorry.
+"""
+# Exit if run other than as a module.
+if __name__ == '__main__':
+    print(__doc__)
+    raise SystemExit(1)
+
+# Standard library imports, in alphabetic order.
+#
+# Module for the fixed-size ring buffers.
+# https://docs.python.org/3/library/array.html
+from array import array
+#
+# Module for writing the durations file.
+# https://docs.python.org/3/library/csv.html
+import csv
+#
+# Module for the nearest-rank percentile.
+# https://docs.python.org/3/library/math.html
+from math import ceil
+#
+# Module for the Lock that keeps copies of the buffers consistent.
+# https://docs.python.org/3/library/threading.html
+import threading
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of a sequence of numbers, or None if empty."""
+    ordered = sorted(values)
+    if len(ordered) == 0:
+        return None
+    return ordered[max(0, ceil(fraction * len(ordered)) - 1)]
+
+class TickTimings(object):
+    """\
+    Durations of the phases of the most recent ticks, in nanoseconds, kept in
+    fixed-size ring buffers. Call begin() at the start of every tick, then
+    record() for each phase. A phase that isn't recorded in a tick has no
+    duration for that tick, instead of a zero duration.
+
+    Only the tick thread should call begin() and record(). Any thread can call
+    the other methods.
+    """
+
+    @property
+    def phases(self):
+        """Names of the phases, in order."""
+        return self._phases
+
+    @property
+    def size(self):
+        """Number of ticks kept."""
+        return self._size
+
+    @property
+    def ticks(self):
+        """Total number of ticks begun, including those no longer kept."""
+        return self._ticks
+
+    def begin(self, tickPerf):
+        """Start the next tick, which overwrites the oldest, if all the buffers
+        are in use."""
+        with self._lock:
+            index = self._ticks % self._size
+            self._ticks += 1
+            self._numbers[index] = self._ticks
+            self._starts[index] = tickPerf
+            for buffer in self._buffers.values():
+                buffer[index] = -1
+            self._index = index
+
+    def record(self, phase, nanoseconds):
+        """\
+        Record a duration for a phase of the current tick. If the phase already
+        has a duration in the tick, the new duration is added to it.
+        """
+        buffer = self._buffers[phase]
+        index = self._index
+        if buffer[index] < 0:
+            buffer[index] = nanoseconds
+        else:
+            buffer[index] += nanoseconds
+
+    def total(self, phases):
+        """Total duration of some phases in the current tick, in nanoseconds."""
+        index = self._index
+        return sum(max(0, self._buffers[phase][index]) for phase in phases)
+
+    def rows(self):
+        """\
+        Get a list of the kept ticks, oldest first. Each is a tuple of the tick
+        number, starting with one, the tickPerf of the tick, and the duration of
+        each phase, or None if the phase wasn't recorded in the tick.
+        """
+        with self._lock:
+            count = min(self._ticks, self._size)
+            first = self._ticks - count
+            rows = []
+            for tick in range(first, self._ticks):
+                index = tick % self._size
+                rows.append(
+                    (self._numbers[index], self._starts[index]) + tuple(
+                        None if self._buffers[phase][index] < 0
+                        else self._buffers[phase][index]
+                        for phase in self._phases))
+        return rows
+
+    def summary(self, fractions=(0.5, 0.95, 0.99)):
+        """\
+        Get a dictionary with the number of ticks, and statistics of every
+        phase over the kept ticks, in milliseconds. The statistics of a phase
+        are the count of ticks in which it was recorded, the mean, the
+        percentiles in fractions, named like p95, and the maximum.
+        """
+        rows = self.rows()
+        phases = {}
+        for column, phase in enumerate(self._phases, 2):
+            durations = [row[column] / 1e6 for row in rows
+                         if row[column] is not None]
+            statistics = {
+                'count': len(durations),
+                'mean': (sum(durations) / len(durations)
+                         if len(durations) > 0 else None)}
+            for fraction in fractions:
+                statistics['p{:g}'.format(fraction * 100.0)] = percentile(
+                    durations, fraction)
+            statistics['max'] = max(durations) if len(durations) > 0 else None
+            phases[phase] = statistics
+        return {'ticks': self._ticks, 'size': self._size, 'phases': phases}
+
+    def write_csv(self, path):
+        """\
+        Write the kept ticks to a CSV file, with a header line. Durations are in
+        nanoseconds, and are empty for phases that weren't recorded.
+        """
+        with open(path, 'w', newline='') as file_:
+            writer = csv.writer(file_)
+            writer.writerow(('tick', 'tickPerf') + self._phases)
+            for row in self.rows():
+                writer.writerow(tuple('' if value is None else value
+                                      for value in row))
+
+    def __init__(self, phases, size=1024):
+        if size < 1:
+            raise ValueError(
+                'TickTimings size must be at least one, not {}.'.format(size))
+        self._phases = tuple(phases)
+        self._size = size
+        self._ticks = 0
+        self._index = 0
+        self._lock = threading.Lock()
+        self._numbers = array('q', [0]) * size
+        self._starts = array('d', [0.0]) * size
+        self._buffers = dict(
+            (phase, array('q', [-1]) * size) for phase in self._phases)
@@ -0,0 +1,354 @@
+#!/usr/bin/python
+# (c) 2018 Jim Hawkins. MIT licensed, see https://opensource.org/licenses/MIT
+# Part of Blender Driver, see https://github.com/sjjhsjjh/blender-driver
+"""\
+Path Store module for caching the parents of points.
+
+A cached accessor holds the parent object of a point, the last leg of the path
+to the point, and the type of descent for the leg. Getting or setting the point
+then costs one subscription or attribute access, instead of a descent from the
+top of the store.
+
+Cannot be run as a program, sorry."""
+# Exit if run other than as a module.
+if __name__ == '__main__':
+    print(__doc__)
+    raise SystemExit(1)
+
+# Standard library imports, in alphabetic order.
+#
+# Module for partial application, used to bind setters.
+# https://docs.python.org/3/library/functools.html
+import functools
+#
+# Module for levelled logging messages.
+# Tutorial is here: https://docs.python.org/3.5/howto/logging.html
+# Reference is here: https://docs.python.org/3.5/library/logging.html
+from logging import DEBUG, INFO, WARNING, ERROR, log
+#
+# Module for the setitem function, used to bind setters.
+# https://docs.python.org/3/library/operator.html
+import operator
+#
+# Module for the re-entrant lock that guards the cache.
+# https://docs.python.org/3/library/threading.html
+import threading
+#
+# Local imports.
+#
+# Path Store module.
+try:
+    import path_store.pathstore
+    pathstore = path_store.pathstore
+except ImportError:
+    import pathstore
+
+class Accessor(object):
+    """\
+    Cached accessor for one point in a path store. Don't construct; get an
+    instance from an AccessorCache.
+    """
+    @property
+    def parent(self):
+        return self._node.point
+
+    @property
+    def leg(self):
+        return self._leg
+
+    @property
+    def pointType(self):
+        return self._pointType
+
+    @property
+    def intercepted(self):
+        """\
+        True if the point is an item of a parent that has an item_setter()
+        method, like an InterceptProperty instance. Every call of a callable
+        from setter() or parent_setter() then notifies the InterceptProperty
+        observers.
+        """
+        return (
+            self._pointType is not pathstore.PointType.ATTR
+            and getattr(self._node.point.__class__, 'item_setter', None)
+            is not None)
+
+    def get(self):
+        if self._pointType is pathstore.PointType.ATTR:
+            return getattr(self._node.point, self._leg)
+        return self._node.point[self._leg]
+
+    def set(self, value):
+        didSet, parent = pathstore._set(
+            self._node.point, self._leg, value, self._pointType)
+        if parent is not self._node.point:
+            # The parent was a tuple, which can't be cached, and so this should
+            # never happen.
+            raise AssertionError(" ".join((
+                "Cached parent was replaced for", pathstore.str_quote(
+                    self._leg))))
+        return didSet
+
+    def setter(self):
+        """\
+        Get a callable that sets the point to the value passed to it, bound to
+        the parent and with the type of assignment resolved now. If the parent
+        has an item_setter() method, like an InterceptProperty instance, that
+        is used to get the callable. Unlike set(), the callable doesn't check
+        whether the point is already the value.
+        """
+        parent = self._node.point
+        if self._pointType is pathstore.PointType.ATTR:
+            return functools.partial(setattr, parent, self._leg)
+        item_setter = getattr(parent.__class__, 'item_setter', None)
+        if item_setter is not None:
+            return item_setter(parent, self._leg)
+        return functools.partial(operator.setitem, parent, self._leg)
+
+    def parent_setter(self):
+        """\
+        Get a callable that sets all the items of the parent to the items of the
+        sequence passed to it, bound in the same way as by setter().
+        """
+        parent = self._node.point
+        item_setter = getattr(parent.__class__, 'item_setter', None)
+        if item_setter is not None:
+            return item_setter(parent, slice(None))
+        return functools.partial(operator.setitem, parent, slice(None))
+
+    def __init__(self, node, leg, pointType):
+        self._node = node
+        self._leg = leg
+        self._pointType = pointType
+
+class AccessorCache(object):
+    """\
+    Cache of Accessor instances, keyed by path. Cached parents are held in a
+    tree of nodes that mirrors the store, so that entries can be invalidated
+    for a path that has been changed, and for everything under it.
+
+    All changes to the structure of the store must be notified, by calling
+    invalidate(). Changes to leaf values needn't be notified.
+
+    The cache can be used from more than one thread. Its entries and nodes are
+    only changed while its own re-entrant lock is held.
+    """
+
+    class _Node(object):
+        def __init__(self, point):
+            # Object in the store at the path of this node.
+            self.point = point
+            # Dictionary of child nodes, keyed by leg.
+            self.children = {}
+            # List of the cache keys of accessors whose parent is this node.
+            self.keys = []
+
+    @property
+    def capacity(self):
+        """\
+        Maximum number of accessors, after which the cache is cleared. None
+        means no maximum.
+        """
+        return self._capacity
+    @capacity.setter
+    def capacity(self, capacity):
+        self._capacity = capacity
+
+    def __len__(self):
+        return len(self._accessors)
+
+    def clear(self):
+        with self._lock:
+            self._accessors = {}
+            self._root = None
+
+    def _key(self, path):
+        # Returns a tuple that can be used as a dictionary key for path, or None
+        # if path can't be cached.
+        key = path if isinstance(path, tuple) else tuple(
+            pathstore.pathify(path))
+        if len(key) <= 0:
+            return None
+        try:
+            hash(key)
+        except TypeError:
+            # Slices aren't hashable, and a path with a slice mustn't be cached
+            # anyway.
+            return None
+        return key
+
+    def lookup(self, root, path):
+        """\
+        Get the cached Accessor for path in the root store, or None if there
+        isn't one. Doesn't descend the store.
+        """
+        node = self._root
+        if node is None or node.point is not root:
+            return None
+        key = self._key(path)
+        return None if key is None else self._accessors.get(key)
+
+    def accessor(self, root, path):
+        """\
+        Get an Accessor for path in the root store, descending and caching it if
+        necessary. Returns None if an Accessor can't be cached, for example
+        because the point or its parent doesn't exist, or the parent is a tuple.
+        """
+        key = self._key(path)
+        if key is None:
+            return None
+        with self._lock:
+            return self._accessor(root, key)
+
+    def _accessor(self, root, key):
+        # Call only while holding the lock.
+        if self._root is None or self._root.point is not root:
+            self.clear()
+            self._root = self._Node(root)
+        else:
+            accessor = self._accessors.get(key)
+            if accessor is not None:
+                return accessor
+
+        if (self._capacity is not None
+            and len(self._accessors) >= self._capacity
+        ):
+            log(DEBUG, "Clearing at capacity {}.", self._capacity)
+            self.clear()
+            self._root = self._Node(root)
+
+        node = self._root
+        for leg in key[:-1]:
+            child = node.children.get(leg)
+            if child is None:
+                pointType, point, error = pathstore.descend(node.point, leg)
+                if pointType is None or point is None:
+                    return None
+                #
+                # A property getter could return a new object every time, in
+                # which case the object mustn't be cached. Check by descending
+                # again.
+                if pathstore.descend(node.point, leg)[1] is not point:
+                    return None
+                child = self._Node(point)
+                node.children[leg] = child
+            node = child
+
+        if isinstance(node.point, (tuple, str)):
+            return None
+        leg = key[-1]
+        pointType, point, error = pathstore.descend(node.point, leg)
+        if pointType is None:
+            return None
+
+        accessor = Accessor(node, leg, pointType)
+        self._accessors[key] = accessor
+        node.keys.append(key)
+        return accessor
+
+    def get(self, root, path):
+        """\
+        Get the value at path in the root store, using and populating the
+        cache. Raises the same errors as pathstore.get().
+        """
+        accessor = self.accessor(root, path)
+        if accessor is not None:
+            try:
+                return accessor.get()
+            except (AttributeError, IndexError, KeyError, TypeError):
+                # Fall through to get the usual error from the path store.
+                self.discard(path)
+        return pathstore.get(root, path)
+
+    def set(self, root, value, path):
+        """\
+        Set a value at path in the root store, using and populating the cache.
+        Returns False if the value couldn't be set using the cache, in which
+        case it hasn't been set at all, or True otherwise.
+        """
+        accessor = self.accessor(root, path)
+        if accessor is None:
+            return False
+        try:
+            accessor.set(value)
+        except (IndexError, KeyError, TypeError):
+            self.discard(path)
+            return False
+        return True
+
+    def discard(self, path):
+        key = self._key(path)
+        if key is None:
+            return
+        with self._lock:
+            accessor = self._accessors.pop(key, None)
+            if accessor is not None:
+                accessor._node.keys.remove(key)
+
+    def invalidate(self, root, path, shifted=False):
+        """\
+        Invalidate accessors after a change to the structure of the root store
+        at path. Call after the change has been made.
+
+        The following are invalidated.
+
+        -   Any accessor for a point under path.
+        -   Any accessor for a point under a parent on the path that has been
+            replaced, for example by a point maker or by a tuple being copied
+            into a list.
+        -   If shifted is True, and the last leg of the path is a number, any
+            accessor under a sibling. Pass True after a deletion, which could
+            shift the items in a list.
+
+        Accessors for the point at the path itself aren't invalidated, because
+        its parent is unchanged.
+        """
+        with self._lock:
+            self._invalidate(root, path, shifted)
+
+    def _invalidate(self, root, path, shifted):
+        # Call only while holding the lock.
+        if self._root is None:
+            return
+        if self._root.point is not root:
+            self.clear()
+            return
+        legs = tuple(pathstore.pathify(path))
+        if len(legs) <= 0:
+            self.clear()
+            return
+        last = len(legs) - 1
+        node = self._root
+        for index, leg in enumerate(legs):
+            if isinstance(leg, slice) or (
+                shifted and index >= last and not isinstance(leg, str)
+            ):
+                # Can't tell which children were affected so drop them all.
+                for childLeg in tuple(node.children.keys()):
+                    self._drop(node, childLeg)
+                return
+            child = node.children.get(leg)
+            if child is None:
+                return
+            if index >= last:
+                self._drop(node, leg)
+                return
+            point = pathstore.descend(node.point, leg)[1]
+            if point is not child.point:
+                self._drop(node, leg)
+                return
+            node = child
+
+    def _drop(self, node, leg):
+        # Call only while holding the lock.
+        stack = [node.children.pop(leg)]
+        while len(stack) > 0:
+            dropping = stack.pop()
+            for key in dropping.keys:
+                del self._accessors[key]
+            stack.extend(dropping.children.values())
+
+    def __init__(self, capacity=None):
+        self._capacity = capacity
+        self._lock = threading.RLock()
+        self.clear()
@@ -14,7 +14,16 @@ if __name__ == '__main__':
 #
 # Module for mathematical operations, used by angular animation.
 # https://docs.python.org/3.5/library/math.html
-from math import fmod
+from math import fmod, isfinite
+#
+# Third party imports.
+#
+# NumPy, which is optional. It's only used by get_values().
+# https://numpy.org/doc/stable/reference/
+try:
+    import numpy
+except ImportError:
+    numpy = None
 #
 # Local imports, would go here.
 
@@ -26,6 +35,7 @@ class Animation(object):
     def startTime(self, startTime):
         self._startTime = startTime
         self._completeTime = None
+        self._changed()
     
     @property
     def implicitStart(self):
@@ -45,6 +55,7 @@ class Animation(object):
     @stopped.setter
     def stopped(self, stopped):
         self._stopped = stopped
+        self._changed()
     
     @property
     def startValue(self):
@@ -53,6 +64,7 @@ class Animation(object):
     def startValue(self, startValue):
         self._startValue = startValue
         self._completeTime = None
+        self._changed()
     
     @property
     def nowTime(self):
@@ -69,6 +81,7 @@ class Animation(object):
     @speed.setter
     def speed(self, speed):
         self._speed = speed
+        self._changed()
         
     @property
     def targetValue(self):
@@ -77,6 +90,7 @@ class Animation(object):
     def targetValue(self, targetValue):
         self._targetValue = targetValue
         self._completeTime = None
+        self._changed()
         
     @property
     def userData(self):
@@ -99,6 +113,7 @@ class Animation(object):
     def modulo(self, modulo):
         self._modulo = modulo
         self._completeTime = None
+        self._changed()
     
     @property
     def complete(self):
@@ -111,6 +126,11 @@ class Animation(object):
         The nowTime value from when the animation reached its target, or None.
         """
         return self._completeTime
+
+    def _changed(self):
+        # Pack the parameters again, if this animation is in an AnimationBatch.
+        if self._batch is not None:
+            self._batch.pack(self)
         
     # This is unused in the current programming interface, and hence commented
     # out.
@@ -193,6 +213,11 @@ class Animation(object):
         return nowValue
 
     def __init__(self):
+        #
+        # AnimationBatch that this animation is in, if any, and its index there.
+        self._batch = None
+        self._batchIndex = None
+
         self._modulo = None
         self._userData = None
         
@@ -205,3 +230,389 @@ class Animation(object):
         self._stopped = False
 
         self._completeTime = None
+
+
+# Integers up to this magnitude convert to float without rounding, so that
+# arithmetic on them gives the same result in NumPy as in Python.
+_exactInteger = 2 ** 53
+
+def _batchable(value, optional=False):
+    if value is None:
+        return optional
+    if isinstance(value, float):
+        return isfinite(value)
+    if isinstance(value, int):
+        return -_exactInteger <= value <= _exactInteger
+    return False
+
+def batch_available():
+    """True if get_values() can be used, i.e. NumPy could be imported."""
+    return numpy is not None
+
+def _evaluate(nowTime, startTime, speed, start, target, hasTarget, modulo
+              , hasModulo):
+    # Vectorised equivalent of get_value(). Targets and modulos that aren't set
+    # have placeholder values and are masked out by hasTarget and hasModulo. The
+    # nowTime can be an array or a number. Returns a tuple of arrays of the
+    # values and of whether each target has been reached. The rest follows
+    # get_value(), but with masks instead of branches.
+    with numpy.errstate(invalid='ignore'):
+        return _evaluate_masked(
+            nowTime, startTime, speed, start, target, hasTarget, modulo
+            , hasModulo)
+
+def _evaluate_masked(nowTime, startTime, speed, start, target, hasTarget
+                     , modulo, hasModulo):
+    # Placeholder and zero modulos give NaN in the fmod() calls, which NumPy
+    # warns about. Those elements are always masked out.
+    increment = (nowTime - startTime) * speed
+    simple = (
+        ~hasTarget
+        | ((target > start) & (increment > 0))
+        | ((target < start) & (increment < 0)))
+    increment = numpy.where(~simple & ~hasModulo, increment * -1, increment)
+    nowValue = start + increment
+    #
+    # No target, with modulo.
+    wrapped = numpy.fmod(nowValue, modulo)
+    wrapped = numpy.where(wrapped < 0.0, wrapped + modulo, wrapped)
+    nowValue = numpy.where(~hasTarget & hasModulo, wrapped, nowValue)
+    #
+    # Target, reached by repeated application of the increment, or linear.
+    linear = hasTarget & (simple | ~hasModulo)
+    reached = linear & (
+        ((start <= target) & (nowValue >= target))
+        | ((start >= target) & (nowValue <= target)))
+    #
+    # Target, angular, and not simple.
+    adjustedStart = numpy.fmod(start - target, modulo)
+    adjustedStart = numpy.where(
+        adjustedStart < 0.0, adjustedStart + modulo, adjustedStart)
+    adjustedNow = numpy.fmod(nowValue - target, modulo)
+    adjustedNow = numpy.where(
+        adjustedNow < 0.0, adjustedNow + modulo, adjustedNow)
+    reached |= (hasTarget & ~simple & hasModulo) & (
+        (adjustedStart == 0.0)
+        | ((increment > 0.0) & (adjustedNow <= adjustedStart))
+        | ((increment < 0.0) & (adjustedNow >= adjustedStart)))
+    return nowValue, reached
+
+def get_values(animations):
+    """\
+    Get the animated values of a sequence of Animation instances, in one
+    vectorised pass. Returns a list of values, in the same order as the
+    animations. Sets the completion time of any animation that has reached its
+    target, in the same way as get_value().
+    
+    Results are the same as calling get_value() on each animation. Any
+    animation whose parameters can't be evaluated exactly in floating point, for
+    example because they aren't numbers, is evaluated by calling get_value()
+    instead.
+    
+    The parameters are packed every time. To evaluate the same animations
+    repeatedly, use an AnimationBatch instead.
+
+    Raises ImportError if NumPy isn't available.
+    """
+    if numpy is None:
+        raise ImportError("NumPy is required for get_values().")
+    values = [None] * len(animations)
+    #
+    # Indexes into animations and values of the animations that will be
+    # evaluated in the batch.
+    indexes = []
+    for index, animation in enumerate(animations):
+        nowTime = animation.nowTime
+        startTime = animation.startTime
+        speed = animation.speed
+        if (
+            _batchable(nowTime) and _batchable(startTime)
+            and _batchable(speed) and _batchable(animation.startValue)
+            and _batchable(animation.targetValue, True)
+            and _batchable(animation.modulo, True)
+            # If the increment would be an int in Python, the value could be
+            # an int too. Leave those to get_value().
+            and (isinstance(nowTime, float) or isinstance(startTime, float)
+                 or isinstance(speed, float))
+        ):
+            indexes.append(index)
+        else:
+            values[index] = animation.get_value()
+
+    if len(indexes) <= 0:
+        return values
+    #
+    # Pack the parameters into arrays. Targets and modulos that aren't set are
+    # given placeholder values and masked out.
+    batch = [animations[index] for index in indexes]
+    hasModulo = numpy.array(
+        [not (animation.modulo is None or animation.modulo == 0)
+         for animation in batch])
+    nowValue, reached = _evaluate(
+        numpy.array(
+            [animation.nowTime for animation in batch], dtype=numpy.float64)
+        , numpy.array(
+            [animation.startTime for animation in batch], dtype=numpy.float64)
+        , numpy.array(
+            [animation.speed for animation in batch], dtype=numpy.float64)
+        , numpy.array(
+            [animation.startValue for animation in batch], dtype=numpy.float64)
+        , numpy.array(
+            [0.0 if animation.targetValue is None else animation.targetValue
+             for animation in batch], dtype=numpy.float64)
+        , numpy.array(
+            [animation.targetValue is not None for animation in batch])
+        , numpy.where(hasModulo, numpy.array(
+            [1.0 if animation.modulo is None else animation.modulo
+             for animation in batch], dtype=numpy.float64), 1.0)
+        , hasModulo)
+    #
+    # Scatter the results. The value of a completed animation is its target
+    # value, as is, in case it's an int.
+    for index, animation, nowValue, complete in zip(
+        indexes, batch, nowValue.tolist(), reached.tolist()
+    ):
+        if complete:
+            values[index] = animation.targetValue
+            animation._completeTime = animation.nowTime
+        else:
+            values[index] = nowValue
+    return values
+
+class AnimationBatch(object):
+    """\
+    Set of Animation instances that are evaluated together, see evaluate(). The
+    parameters of the animations are packed into NumPy arrays when they are
+    added, and packed again by an animation whenever one of its parameters is
+    set, so the arrays aren't rebuilt for every evaluation.
+
+    Each animation is added with a key, which must be hashable, for example its
+    path in a store. The key can be used to remove the animation, and is
+    returned by finished().
+
+    Raises ImportError on construction if NumPy isn't available.
+    """
+    # Rows of the parameter array, and of the flag array.
+    _startTimeRow, _speedRow, _startRow, _targetRow, _moduloRow = range(5)
+    (_liveRow, _activeRow, _batchableRow, _intTimesRow, _hasTargetRow
+     , _hasModuloRow) = range(6)
+
+    # Below this number of animations that can be evaluated in the arrays, it's
+    # quicker to call get_value() for each one.
+    vectorMinimum = 16
+
+    def __len__(self):
+        return len(self._indexes)
+
+    def __contains__(self, key):
+        return key in self._indexes
+
+    def get(self, key):
+        """Get the animation that was added with key, or None."""
+        index = self._indexes.get(key)
+        return None if index is None else self._animations[index]
+
+    def add(self, animation, key):
+        """\
+        Add an animation, and pack its parameters. If there is already an
+        animation with the same key, it is removed first. An animation can only
+        be in one batch at a time.
+        """
+        if animation._batch is not None:
+            raise ValueError("Animation is already in a batch.")
+        self.remove(key)
+        index = len(self._animations)
+        if index >= self._parameters.shape[1]:
+            self._parameters = numpy.concatenate(
+                (self._parameters, numpy.zeros(self._parameters.shape))
+                , axis=1)
+            self._flags = numpy.concatenate(
+                (self._flags, numpy.zeros(self._flags.shape, dtype=bool))
+                , axis=1)
+        self._animations.append(animation)
+        self._keys.append(key)
+        self._indexes[key] = index
+        animation._batch = self
+        animation._batchIndex = index
+        self.pack(animation)
+
+    def remove(self, key):
+        """\
+        Remove the animation that was added with key, if there is one, and
+        return it. Returns None otherwise.
+        """
+        index = self._indexes.pop(key, None)
+        if index is None:
+            return None
+        animation = self._animations[index]
+        animation._batch = None
+        animation._batchIndex = None
+        #
+        # The slot is left empty, so that the others don't move. The slots are
+        # compacted when at least half of them are empty.
+        self._animations[index] = None
+        self._keys[index] = None
+        self._flags[:, index] = False
+        if len(self._indexes) * 2 <= len(self._animations):
+            self._compact()
+        return animation
+
+    def clear(self):
+        """Remove all the animations."""
+        for animation in self._animations:
+            if animation is not None:
+                animation._batch = None
+                animation._batchIndex = None
+        self._animations = []
+        self._keys = []
+        self._indexes = {}
+        self._parameters = numpy.zeros((5, 16))
+        self._flags = numpy.zeros((6, 16), dtype=bool)
+
+    def _compact(self):
+        keep = [
+            index for index, animation in enumerate(self._animations)
+            if animation is not None]
+        self._parameters = self._parameters[:, keep]
+        self._flags = self._flags[:, keep]
+        self._animations = [self._animations[index] for index in keep]
+        self._keys = [self._keys[index] for index in keep]
+        for index, animation in enumerate(self._animations):
+            animation._batchIndex = index
+            self._indexes[self._keys[index]] = index
+        if self._parameters.shape[1] < 16:
+            self._parameters = numpy.concatenate((
+                self._parameters
+                , numpy.zeros((5, 16 - self._parameters.shape[1]))), axis=1)
+            self._flags = numpy.concatenate((
+                self._flags
+                , numpy.zeros((6, 16 - self._flags.shape[1]), dtype=bool))
+                , axis=1)
+
+    def pack(self, animation):
+        """\
+        Pack the parameters of an animation in this batch. Animation setters
+        call this, so it only needs to be called after changing an animation
+        some other way.
+        """
+        index = animation._batchIndex
+        startTime = animation._startTime
+        speed = animation._speed
+        start = animation._startValue
+        target = animation._targetValue
+        modulo = animation._modulo
+        batchable = (
+            _batchable(startTime) and _batchable(speed) and _batchable(start)
+            and _batchable(target, True) and _batchable(modulo, True))
+        flags = self._flags
+        flags[self._liveRow, index] = True
+        flags[self._activeRow, index] = not (
+            animation._completeTime is not None or animation._stopped)
+        flags[self._batchableRow, index] = batchable
+        if not batchable:
+            return
+        hasModulo = not (modulo is None or modulo == 0)
+        # If the increment would be an int in Python, the value could be an int
+        # too, unless the now time is a float.
+        flags[self._intTimesRow, index] = not (
+            isinstance(startTime, float) or isinstance(speed, float))
+        flags[self._hasTargetRow, index] = target is not None
+        flags[self._hasModuloRow, index] = hasModulo
+        self._parameters[:, index] = (
+            startTime, speed, start, 0.0 if target is None else target
+            , modulo if hasModulo else 1.0)
+
+    def evaluate(self, nowTime):
+        """\
+        Set the now time of every active animation, i.e. every one that isn't
+        complete or stopped, and get its value. Doesn't apply the values. Sets
+        the completion time of any animation that has reached its target, in
+        the same way as get_value(). Returns a tuple of a list of the active
+        animations and a list of their values, in the order in which they were
+        added.
+
+        Animations whose parameters can't be evaluated exactly in floating
+        point, for example because the start time hasn't been set, are
+        evaluated by calling get_value() instead, as are all the animations if
+        there are fewer than vectorMinimum that can be evaluated in the arrays.
+        """
+        count = len(self._animations)
+        flags = self._flags[:, :count]
+        active = flags[self._activeRow]
+        indexes = numpy.flatnonzero(active).tolist()
+        if len(indexes) <= 0:
+            return [], []
+        if _batchable(nowTime):
+            vectorised = active & flags[self._batchableRow]
+            if not isinstance(nowTime, float):
+                vectorised &= ~flags[self._intTimesRow]
+            vectorCount = numpy.count_nonzero(vectorised)
+        else:
+            vectorCount = 0
+        if vectorCount >= self.vectorMinimum:
+            parameters = self._parameters[:, :count]
+            nowValues, reached = _evaluate(
+                nowTime, parameters[self._startTimeRow]
+                , parameters[self._speedRow], parameters[self._startRow]
+                , parameters[self._targetRow], flags[self._hasTargetRow]
+                , parameters[self._moduloRow], flags[self._hasModuloRow])
+            vectorised = vectorised.tolist()
+            nowValues = nowValues.tolist()
+            reached = reached.tolist()
+        else:
+            vectorised = None
+
+        animations = self._animations
+        evaluated = []
+        values = []
+        for index in indexes:
+            animation = animations[index]
+            if vectorised is not None and vectorised[index]:
+                # The start time has been set, so setting the now time has no
+                # side effects.
+                animation._nowTime = nowTime
+                if reached[index]:
+                    # The value of a completed animation is its target value,
+                    # as is, in case it's an int.
+                    value = animation._targetValue
+                    animation._completeTime = nowTime
+                else:
+                    value = nowValues[index]
+            else:
+                # Setting the now time could set the start time, which packs
+                # the animation again.
+                Animation.nowTime.fset(animation, nowTime)
+                value = animation.get_value()
+            if animation._completeTime is not None:
+                self._flags[self._activeRow, index] = False
+            evaluated.append(animation)
+            values.append(value)
+        return evaluated, values
+
+    def finished(self):
+        """\
+        Get a list of tuples of the key and the animation, for every animation
+        that is complete or stopped, in the order in which they were added.
+        """
+        count = len(self._animations)
+        flags = self._flags[:, :count]
+        return [
+            (self._keys[index], self._animations[index]) for index
+            in numpy.flatnonzero(
+                flags[self._liveRow] & ~flags[self._activeRow]).tolist()]
+
+    def active(self):
+        """\
+        Get a list of the animations that aren't complete or stopped, in the
+        order in which they were added.
+        """
+        count = len(self._animations)
+        return [
+            self._animations[index] for index
+            in numpy.flatnonzero(self._flags[self._activeRow, :count]).tolist()]
+
+    def __init__(self):
+        if numpy is None:
+            raise ImportError("NumPy is required for AnimationBatch.")
+        self._animations = []
+        self.clear()
@@ -0,0 +1,201 @@
+#!/usr/bin/python
+# (c) 2018 Jim Hawkins. MIT licensed, see https://opensource.org/licenses/MIT
+# Part of Blender Driver, see https://github.com/sjjhsjjh/blender-driver
+"""\
+Path Store benchmark package. Benchmarks can be run like:
+
+    python3 -m path_store.benchmark
+    python3 -m path_store.benchmark --output baseline.json
+    python3 -m path_store.benchmark --compare baseline.json get replace
+
+A benchmark is a function that sets up a workload and returns a callable to be
+timed. It is registered with the benchmark decorator, which also takes the
+parameters to run it with. For example:
+
+    @benchmark('get.deep', depth=(4, 16, 64))
+    def get_deep(depth):
+        principal = ...
+        return lambda: pathstore.get(principal, path)
+
+Each combination of parameters is a separate result, with a name like
+"get.deep[depth=16]". A workload that changes the store, for example a delete,
+can return a tuple of a setup callable and a timed callable instead. The setup
+is then called before every call of the timed callable, outside the timing, and
+its return value is passed to the timed callable.
+
+Cannot be run as a program, sorry. Run the package instead, as above."""
+
+# Standard library imports, in alphabetic order.
+#
+# Module for the date and time of the results.
+# https://docs.python.org/3/library/datetime.html
+import datetime
+#
+# Module for generating the combinations of parameters.
+# https://docs.python.org/3/library/itertools.html
+import itertools
+#
+# Module for JavaScript Object Notation (JSON) strings.
+# https://docs.python.org/3.5/library/json.html
+import json
+#
+# Module for the platform description in the results.
+# https://docs.python.org/3/library/platform.html
+import platform
+#
+# Module for the median of the timings.
+# https://docs.python.org/3/library/statistics.html
+import statistics
+#
+# Module for perf_counter.
+# https://docs.python.org/3/library/time.html
+import time
+
+# Version of the results JSON format.
+FORMAT = 1
+
+class Benchmark(object):
+    def __init__(self, name, function, parameters):
+        self.name = name
+        self.function = function
+        # Dictionary of parameter name to tuple of values.
+        self.parameters = parameters
+
+    def cases(self):
+        """\
+        Generator of tuples of the full name and the parameters dictionary, for
+        every combination of the parameter values.
+        """
+        names = sorted(self.parameters.keys())
+        for values in itertools.product(
+            *(self.parameters[name] for name in names)
+        ):
+            parameters = dict(zip(names, values))
+            yield case_name(self.name, parameters), parameters
+
+_benchmarks = []
+
+def benchmark(name, **parameters):
+    """\
+    Decorator that registers a benchmark function. Each keyword parameter is a
+    sequence of values for the function parameter with the same name.
+    """
+    def register(function):
+        _benchmarks.append(Benchmark(name, function, dict(
+            (key, tuple(values)) for key, values in parameters.items())))
+        return function
+    return register
+
+def benchmarks():
+    """All the registered benchmarks, in the order in which they were
+    registered."""
+    return tuple(_benchmarks)
+
+def case_name(name, parameters):
+    if len(parameters) == 0:
+        return name
+    return "{}[{}]".format(name, ",".join(
+        "{}={}".format(key, parameters[key]) for key in sorted(parameters)))
+
+def measure(workload, seconds=0.2, repeat=5):
+    """\
+    Time a workload, which is the return value of a benchmark function. The
+    number of loops is chosen so that one repeat takes about the specified
+    number of seconds. Returns a dictionary with the number of loops and
+    repeats, and the best, median, and mean time of one call in seconds.
+    """
+    if isinstance(workload, tuple):
+        setup, run = workload
+        def timed(loops):
+            total = 0.0
+            for loop in range(loops):
+                state = setup()
+                start = time.perf_counter()
+                run(state)
+                total += time.perf_counter() - start
+            return total
+    else:
+        run = workload
+        def timed(loops):
+            iterations = itertools.repeat(None, loops)
+            start = time.perf_counter()
+            for _ in iterations:
+                run()
+            return time.perf_counter() - start
+    #
+    # Find the number of loops, like timeit.Timer.autorange().
+    loops = 1
+    while True:
+        elapsed = timed(loops)
+        if elapsed >= seconds / 10.0 or loops >= 1 << 24:
+            break
+        loops *= 10
+    loops = max(1, int(loops * seconds / max(elapsed, 1e-9)))
+
+    times = [timed(loops) / loops for index in range(repeat)]
+    return {
+        'loops': loops,
+        'repeat': repeat,
+        'best': min(times),
+        'median': statistics.median(times),
+        'mean': statistics.mean(times)}
+
+def run(selection=None, seconds=0.2, repeat=5, report=None):
+    """\
+    Run the registered benchmarks, or only those with a name that starts with
+    one of the strings in selection. The report callable, if any, is passed the
+    name and result of each case as it finishes. Returns the results dictionary,
+    which can be saved as JSON.
+    """
+    results = {}
+    for benchmark_ in _benchmarks:
+        if selection and not any(
+            benchmark_.name.startswith(selected) for selected in selection
+        ):
+            continue
+        for name, parameters in benchmark_.cases():
+            result = measure(
+                benchmark_.function(**parameters), seconds, repeat)
+            results[name] = result
+            if report is not None:
+                report(name, result)
+    return {
+        'format': FORMAT,
+        'created': datetime.datetime.now().isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': results}
+
+def save(results, path):
+    with open(path, 'w') as file_:
+        json.dump(results, file_, indent=2, sort_keys=True)
+
+def load(path):
+    with open(path) as file_:
+        results = json.load(file_)
+    if results.get('format') != FORMAT:
+        raise ValueError('Unsupported benchmark results format in "{}".'.format(
+            path))
+    return results
+
+def compare(baseline, current, threshold=0.1, statistic='best'):
+    """\
+    Compare two results dictionaries. Returns a list of tuples of the case
+    name, the baseline time, the current time, and the ratio of current to
+    baseline, for the cases that are in both, sorted by name. Also returns a
+    list of the names of the cases that regressed, which are those that got
+    slower by more than the threshold, as a fraction of the baseline.
+    """
+    comparisons = []
+    regressions = []
+    baselineResults = baseline['results']
+    for name, result in sorted(current['results'].items()):
+        if name not in baselineResults:
+            continue
+        before = baselineResults[name][statistic]
+        after = result[statistic]
+        ratio = after / before if before > 0 else float('inf')
+        comparisons.append((name, before, after, ratio))
+        if ratio > 1.0 + threshold:
+            regressions.append(name)
+    return comparisons, regressions
@@ -0,0 +1,84 @@
+#!/usr/bin/python
+# (c) 2018 Jim Hawkins. MIT licensed, see https://opensource.org/licenses/MIT
+# Part of Blender Driver, see https://github.com/sjjhsjjh/blender-driver
+"""Path Store benchmark script. Run like:
+
+    python3 -m path_store.benchmark --help
+"""
+
+# Standard library imports, in alphabetic order.
+#
+# Module for command line switches.
+# https://docs.python.org/3/library/argparse.html
+import argparse
+#
+# Module for the exit status.
+# https://docs.python.org/3/library/sys.html
+import sys
+#
+# Local imports.
+#
+# Benchmark framework, and the modules that register the benchmarks.
+from path_store import benchmark
+from path_store.benchmark import core, restinterface
+
+def report(name, result):
+    print("{:<60} {:>12.3f} us {:>10} loops".format(
+        name, result['best'] * 1e6, result['loops']))
+
+if __name__ == '__main__':
+    argumentParser = argparse.ArgumentParser(
+        prog="python3 -m path_store.benchmark", description=
+        "Run path store benchmarks, and optionally compare them with a"
+        " baseline. The exit status is the number of regressions.")
+    argumentParser.add_argument(
+        '-o', '--output', type=str, help=
+        "Path of a JSON file to which to write the results.")
+    argumentParser.add_argument(
+        '-c', '--compare', type=str, help=
+        "Path of a JSON file of baseline results with which to compare.")
+    argumentParser.add_argument(
+        '-t', '--threshold', type=float, default=0.1, help=
+        "Slowdown, as a fraction of the baseline, above which a benchmark is"
+        " flagged as a regression. Default: 0.1.")
+    argumentParser.add_argument(
+        '-s', '--seconds', type=float, default=0.2, help=
+        "Approximate duration of one repeat of a benchmark. Default: 0.2.")
+    argumentParser.add_argument(
+        '-r', '--repeat', type=int, default=5, help=
+        "Number of repeats of each benchmark. Default: 5.")
+    argumentParser.add_argument(
+        '-l', '--list', action='store_true', help=
+        "List the benchmarks instead of running them.")
+    argumentParser.add_argument(
+        'benchmarks', nargs='*', type=str, help=
+        "Prefixes of the names of the benchmarks to run, for example get or"
+        " rest.put. Default is to run all.")
+    arguments = argumentParser.parse_args()
+
+    if arguments.list:
+        for benchmark_ in benchmark.benchmarks():
+            for name, parameters in benchmark_.cases():
+                print(name)
+        sys.exit(0)
+
+    baseline = (
+        None if arguments.compare is None else benchmark.load(
+            arguments.compare))
+    results = benchmark.run(
+        arguments.benchmarks, arguments.seconds, arguments.repeat, report)
+    if arguments.output is not None:
+        benchmark.save(results, arguments.output)
+
+    regressions = []
+    if baseline is not None:
+        comparisons, regressions = benchmark.compare(
+            baseline, results, arguments.threshold)
+        print()
+        for name, before, after, ratio in comparisons:
+            print("{:<60} {:>12.3f} us {:>12.3f} us {:>7.2f}x{}".format(
+                name, before * 1e6, after * 1e6, ratio
+                , " REGRESSION" if name in regressions else ""))
+        print("{} compared, {} regressions.".format(
+            len(comparisons), len(regressions)))
+    sys.exit(len(regressions))
@@ -0,0 +1,140 @@
+#!/usr/bin/python
+# (c) 2018 Jim Hawkins. MIT licensed, see https://opensource.org/licenses/MIT
+# Part of Blender Driver, see https://github.com/sjjhsjjh/blender-driver
+"""Path Store benchmark module for the core pathstore functions.
+
+Cannot be run as a program, sorry."""
+# Exit if run other than as a module.
+if __name__ == '__main__':
+    print(__doc__)
+    raise SystemExit(1)
+
+# Local imports.
+#
+# Benchmark registration.
+from path_store.benchmark import benchmark
+#
+# Module under test.
+from path_store import pathstore
+
+class Node(object):
+    # Object with attributes, for the mixed trees.
+    def __init__(self, **attributes):
+        for name, value in attributes.items():
+            setattr(self, name, value)
+
+def deep_dictionary(depth):
+    # Get a tuple of a dictionary that is nested depth levels deep, and the path
+    # to the value at the bottom.
+    path = tuple('key{}'.format(level) for level in range(depth))
+    principal = 0
+    for leg in reversed(path):
+        principal = {leg: principal}
+    return principal, path
+
+def mixed_tree(width):
+    # Dictionary of lists of objects, which have list and dictionary
+    # attributes, like a scene of game objects.
+    return {'root': {'objects': [
+        Node(
+            name='object{}'.format(index),
+            position=[float(index), 0.0, 0.0],
+            physics=False,
+            properties={'mass': 1.0, 'tags': ['a', 'b']})
+        for index in range(width)]}}
+
+def mixed_path(width):
+    return pathstore.CompiledPath(
+        ('root', 'objects', width // 2, 'position', 1))
+
+@benchmark('get.deep', depth=(4, 16, 64), compiled=(False, True))
+def get_deep(depth, compiled):
+    principal, path = deep_dictionary(depth)
+    if compiled:
+        path = pathstore.CompiledPath(path)
+    return lambda: pathstore.get(principal, path)
+
+@benchmark('get.wide', width=(10, 1000, 100000))
+def get_wide(width):
+    principal = {'list': list(range(width))}
+    path = pathstore.CompiledPath(('list', width - 1))
+    return lambda: pathstore.get(principal, path)
+
+@benchmark('get.slice', width=(10, 1000))
+def get_slice(width):
+    principal = {'list': list(range(width))}
+    path = pathstore.CompiledPath.split('list/1:-1')
+    return lambda: pathstore.get(principal, path)
+
+@benchmark('get.mixed', width=(10, 1000))
+def get_mixed(width):
+    principal = mixed_tree(width)
+    path = mixed_path(width)
+    return lambda: pathstore.get(principal, path)
+
+@benchmark('replace.deep', depth=(4, 16, 64))
+def replace_deep(depth):
+    principal, path = deep_dictionary(depth)
+    path = pathstore.CompiledPath(path)
+    return lambda: pathstore.replace(principal, 1, path)
+
+@benchmark('replace.mixed', width=(10, 1000))
+def replace_mixed(width):
+    principal = mixed_tree(width)
+    path = mixed_path(width)
+    return lambda: pathstore.replace(principal, 1.5, path)
+
+@benchmark('replace.slice', width=(10, 1000))
+def replace_slice(width):
+    principal = {'list': [[0.0, 0.0, 0.0] for index in range(width)]}
+    path = pathstore.CompiledPath.split('list/:/1')
+    return lambda: pathstore.replace(principal, 1.5, path)
+
+@benchmark('merge.mixed', width=(10, 1000))
+def merge_mixed(width):
+    principal = mixed_tree(width)
+    path = pathstore.CompiledPath(('root', 'objects', width // 2))
+    value = {'position': [1.0, 2.0, 3.0], 'properties': {'mass': 2.0}}
+    return lambda: pathstore.merge(principal, value, path)
+
+@benchmark('merge.wide', width=(10, 1000))
+def merge_wide(width):
+    principal = {'list': [0] * width}
+    value = list(range(width))
+    return lambda: pathstore.merge(principal, value, 'list')
+
+@benchmark('walk.mixed', width=(10, 1000), iterative=(False, True))
+def walk_mixed(width, iterative):
+    principal = mixed_tree(width)
+    walk = pathstore.walk_iterative if iterative else pathstore.walk
+    def editor(point, path, results):
+        return None
+    return lambda: walk(principal, editor)
+
+@benchmark('walk.wide', width=(1000,), iterative=(False, True))
+def walk_wide(width, iterative):
+    principal = {'list': list(range(width))}
+    walk = pathstore.walk_iterative if iterative else pathstore.walk
+    def editor(point, path, results):
+        return None
+    return lambda: walk(principal, editor)
+
+@benchmark('delete.wide', width=(10, 1000))
+def delete_wide(width):
+    # Deletes the last item, after putting it back.
+    principal = {'list': list(range(width))}
+    path = pathstore.CompiledPath(('list', width - 1))
+    items = principal['list']
+    def setup():
+        if len(items) < width:
+            items.append(width - 1)
+    return setup, lambda state: pathstore.delete(principal, path)
+
+@benchmark('delete.deep', depth=(4, 16, 64))
+def delete_deep(depth):
+    principal, path = deep_dictionary(depth)
+    path = pathstore.CompiledPath(path)
+    holder = pathstore.get(principal, path[:-1])
+    def setup():
+        holder[path[-1]] = 0
+    return setup, lambda state: pathstore.delete(principal, path)
@@ -0,0 +1,118 @@
+#!/usr/bin/python
+# (c) 2018 Jim Hawkins. MIT licensed, see https://opensource.org/licenses/MIT
+# Part of Blender Driver, see https://github.com/sjjhsjjh/blender-driver
+"""Path Store benchmark module for the RestInterface classes.
+
+Cannot be run as a program, sorry."""
+# Exit if run other than as a module.
+if __name__ == '__main__':
+    print(__doc__)
+    raise SystemExit(1)
+
+# Standard library imports, in alphabetic order.
+#
+# Module for the counter that advances the animation time.
+# https://docs.python.org/3/library/itertools.html
+import itertools
+#
+# Local imports.
+#
+# Benchmark registration, and the mixed trees.
+from path_store.benchmark import benchmark
+from path_store.benchmark.core import Node
+#
+# Modules under test.
+from path_store import animation
+from path_store import rest
+
+def scene(objects):
+    # Get a RestInterface with a number of objects like game objects, all of
+    # which are in the generic store.
+    interface = rest.RestInterface()
+    for index in range(objects):
+        interface.rest_put(Node(
+            name='object{}'.format(index),
+            worldPosition=[float(index), 0.0, 0.0],
+            physics=False,
+            properties={'mass': 1.0}), ('root', 'objects', index))
+    interface.rest_get(('root', 'objects'))
+    for index in range(objects):
+        for name in ('name', 'worldPosition', 'physics', 'properties'):
+            interface.rest_get(('root', 'objects', index, name))
+    interface.get_generic()
+    return interface
+
+@benchmark('rest.get', objects=(10, 1000))
+def rest_get(objects):
+    interface = scene(objects)
+    path = ('root', 'objects', objects // 2, 'worldPosition', 1)
+    return lambda: interface.rest_get(path)
+
+@benchmark('rest.put', objects=(10, 1000))
+def rest_put(objects):
+    interface = scene(objects)
+    path = ('root', 'objects', objects // 2, 'worldPosition')
+    return lambda: interface.rest_put([1.0, 2.0, 3.0], path)
+
+@benchmark('rest.set', objects=(10, 1000))
+def rest_set(objects):
+    interface = scene(objects)
+    path = ('root', 'objects', objects // 2, 'worldPosition', 1)
+    return lambda: interface.rest_set(2.0, path)
+
+@benchmark('rest.patch', objects=(10, 1000))
+def rest_patch(objects):
+    interface = scene(objects)
+    path = ('root', 'objects', objects // 2)
+    value = {'worldPosition': [1.0, 2.0, 3.0], 'properties': {'mass': 2.0}}
+    return lambda: interface.rest_patch(value, path)
+
+@benchmark('get_generic.clean', objects=(10, 1000))
+def get_generic_clean(objects):
+    # Nothing changed since the last refresh.
+    interface = scene(objects)
+    return lambda: interface.get_generic()
+
+@benchmark('get_generic.dirty', objects=(10, 1000), changed=(1, 'all'))
+def get_generic_dirty(objects, changed):
+    # Some or all of the objects changed since the last refresh.
+    interface = scene(objects)
+    indexes = range(objects if changed == 'all' else changed)
+    paths = tuple(('root', 'objects', index, 'worldPosition', 0)
+                  for index in indexes)
+    def setup():
+        for path in paths:
+            interface.mark_dirty(path)
+    return setup, lambda state: interface.get_generic()
+
+@benchmark('publish_snapshot', objects=(10, 1000), changed=(0, 1))
+def publish_snapshot(objects, changed):
+    interface = scene(objects)
+    interface.publish_snapshot()
+    path = ('root', 'objects', 0, 'worldPosition', 0)
+    def setup():
+        if changed:
+            interface.rest_set(1.0, path)
+    return setup, lambda state: interface.publish_snapshot()
+
+@benchmark(
+    'set_now_times', animations=(10, 1000)
+    , batch=(False, True) if animation.batch_available() else (False,))
+def set_now_times(animations, batch):
+    # Animation-heavy tick, in which none of the animations completes.
+    interface = rest.AnimatedRestInterface()
+    interface.batchAnimations = batch
+    for index in range(animations):
+        interface.rest_put(
+            Node(worldPosition=[0.0, 0.0, 0.0])
+            , ('root', 'subjects', index))
+        interface.rest_put({
+            'subjectPath': ('root', 'subjects', index),
+            'valuePath': ('root', 'subjects', index, 'worldPosition', 0),
+            'startValue': 0.0,
+            'speed': 1.0,
+            'targetValue': 1e9
+        }, ('animations', 'benchmark', index))
+        interface.rest_get(('animations', 'benchmark', index)).startTime = 0.0
+    times = itertools.count(1)
+    return lambda: interface.set_now_times(next(times) * 0.001)
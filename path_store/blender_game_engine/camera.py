@@ -31,6 +31,11 @@ from math import atan2, degrees, radians, fabs, fmod, pi
 # http://www.blender.org/api/blender_python_api_current/mathutils.html
 # They're super-effective!
 from mathutils import Vector, Matrix, Quaternion
+#
+# Local imports.
+#
+# Path Store module for the guards on debug logging in the hot paths.
+from path_store import logguard
 
 _TwoPI = pi * 2.0
 
@@ -169,8 +174,9 @@ def get_camera_subclass(bge, GameObject):
             # -   atan(zero) is zero.
             # -   atan(infinity) is 90 degrees.
             rotz = atan2(oy, ox) - radians(90.0)
-            log(DEBUG, 'ox {:.2f} {:.2f} {:.2f}'
-                , ox, oy/ox if ox < 0.0 or ox > 0.0 else oy, degrees(rotz))
+            if __debug__ and logguard.debug:
+                log(DEBUG, 'ox {:.2f} {:.2f} {:.2f}'
+                    , ox, oy/ox if ox < 0.0 or ox > 0.0 else oy, degrees(rotz))
             #
             # Rotate the offset about the Z axis in such a way that the X offest
             # will be zero. This is necessary to normalise the X axis rotation
@@ -179,7 +185,8 @@ def get_camera_subclass(bge, GameObject):
             # normalisation has the effect of moving the target along a line of
             # latitude on the sphere.
             worldv.rotate(Matrix.Rotation(rotz * -1.0, 4, 'Z'))
-            log(DEBUG, 'normz {} {:.2f}', worldv, degrees(rotz * -1.0))
+            if __debug__ and logguard.debug:
+                log(DEBUG, 'normz {} {:.2f}', worldv, degrees(rotz * -1.0))
             #
             # Reset the convenience variables, from the normalised offset vector.
             # X offset will always be zero in the adjusted vector.
@@ -199,12 +206,14 @@ def get_camera_subclass(bge, GameObject):
             # value, if oy is negative? I haven't found one.
             if oy < 0.0:
                 rotx = radians(90.0) - atan2(oz, oy)
-                log(DEBUG, 'oy negative {:.2f} {:.2f} {:.2f} {:.2f}'
-                    , oz, oy, degrees(atan2(oz, oy)), degrees(rotx))
+                if __debug__ and logguard.debug:
+                    log(DEBUG, 'oy negative {:.2f} {:.2f} {:.2f} {:.2f}'
+                        , oz, oy, degrees(atan2(oz, oy)), degrees(rotx))
             else:
                 rotx = radians(90.0) + atan2(oz, oy)
-                log(DEBUG, 'oy positive {:.2f} {:.2f} {:.2f} {:.2f}'
-                    , oz, oy, degrees(atan2(oz, oy)), degrees(rotx))
+                if __debug__ and logguard.debug:
+                    log(DEBUG, 'oy positive {:.2f} {:.2f} {:.2f} {:.2f}'
+                        , oz, oy, degrees(atan2(oz, oy)), degrees(rotx))
             
             # This calculation generates two values that are suitable to apply
             # in the order X rotation, then Z rotation. The default Euler order
@@ -213,8 +222,9 @@ def get_camera_subclass(bge, GameObject):
             #
             # Apply the values, either directly or by animation.
             self._apply_rotation(rotx, 0.0, rotz)
-            log(DEBUG, 'New rotation {:.2f} {:.2f} {:.2f} {:.2f}'
-                , rotx, degrees(rotx), rotz, degrees(rotz))
+            if __debug__ and logguard.debug:
+                log(DEBUG, 'New rotation {:.2f} {:.2f} {:.2f} {:.2f}'
+                    , rotx, degrees(rotx), rotz, degrees(rotz))
             
             return True
         
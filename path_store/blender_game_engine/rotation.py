@@ -140,6 +140,21 @@ class RotationXYZ(object):
     def fromIdentity(self, fromIdentity):
         self._fromIdentity = fromIdentity
 
+    @property
+    def deferred(self):
+        """\
+        If True, setting items doesn't compose and set the orientation of the
+        host until flush() is called, deferred is set to False, or the items
+        are deleted. Items set in the meantime are composed and decomposed
+        together, as if they had been set with one slice.
+        """
+        return self._deferred
+    @deferred.setter
+    def deferred(self, deferred):
+        self._deferred = deferred
+        if not deferred:
+            self.flush()
+
     def __setitem__(self, specifier, value):
         if not self._setting:
             self._get_base()
@@ -153,27 +168,59 @@ class RotationXYZ(object):
         else:
             self._set1(specifier, value)
         
+        self._pending = True
+        if not self._deferred:
+            self.flush()
+
+    def flush(self):
+        """Compose and set the orientation, if items have been set since."""
+        self._pendingDimensions.clear()
+        if not self._pending:
+            return
+        self._pending = False
         orientation = (self._orientationIdentity.copy() if self.fromIdentity
                        else self._base.copy())
         if self.fromIdentity:
             for dimension, rotation in enumerate(self._setCache):
-                orientation.rotate(Quaternion(self.axes[dimension], rotation))
+                orientation.rotate(self._axis_quaternion(dimension, rotation))
         else:
             for piece in self._pieces:
-                orientation.rotate(Quaternion(
-                    self.axes[piece.dimension], piece.radians))
+                if piece.quaternion is None:
+                    piece.quaternion = Quaternion(
+                        self.axes[piece.dimension], piece.radians)
+                orientation.rotate(piece.quaternion)
 
         self._decomposed = _decompose(orientation)
         # Next line is a super fudge to replace the setCache every tick.
         # self._setCache = list(self._decomposed)
         self._set_orientation(orientation)
 
+    def _axis_quaternion(self, dimension, rotation):
+        # Quaternion for a rotation about one axis, cached for each axis until
+        # the rotation about it changes.
+        cached = self._axisQuaternions[dimension]
+        if cached is None or cached[0] != rotation:
+            cached = (rotation, Quaternion(self.axes[dimension], rotation))
+            self._axisQuaternions[dimension] = cached
+        return cached[1]
+
     def _set1(self, dimension, value):
         needPiece = True
-        increment = value - self._decomposed[dimension]
+        # The first set of a dimension since the last flush takes its increment
+        # from the decomposed orientation, same as a slice. While items are
+        # deferred, a later set of the same dimension takes it from the value
+        # that is pending instead, because the orientation hasn't been composed
+        # and decomposed since.
+        if dimension in self._pendingDimensions:
+            increment = value - self._setCache[dimension]
+        else:
+            increment = value - self._decomposed[dimension]
+            self._pendingDimensions.add(dimension)
         for piece in self._pieces:
             if piece.dimension == dimension:
-                piece.radians += increment
+                if increment != 0.0:
+                    piece.radians += increment
+                    piece.quaternion = None
                 needPiece = False
                 break
         
@@ -181,12 +228,14 @@ class RotationXYZ(object):
             piece = self._RotationPiece()
             piece.dimension = dimension
             piece.radians = increment
+            piece.quaternion = None
             self._pieces.append(piece)
 
         self._setCache[dimension] = value
     
     def __delitem__(self, specifier):
         # print('rotation.__delitem__({}) {}'.format(specifier, self))
+        self.flush()
         
         # Following line means that the next getitem or setitem will _get_base
         self._setting = False
@@ -215,6 +264,10 @@ class RotationXYZ(object):
         self._pieces = []
 
         self._setting = False
+        self._deferred = False
+        self._pending = False
+        self._pendingDimensions = set()
+        self._axisQuaternions = [None, None, None]
         self._get_base()
         
         self._orientationIdentity = self._base.copy()
@@ -256,6 +309,40 @@ class Rotation(object):
     @property
     def euler(self):
         return self._get_euler()
+
+    @property
+    def matrix(self):
+        """\
+        Rotation matrix of the current rotation, which is cached until the
+        rotation changes. Don't modify it.
+        """
+        if self._matrix is None:
+            self._matrix = self._get_euler().to_matrix()
+        return self._matrix
+
+    @property
+    def quaternion(self):
+        """\
+        Quaternion of the current rotation, which is cached until the rotation
+        changes. Don't modify it.
+        """
+        if self._quaternion is None:
+            self._quaternion = self.matrix.to_quaternion()
+        return self._quaternion
+
+    @property
+    def deferred(self):
+        """\
+        If True, setting items doesn't set the orientation of the host until
+        flush() is called, deferred is set to False, or the items are deleted.
+        Use it to set several axes one at a time, with one orientation set.
+        """
+        return self._deferred
+    @deferred.setter
+    def deferred(self, deferred):
+        self._deferred = deferred
+        if not deferred:
+            self.flush()
     
     @property
     def order(self):
@@ -305,7 +392,16 @@ class Rotation(object):
             self._set1(specifier, value)
         
         # print('__setitem__', self._euler)
-        self._set_orientation(self._euler.to_matrix())
+        self._pending = True
+        if not self._deferred:
+            self.flush()
+
+    def flush(self):
+        """Set the orientation of the host, if items have been set since."""
+        if self._pending:
+            self._pending = False
+            # The host could keep and modify the matrix, so it gets a copy.
+            self._set_orientation(self.matrix.copy())
     
     def _set1(self, dimension, value):
         # The increment code works if the value was set like this:
@@ -317,15 +413,22 @@ class Rotation(object):
         # increment = value - self._get_euler(None)[dimension]
         # euler = self._get_euler(dimension)
         # self._euler[dimension] += increment
-        self._get_euler()[dimension] = value
+        euler = self._get_euler()
+        if euler[dimension] != value:
+            euler[dimension] = value
+            self._matrix = None
+            self._quaternion = None
         self._setCache[dimension] = value
 
     def __delitem__(self, specifier):
         # Discard the Euler when anything is deleted. This will force getting a
         # new Euler on the next access. The new Euler should have the same order
         # as the last Euler, so save that before deleting the Euler.
+        self.flush()
         self._savedOrder = self._get_euler().order[:]
         self._euler = None
+        self._matrix = None
+        self._quaternion = None
         self._setCache = None
         
     def __init__(self, get_orientation, set_orientation):
@@ -335,4 +438,8 @@ class Rotation(object):
         self._euler = None
         self._savedOrder = None
         self._setCache = None
+        self._matrix = None
+        self._quaternion = None
+        self._deferred = False
+        self._pending = False
         self._listLength = len(self._get_euler())
@@ -16,6 +16,10 @@ if __name__ == '__main__':
 # https://docs.python.org/3.5/library/enum.html
 from enum import Enum
 #
+# Module for weak references to the observers of InterceptProperty instances.
+# https://docs.python.org/3/library/weakref.html
+import weakref
+#
 # Local imports, would go here.
 
 class HostedProperty(property):
@@ -172,7 +176,18 @@ class InterceptProperty(property):
     
     This subclass is used in the Blender Driver project to make Blender Game
     Enginer (BGE) Vector properties mutable.
+    
+    Every time a destination is set, by setting the property or one of its
+    items, the intercept_changed(instance) method of every object in the
+    observers class attribute is called.
     """
+
+    observers = weakref.WeakSet()
+
+    @classmethod
+    def _changed(cls, instance):
+        for observer in tuple(cls.observers):
+            observer.intercept_changed(instance)
     
     class _PropertyInstance(object):
         """Inner class of which an instance is set in order to implement
@@ -207,6 +222,7 @@ class InterceptProperty(property):
         def __setattr__(self, name, value):
             attr = self._destination_getter(self._instance)
             attr.__setattr__(name, value)
+            InterceptProperty._changed(self._instance)
             
         def __len__(self):
             return self._destination_getter(self._instance).__len__()
@@ -218,6 +234,7 @@ class InterceptProperty(property):
             attr = self._destination_getter(self._instance)
             try:
                 attr.__setitem__(specifier, value)
+                InterceptProperty._changed(self._instance)
                 return
             except AttributeError:
                 # The Vector type in Blender Game Engine raises this error.
@@ -236,6 +253,7 @@ class InterceptProperty(property):
             attr = self._destination_getter(self._instance)
             try:
                 attr.__delitem__(specifier)
+                InterceptProperty._changed(self._instance)
                 return
             except AttributeError:
                 pass
@@ -249,6 +267,48 @@ class InterceptProperty(property):
                 mutable = ''.join(str(_) for _ in mutable)
             self._intercept_setter(self._instance, mutable)
 
+        def item_setter(self, specifier):
+            """\
+            Get a callable that sets the item at specifier to the value passed
+            to it, with the same effect as setting the item in this instance.
+            Whether the destination can be set at the item level, or has to be
+            copied into a list, is resolved from its type now, without setting
+            anything. A destination that has __setitem__ but is read only, like
+            a Vector in Blender Game Engine, is found out by the first call,
+            after which the callable copies instead.
+            """
+            instance = self._instance
+            destination_getter = self._destination_getter
+            intercept_setter = self._intercept_setter
+            attr = destination_getter(instance)
+            isStr = attr.__class__ is str
+
+            def set_copy(value):
+                mutable = list(destination_getter(instance))
+                mutable[specifier] = value
+                if isStr:
+                    mutable = ''.join(str(_) for _ in mutable)
+                intercept_setter(instance, mutable)
+
+            if not hasattr(attr.__class__, '__setitem__'):
+                return set_copy
+
+            copying = False
+            def set_item(value):
+                nonlocal copying
+                if not copying:
+                    try:
+                        destination_getter(instance)[specifier] = value
+                    except AttributeError:
+                        # The Vector type in Blender Game Engine raises this
+                        # error.
+                        copying = True
+                    else:
+                        InterceptProperty._changed(instance)
+                        return
+                set_copy(value)
+            return set_item
+
         # ToDo: Decide whether to have bypass always, never, or sometimes.
         # def bypass(self):
         #     return self._destination_getter(self._instance)
@@ -294,6 +354,7 @@ class InterceptProperty(property):
                 value = self._destinationPropertyClass(value)
 
         self._destination_setter(instance, value)
+        self._changed(instance)
 
     def delete(self, instance):
         self._intercept_deleter(instance)
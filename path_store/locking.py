@@ -0,0 +1,339 @@
+#!/usr/bin/python
+# (c) 2018 Jim Hawkins. MIT licensed, see https://opensource.org/licenses/MIT
+# Part of Blender Driver, see https://github.com/sjjhsjjh/blender-driver
+"""\
+Path Store module for locking parts of a path store.
+
+A PathLocks instance has a reader-writer lock for the whole store, and one for
+each of a number of subtrees, for example the animations and the game objects.
+Readers of any part of the store can proceed together. A writer only blocks the
+subtree that it writes, unless it writes outside all the subtrees, in which
+case it blocks the whole store. Time spent waiting for locks is counted for each
+owner, for example the tick or the REST API.
+
+Cannot be run as a program, sorry."""
+# Exit if run other than as a module.
+if __name__ == '__main__':
+    print(__doc__)
+    raise SystemExit(1)
+
+# Standard library imports, in alphabetic order.
+#
+# Module for Condition and Lock classes.
+# https://docs.python.org/3/library/threading.html
+import threading
+#
+# Module for perf_counter.
+# https://docs.python.org/3/library/time.html
+import time
+#
+# Local imports.
+#
+# Path Store module.
+try:
+    import path_store.pathstore
+    pathstore = path_store.pathstore
+except ImportError:
+    import pathstore
+
+class ReadWriteLock(object):
+    """\
+    Lock that can be held by any number of readers, or by one writer. Once a
+    writer is waiting, new readers wait too, so that a stream of readers can't
+    hold off a writer for ever. Not re-entrant.
+
+    The acquire methods return the number of seconds that were spent waiting,
+    which is zero if the lock was acquired straight away, or None if the lock
+    wasn't acquired because blocking was False.
+    """
+    @property
+    def writes(self):
+        """Number of times the lock has been acquired by a writer."""
+        return self._writes
+
+    def acquire_read(self, blocking=True):
+        with self._condition:
+            if not (self._writer or self._writersWaiting > 0):
+                self._readers += 1
+                return 0.0
+            if not blocking:
+                return None
+            start = time.perf_counter()
+            while self._writer or self._writersWaiting > 0:
+                self._condition.wait()
+            self._readers += 1
+            return time.perf_counter() - start
+
+    def release_read(self):
+        with self._condition:
+            self._readers -= 1
+            if self._readers == 0:
+                self._condition.notify_all()
+
+    def acquire_write(self, blocking=True):
+        with self._condition:
+            if not (self._writer or self._readers > 0):
+                self._writer = True
+                self._writes += 1
+                return 0.0
+            if not blocking:
+                return None
+            start = time.perf_counter()
+            self._writersWaiting += 1
+            try:
+                while self._writer or self._readers > 0:
+                    self._condition.wait()
+            finally:
+                self._writersWaiting -= 1
+            self._writer = True
+            self._writes += 1
+            return time.perf_counter() - start
+
+    def release_write(self):
+        with self._condition:
+            self._writer = False
+            self._condition.notify_all()
+
+    def __init__(self):
+        self._condition = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = False
+        self._writersWaiting = 0
+        self._writes = 0
+
+class Contention(object):
+    """\
+    Counters for the acquisitions of the locks by one owner, in one mode.
+    """
+    def add(self, waited):
+        self.acquisitions += 1
+        if waited > 0.0:
+            self.contended += 1
+            self.waitSeconds += waited
+            if waited > self.maxWaitSeconds:
+                self.maxWaitSeconds = waited
+
+    def generic(self):
+        return {
+            'acquisitions': self.acquisitions,
+            'contended': self.contended,
+            'waitSeconds': self.waitSeconds,
+            'maxWaitSeconds': self.maxWaitSeconds}
+
+    def __init__(self):
+        self.acquisitions = 0
+        self.contended = 0
+        self.waitSeconds = 0.0
+        self.maxWaitSeconds = 0.0
+
+class _Held(object):
+    # Context manager for a set of locks, which are acquired in order on entry,
+    # and released in reverse order on exit. The first lock is the lock for the
+    # whole store.
+    def __enter__(self):
+        waited = 0.0
+        acquired = []
+        try:
+            for lock, write in self._locks:
+                waited += (
+                    lock.acquire_write() if write else lock.acquire_read())
+                acquired.append((lock, write))
+        except:
+            self._release(acquired)
+            raise
+        self._contention.add(waited)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._release(self._locks)
+        return False
+
+    @staticmethod
+    def _release(locks):
+        for lock, write in reversed(locks):
+            if write:
+                lock.release_write()
+            else:
+                lock.release_read()
+
+    def __init__(self, locks, contention):
+        self._locks = locks
+        self._contention = contention
+
+class _StoreLock(object):
+    # Adaptor that gives a write lock on the whole store the same interface as
+    # a threading.Lock instance, so that it can be used in place of one.
+    def acquire(self, blocking=True):
+        waited = self._lock.acquire_write(blocking)
+        if waited is None:
+            return False
+        self._contention.add(waited)
+        return True
+
+    def release(self):
+        self._lock.release_write()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
+        return False
+
+    def __init__(self, lock, contention):
+        self._lock = lock
+        self._contention = contention
+
+class PathLocks(object):
+    """\
+    Locks for a path store, with a separate lock for each of a number of
+    subtrees. Locking works like this.
+
+    -   Reading or writing a point in a subtree read locks the whole store and
+        read or write locks the subtree.
+    -   Reading a point that is above one or more subtrees also read locks those
+        subtrees.
+    -   Writing a point that isn't in a subtree write locks the whole store.
+
+    Locks are always acquired in the same order, the whole store first, so
+    holding several can't cause a deadlock. A path that has pathstore.Selector
+    legs is locked as if it ended just before the first Selector.
+    """
+    @property
+    def subtrees(self):
+        return tuple(self._subtrees)
+
+    @property
+    def storeLock(self):
+        """\
+        Object with the same interface as a threading.Lock instance, that write
+        locks the whole store.
+        """
+        return self._storeLock
+
+    def subtree(self, path):
+        """\
+        Get the subtree that contains a path, or None if the path isn't in any
+        subtree.
+        """
+        path = self._prefix(path)
+        for subtree in self._subtrees:
+            if path[:len(subtree)] == subtree:
+                return subtree
+        return None
+
+    def covers(self, lockedPaths, paths):
+        """\
+        Check whether write locks for lockedPaths would also cover writing to
+        all of paths.
+        """
+        subtrees = set()
+        for path in lockedPaths:
+            subtree = self.subtree(path)
+            if subtree is None:
+                return True
+            subtrees.add(subtree)
+        for path in paths:
+            if self.subtree(path) not in subtrees:
+                return False
+        return True
+
+    def writes(self, path):
+        """\
+        Number of times that the lock for the subtree that contains a path, or
+        for the whole store, has been write locked.
+        """
+        subtree = self.subtree(path)
+        return self._store.writes + (
+            0 if subtree is None else self._subtrees[subtree].writes)
+
+    def read(self, *paths, owner=None):
+        """\
+        Get a context manager that read locks all of paths, and counts the
+        time spent waiting under owner.
+        """
+        return self._held(paths, False, owner)
+
+    def write(self, *paths, owner=None):
+        """\
+        Get a context manager that write locks all of paths, and counts the
+        time spent waiting under owner.
+        """
+        return self._held(paths, True, owner)
+
+    @property
+    def contention(self):
+        """\
+        Generic dictionary of the lock contention counters. Has a dictionary
+        for each owner, which has an item for each of "read" and "write", with
+        the number of acquisitions, the number that had to wait, and the total
+        and longest waits in seconds.
+        """
+        with self._contentionLock:
+            return {
+                owner: {
+                    mode: contention.generic()
+                    for mode, contention in modes.items()}
+                for owner, modes in self._contention.items()}
+
+    def _prefix(self, path):
+        path = tuple(pathstore.pathify(path))
+        for index, leg in enumerate(path):
+            if isinstance(leg, pathstore.Selector):
+                return path[:index]
+        return path
+
+    def _counter(self, owner, mode):
+        with self._contentionLock:
+            modes = self._contention.setdefault(owner, {})
+            contention = modes.get(mode)
+            if contention is None:
+                contention = Contention()
+                modes[mode] = contention
+            return contention
+
+    def _held(self, paths, write, owner):
+        store = self._store
+        subtrees = set()
+        for path in paths:
+            path = self._prefix(path)
+            subtree = self.subtree(path)
+            if subtree is not None:
+                subtrees.add(subtree)
+            elif write:
+                return _Held(
+                    ((store, True),)
+                    , self._counter(owner, 'write'))
+            else:
+                # Reading above some subtrees reads them too.
+                for subtree in self._subtrees:
+                    if subtree[:len(path)] == path:
+                        subtrees.add(subtree)
+        #
+        # Iterate the subtrees dictionary, which is in a fixed order, so that
+        # locks are always acquired in the same order.
+        locks = [(store, False)]
+        locks.extend(
+            (lock, write) for subtree, lock in self._subtrees.items()
+            if subtree in subtrees)
+        return _Held(locks, self._counter(owner, 'write' if write else 'read'))
+
+    def __init__(self, subtrees=()):
+        self._subtrees = {}
+        for subtree in subtrees:
+            subtree = tuple(pathstore.pathify(subtree))
+            for other in self._subtrees:
+                if (
+                    other[:len(subtree)] == subtree
+                    or subtree[:len(other)] == other
+                ):
+                    raise ValueError(
+                        'Subtree {} overlaps subtree {}.'.format(
+                            subtree, other))
+            self._subtrees[subtree] = ReadWriteLock()
+        self._contentionLock = threading.Lock()
+        self._contention = {}
+        self._store = ReadWriteLock()
+        self._storeLock = _StoreLock(
+            self._store, self._counter('store', 'write'))
@@ -0,0 +1,52 @@
+#!/usr/bin/python
+# (c) 2018 Jim Hawkins. MIT licensed, see https://opensource.org/licenses/MIT
+# Part of Blender Driver, see https://github.com/sjjhsjjh/blender-driver
+"""Path Store logging guard module.
+
+Hot paths, like the descent in pathstore, guard their debug log calls like this:
+
+    from path_store import logguard
+    ...
+    if __debug__ and logguard.debug:
+        log(DEBUG, "path[{:d}] {}.", index, str_quote(leg))
+
+When DEBUG is disabled, the guard is a single attribute check, and none of the
+arguments are evaluated. When Python is run with the -O switch, or with the
+PYTHONOPTIMIZE environment variable set, __debug__ is False and the compiler
+drops the guarded calls altogether.
+
+The guards are set from the level of the root logger when this module is
+imported, and whenever refresh() is called. Code that changes the logging level
+should call refresh() afterwards. The blender_driver.loggingutils
+initialise_logging() function does that.
+
+Cannot be run as a program, sorry."""
+# Exit if run other than as a module.
+if __name__ == '__main__':
+    print(__doc__)
+    raise SystemExit(1)
+
+# Standard library imports, in alphabetic order.
+#
+# Module for levelled logging messages.
+# Tutorial is here: https://docs.python.org/3.5/howto/logging.html
+# Reference is here: https://docs.python.org/3.5/library/logging.html
+from logging import DEBUG, INFO, getLogger
+
+# Guards, which are set by refresh().
+debug = False
+info = False
+
+def refresh(logger=None):
+    """\
+    Set the guards from the effective level of a logger, by default the root
+    logger, which is the one that logging.log() uses. Returns the debug guard.
+    """
+    global debug, info
+    if logger is None:
+        logger = getLogger()
+    debug = logger.isEnabledFor(DEBUG)
+    info = logger.isEnabledFor(INFO)
+    return debug
+
+refresh()
@@ -15,6 +15,10 @@ if __name__ == '__main__':
 
 # Standard library imports, in alphabetic order.
 #
+# Module for abstract base classes, used for the Selector base class.
+# https://docs.python.org/3/library/abc.html
+import abc
+#
 # Module that facilitates container subclasses.
 # https://docs.python.org/3/library/collections.html#collections.UserList
 import collections
@@ -25,10 +29,24 @@ import collections
 # https://docs.python.org/3.5/library/enum.html
 from enum import Enum
 #
+# Module for JavaScript Object Notation (JSON) strings, used to parse the values
+# in predicate selectors.
+# https://docs.python.org/3.5/library/json.html
+import json
+#
 # Module for levelled logging messages.
 # Tutorial is here: https://docs.python.org/3.5/howto/logging.html
 # Reference is here: https://docs.python.org/3.5/library/logging.html
 from logging import DEBUG, INFO, WARNING, ERROR, log
+#
+# Local imports.
+#
+# Path Store module for the guards on debug logging in the hot paths.
+try:
+    import path_store.logguard
+    logguard = path_store.logguard
+except ImportError:
+    import logguard
 
 def str_quote(str_, quote='"'):
     """Utility to add quotes to strings, but just stringify non-strings."""
@@ -42,6 +60,175 @@ class PointType(Enum):
     DICTIONARY = 2
     ATTR = 3
 
+class LegType(Enum):
+    STRING = 1
+    NUMBER = 2
+    SLICE = 3
+    SELECTOR = 4
+
+def leg_type(leg):
+    """\
+    Get the pathstore.LegType value for a path leg. Anything that isn't a
+    string, a slice, or a Selector is treated as a number, like descend() does.
+    """
+    if isinstance(leg, str):
+        return LegType.STRING
+    if isinstance(leg, slice):
+        return LegType.SLICE
+    if isinstance(leg, Selector):
+        return LegType.SELECTOR
+    return LegType.NUMBER
+
+class Selector(abc.ABC):
+    """\
+    Abstract base class for path legs that can match any number of points. A
+    path with Selector legs can be passed to select(), but not to get() and the
+    other subroutines that navigate to a single point.
+    
+    In a joined path, as passed to pathify_split(), the selectors are written
+    as follows.
+    
+    -   `*` for Wildcard.
+    -   `**` for RecursiveWildcard.
+    -   `[key=value]` or `[key!=value]` for Predicate. A predicate can also be
+        appended to another leg, for example `*[physics=true]`.
+    """
+    @abc.abstractmethod
+    def select(self, point):
+        """\
+        Generator of tuples for the points that this leg matches, starting from
+        point. In each tuple:
+        
+        0.  Tuple of the path legs from point to the matched point.
+        1.  The matched point.
+        """
+
+    def _identity(self):
+        return ()
+
+    def __eq__(self, other):
+        return (
+            type(self) is type(other) and self._identity() == other._identity())
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash((type(self), self._identity()))
+
+    def __repr__(self):
+        return "".join((self.__class__.__name__, "(", ", ".join(
+            repr(item) for item in self._identity()), ")"))
+
+class Wildcard(Selector):
+    """\
+    Selector leg that matches every item in a list or dictionary, except items
+    that are None.
+    """
+    def select(self, point):
+        try:
+            items = iterify(point)[1]
+        except TypeError:
+            return
+        for leg, item in items:
+            if item is not None:
+                yield (leg,), item
+
+    def __str__(self):
+        return "*"
+
+class RecursiveWildcard(Selector):
+    """\
+    Selector leg that matches a point, and every point under it in lists and
+    dictionaries, except points that are None. Each point is matched once, even
+    if it can be reached by more than one path.
+    """
+    def select(self, point, seen=None):
+        """\
+        Same as Selector.select() but, optionally, seen can be a set of the
+        id() values of points that have been matched already, and shouldn't be
+        matched again. It is updated.
+        """
+        if point is None:
+            return
+        if seen is None:
+            seen = set()
+        stack = [((), point)]
+        while len(stack) > 0:
+            legs, point = stack.pop()
+            try:
+                items = iterify(point)[1]
+            except TypeError:
+                items = None
+            if items is not None:
+                if id(point) in seen:
+                    continue
+                seen.add(id(point))
+            yield legs, point
+            if items is not None:
+                # Reverse so that the first item is popped first.
+                stack.extend(reversed(tuple(
+                    (legs + (leg,), item) for leg, item in items
+                    if item is not None)))
+
+    def __str__(self):
+        return "**"
+
+class Predicate(Selector):
+    """\
+    Selector leg that matches a point if the point has a key or attribute with a
+    specified value, or if it doesn't, when negate is True. Doesn't descend.
+    """
+    @property
+    def key(self):
+        return self._key
+
+    @property
+    def value(self):
+        return self._value
+
+    @property
+    def negate(self):
+        return self._negate
+
+    def select(self, point):
+        if point is None:
+            return
+        pointType, item, error = descend(point, self._key)
+        if (pointType is not None and item == self._value) is not self._negate:
+            yield (), point
+
+    @classmethod
+    def parse(cls, text):
+        """\
+        Construct from text like `key=value` or `key!=value`. The value is
+        parsed as JSON if possible, or is taken as a string otherwise.
+        """
+        key, separator, value = text.partition("!=")
+        negate = separator != ""
+        if not negate:
+            key, separator, value = text.partition("=")
+            if separator == "":
+                raise ValueError(
+                    "Predicate has no value {}.".format(str_quote(text)))
+        try:
+            value = json.loads(value)
+        except ValueError:
+            pass
+        return cls(key, value, negate)
+
+    def _identity(self):
+        return self._key, self._value, self._negate
+
+    def __str__(self):
+        return "[{}{}{}]".format(
+            self._key, "!=" if self._negate else "=", json.dumps(self._value))
+
+    def __init__(self, key, value, negate=False):
+        self._key = key
+        self._value = value
+        self._negate = bool(negate)
+
 def pathify(path):
     """\
     Generator that returns values suitable for path store navigation:
@@ -75,12 +262,160 @@ def pathify_split(joined, sep='/', skip=0):
         if skip > 0:
             skip -= 1
             continue
-        try:
-            yield int(leg)
-        except ValueError:
-            slicers = leg.split(':', 2)
-            yield leg if len(slicers) <= 1 else slice(*list(
-                None if slicer == "" else int(slicer) for slicer in slicers))
+        yield from _split_leg(leg)
+
+def _split_leg(leg):
+    if leg == "*":
+        yield Wildcard()
+        return
+    if leg == "**":
+        yield RecursiveWildcard()
+        return
+    bracket = leg.find("[")
+    if bracket >= 0 and leg.endswith("]"):
+        if bracket > 0:
+            yield from _split_leg(leg[:bracket])
+        for predicate in leg[bracket + 1:-1].split("]["):
+            yield Predicate.parse(predicate)
+        return
+    try:
+        yield int(leg)
+    except ValueError:
+        slicers = leg.split(':', 2)
+        yield leg if len(slicers) <= 1 else slice(*list(
+            None if slicer == "" else int(slicer) for slicer in slicers))
+
+class CompiledPath(tuple):
+    """\
+    Tuple of path legs that has been prepared for path store navigation in
+    advance. Instances can be passed as the path to get(), delete(), replace(),
+    merge(), and walk(). The work of pathify() and of checking each leg for a
+    slice is then done once, when the instance is constructed, instead of on
+    every call.
+    
+    Construct from anything that pathify() accepts, for example:
+    
+        CompiledPath(('root', 'gameObjects', 0, 'worldPosition', 2))
+    
+    Or from a joined string, by calling CompiledPath.split(), which takes the
+    same parameters as pathify_split().
+    
+    Like any tuple, an instance is immutable. An edit to a compiled path, for
+    example by path store replace() of one of its legs, results in a list copy.
+    """
+    def __new__(cls, path=None):
+        self = super().__new__(cls, pathify(path))
+        self._slices = tuple(
+            index for index, leg in enumerate(self) if isinstance(leg, slice))
+        self._selectors = tuple(
+            index for index, leg in enumerate(self)
+            if isinstance(leg, Selector))
+        #
+        # The internal functions in this module need a list, which is prepared
+        # here and never modified.
+        self._legList = list(self)
+        return self
+
+    @property
+    def legTypes(self):
+        """\
+        Tuple of pathstore.LegType values, one for each leg. Navigation only
+        needs the slices and selectors, so this is worked out when it is read.
+        """
+        return tuple(leg_type(leg) for leg in self)
+
+    @property
+    def slices(self):
+        """Tuple of the indexes of any legs that are slices."""
+        return self._slices
+
+    @property
+    def selectors(self):
+        """Tuple of the indexes of any legs that are Selector instances."""
+        return self._selectors
+
+    @classmethod
+    def split(cls, joined, sep='/', skip=0):
+        return cls(pathify_split(joined, sep, skip))
+
+    def __repr__(self):
+        return "".join((
+            self.__class__.__name__, "(", super().__repr__(), ")"))
+
+def compile_path(path):
+    """\
+    Get a CompiledPath for path, which is returned as is if it is a
+    CompiledPath already.
+    """
+    return path if isinstance(path, CompiledPath) else CompiledPath(path)
+
+def has_selector(path):
+    """True if any leg of path is a Selector, or False otherwise."""
+    if isinstance(path, CompiledPath):
+        return len(path._selectors) > 0
+    return any(isinstance(leg, Selector) for leg in pathify(path))
+
+def select(parent, path=None):
+    """\
+    Descend from the parent along a path that can contain Selector legs, as well
+    as slices and ordinary legs. Returns a list of tuples for the points that
+    match, in the order that they were reached. In each tuple:
+    
+    0.  CompiledPath to the point, with only string and numeric legs.
+    1.  The point.
+    
+    The store is traversed once, one leg at a time. Ordinary legs that can't be
+    descended, for example because a key isn't present, don't match anything
+    instead of raising an error.
+    """
+    frontier = [((), parent)]
+    for leg in pathify(path):
+        following = []
+        if isinstance(leg, Selector):
+            # A recursive selector can reach the same point from more than one
+            # point in the frontier. Containers are recognised by id() and
+            # other points by path.
+            recursive = isinstance(leg, RecursiveWildcard)
+            if recursive:
+                seenPoints = set()
+                seenPaths = set()
+            for legs, point in frontier:
+                for selectedLegs, selected in (
+                    leg.select(point, seenPoints) if recursive
+                    else leg.select(point)
+                ):
+                    selectedLegs = legs + selectedLegs
+                    if recursive:
+                        if selectedLegs in seenPaths:
+                            continue
+                        seenPaths.add(selectedLegs)
+                    following.append((selectedLegs, selected))
+        elif isinstance(leg, slice):
+            for legs, point in frontier:
+                try:
+                    indexes = range(*leg.indices(len(point)))
+                except TypeError:
+                    continue
+                following.extend(
+                    (legs + (index,), point[index]) for index in indexes)
+        else:
+            for legs, point in frontier:
+                if point is None:
+                    continue
+                pointType, item, error = descend(point, leg)
+                if pointType is not None:
+                    following.append((legs + (leg,), item))
+        frontier = following
+    return [(CompiledPath(legs), point) for legs, point in frontier]
+
+def _path_list(path):
+    # Returns a tuple of:
+    #
+    # -   List of the legs in the path, which mustn't be modified.
+    # -   Boolean for whether any leg could be a slice.
+    if isinstance(path, CompiledPath):
+        return path._legList, len(path._slices) > 0
+    return list(pathify(path)), True
 
 def iterify(source):
     """\
@@ -168,7 +503,9 @@ def get(parent, path=None):
     
     If path is None or empty, returns the parent.
     """
-    return parent if path is None else _get(parent, list(pathify(path)), False)
+    if path is None:
+        return parent
+    return _get(parent, *_path_list(path), delete=False)
 
 def delete(parent, path):
     """\
@@ -181,14 +518,17 @@ def delete(parent, path):
     If the holder of the specified point is None, returns the error that get()
     would have raised.
     """
-    return _get(parent, list(pathify(path)), True)
+    return _get(parent, *_path_list(path), delete=True)
 
-def _get(parent, path, delete):
+def _get(parent, path, sliced, delete):
     # It seemed like a nice idea to keep path as a generator for as long as
     # possible. However, to support embedded slices, it can be necessary to
     # repeat part of the descent. This means that it has to stop being a
     # generator at some point in the middle of the loop that is enumerating it,
     # which is bad. So now `path` has to be a list already.
+    #
+    # If `sliced` is False, the path is known not to contain any slices, from
+    # when it was compiled, and the legs needn't be checked.
 
     if delete:
         stop = len(path) - 1
@@ -201,7 +541,7 @@ def _get(parent, path, delete):
         if error is not None:
             raise error
         
-        if isinstance(leg, slice):
+        if sliced and isinstance(leg, slice):
             # Copy the end of the path, including the slice. The element that
             # holds the slice gets overwritten repeatedly.
             tail = path[index:]
@@ -209,7 +549,8 @@ def _get(parent, path, delete):
             deleteSlice = (delete and index >= stop)
             for sliceIndex in range(*leg.indices(len(parent))):
                 tail[0] = sliceIndex
-                points.append(_get(parent, tail, delete and not deleteSlice))
+                points.append(_get(
+                    parent, tail, sliced, delete and not deleteSlice))
             if deleteSlice:
                 parent.__delitem__(leg)
             return points
@@ -287,7 +628,8 @@ def walk(parent, editor, path=None, results=None, second=None
 
     If editor raises StopIteration, then the walk ends.
     """
-    log(DEBUG, "{} {} {}.", parent, editor, path)
+    if __debug__ and logguard.debug:
+        log(DEBUG, "{} {} {}.", parent, editor, path)
 
     # Inner function for recursive descent. Returns a tuple:
     #
@@ -322,7 +664,8 @@ def walk(parent, editor, path=None, results=None, second=None
         
         try:
             pointType, iterator = iterify(point)
-            log(DEBUG, "iterator {} {}.", point, walkPath, results)
+            if __debug__ and logguard.debug:
+                log(DEBUG, "iterator {} {}.", point, walkPath, results)
         except TypeError:
             iterator = None
 
@@ -361,12 +704,177 @@ def walk(parent, editor, path=None, results=None, second=None
     
     return parent
 
+# Dictionary of the type of iteration for types of point, used by
+# walk_iterative. Each value is a pathstore.PointType, or None if the type isn't
+# iterable.
+_iterableTypes = {}
+
+def _iterable_type(point):
+    # Returns the same pointType as iterify() would, or None instead of raising
+    # TypeError. Classification is cached by type, so that iterify() only has
+    # to be tried, and raise, once for each type of point.
+    type_ = type(point)
+    try:
+        return _iterableTypes[type_]
+    except KeyError:
+        pass
+    try:
+        pointType = iterify(point)[0]
+    except TypeError:
+        pointType = None
+    _iterableTypes[type_] = pointType
+    return pointType
+
+class _WalkFrame(object):
+    """Stack frame for walk_iterative, for one iterable point."""
+    def __init__(self):
+        self.point = None
+        self.pointType = None
+        self.iterator = None
+        self.second = None
+        self.wasTuple = False
+        self.replaced = False
+
+def walk_iterative(parent, editor, path=None, results=None, second=None
+                   , editIterable=False
+                   ):
+    """\
+    Walk engine that has the same parameters and behaviour as walk(), above, but
+    that uses an explicit stack instead of recursion.
+    
+    Stack frames are only created for iterable points, and are reused. Whether
+    a point is iterable is determined by its type, and is cached, so that there
+    is no exception handling for leaf points.
+    """
+    if __debug__ and logguard.debug:
+        log(DEBUG, "{} {} {}.", parent, editor, path)
+
+    walkPath = list(pathify(path))
+    point = get(parent, path)
+    secondPoint = None if second is None else get(second, path)
+
+    frames = []
+    depth = 0
+    #
+    # Outcome of the last point to be finished.
+    stopped = False
+    replaced = False
+    #
+    # Each iteration of the outer loop processes one point, then finishes as
+    # many points as possible.
+    while True:
+        #
+        # Process the point, which either makes it the top of the stack, or
+        # finishes it.
+        wasTuple = isinstance(point, tuple)
+        stopped = False
+        replaced = False
+        editorResult = None
+        if editIterable:
+            try:
+                if second is None:
+                    editorResult = editor(point, walkPath, results)
+                else:
+                    editorResult = editor(
+                        point, walkPath, results, secondPoint)
+            except StopIteration:
+                stopped = True
+            if not(editorResult is None or editorResult is False):
+                replaced, editorValue = editorResult
+                if replaced:
+                    point = editorValue
+
+        pointType = None if stopped else _iterable_type(point)
+        if pointType is None:
+            if not (stopped or editIterable):
+                try:
+                    if second is None:
+                        editorResult = editor(point, walkPath, results)
+                    else:
+                        editorResult = editor(
+                            point, walkPath, results, secondPoint)
+                except StopIteration:
+                    stopped = True
+                if not(editorResult is None or editorResult is False):
+                    replaced, editorValue = editorResult
+                    if replaced:
+                        point = editorValue
+        else:
+            if depth >= len(frames):
+                frames.append(_WalkFrame())
+            frame = frames[depth]
+            depth += 1
+            frame.point = point
+            frame.pointType = pointType
+            frame.iterator = iter(
+                point.items() if pointType is PointType.DICTIONARY
+                else enumerate(point))
+            frame.second = secondPoint
+            frame.wasTuple = wasTuple
+            frame.replaced = replaced
+        #
+        # Finish points, and deliver their outcomes to their parents, until
+        # there is a child point to process, or the walk is complete.
+        while True:
+            if pointType is not None:
+                # The point at the top of the stack is unfinished. Get its next
+                # child, if it has one.
+                frame = frames[depth - 1]
+                nextItem = next(frame.iterator, None)
+                if nextItem is not None:
+                    key, point = nextItem
+                    walkPath.append(key)
+                    if second is not None:
+                        secondPoint = descend(frame.second, key)[1]
+                    break
+                #
+                # No more children, so finish the top of the stack.
+                depth -= 1
+                point = frame.point
+                replaced = frame.replaced
+                if replaced and frame.wasTuple and isinstance(point, list):
+                    point = tuple(point)
+                frame.point = None
+                frame.iterator = None
+                frame.second = None
+            #
+            # The outcome of a finished point is in stopped, replaced, and
+            # point. If it is the top-level point, the walk is complete.
+            if depth <= 0:
+                if replaced:
+                    parent = replace(parent, point, path)
+                return parent
+            #
+            # Deliver the outcome to the parent, which is the top of the stack.
+            frame = frames[depth - 1]
+            key = walkPath.pop()
+            if stopped:
+                # The parent finishes too, without applying any replacement
+                # from the child.
+                depth -= 1
+                point = frame.point
+                replaced = frame.replaced
+                if replaced and frame.wasTuple and isinstance(point, list):
+                    point = tuple(point)
+                frame.point = None
+                frame.iterator = None
+                frame.second = None
+                pointType = None
+                continue
+            if replaced:
+                assigned, frame.point = _set(
+                    frame.point, key, point, frame.pointType)
+                if assigned:
+                    frame.replaced = True
+            pointType = frame.pointType
+
 def make_point(specifier, point=None):
     """\
     Make or create a suitable point that can hold specifier. If a point is
     specified as input, the new point is based on it.
     """
-    log(DEBUG, "{} {}.", specifier, point)
+    if __debug__ and logguard.debug:
+        log(DEBUG, "{} {}.", specifier, point)
     if specifier is None:
         return point
     elif isinstance(specifier, str):
@@ -408,7 +916,8 @@ def make_point(specifier, point=None):
             return list(extension)
 
 def default_point_maker(path, index, point=None):
-    log(DEBUG, "{} {} {}.", path, index, point)
+    if __debug__ and logguard.debug:
+        log(DEBUG, "{} {} {}.", path, index, point)
     return make_point(path[index], point)
 
 def replace(parent, value, path=None, point_maker=default_point_maker):
@@ -419,8 +928,10 @@ def replace(parent, value, path=None, point_maker=default_point_maker):
     Elements on the path that don't exist will be created by invoking the
     point_maker.
     """
-    log(DEBUG, "{} {} {}.", parent, path, value)
-    return _insert(parent, list(pathify(path)), True, value, point_maker, 0)
+    if __debug__ and logguard.debug:
+        log(DEBUG, "{} {} {}.", parent, path, value)
+    pathList, sliced = _path_list(path)
+    return _insert(parent, pathList, True, value, point_maker, 0, sliced)
 
 def merge(parent, value, path=None, point_maker=default_point_maker):
     """\
@@ -430,10 +941,12 @@ def merge(parent, value, path=None, point_maker=default_point_maker):
     Elements on the path that don't exist will be created by invoking the
     point_maker.
     """
-    log(DEBUG, "{} {} {}.", parent, path, value)
-    return _insert(parent, list(pathify(path)), False, value, point_maker, 0)
+    if __debug__ and logguard.debug:
+        log(DEBUG, "{} {} {}.", parent, path, value)
+    pathList, sliced = _path_list(path)
+    return _insert(parent, pathList, False, value, point_maker, 0, sliced)
 
-def _insert(parent, path, replacing, value, point_maker, index):
+def _insert(parent, path, replacing, value, point_maker, index, sliced=True):
     try:
         legMaker = path[index]
         stopping = False
@@ -453,13 +966,13 @@ def _insert(parent, path, replacing, value, point_maker, index):
             # isn't iterable, _merge will discard the parent anyway.
             if parent is None or type(parent) is type(value):
                 return value
-        return _merge(parent, value, point_maker, path)
+        return _merge(parent, value, point_maker, path, sliced)
 
     wasTuple = isinstance(parent, tuple)
 
     legs = tuple(
         range(*legMaker.indices(len(parent)))
-        ) if isinstance(legMaker, slice) else (legMaker,)
+        ) if sliced and isinstance(legMaker, slice) else (legMaker,)
     for leg in legs:
         # path[index] = leg
         pointType, point, descendError = descend(parent, leg)
@@ -467,21 +980,24 @@ def _insert(parent, path, replacing, value, point_maker, index):
             # Sorry, hack to force descent into a string to fail if setting.
             point = None
         
-        log(DEBUG, "path[{:d}] {}\n  {}\n  {} {}\n  {}({})"
-            , index, str_quote(leg)
-            , parent
-            , str(pointType), str_quote(point)
-            , type(descendError).__name__, str(descendError))
+        if __debug__ and logguard.debug:
+            log(DEBUG, "path[{:d}] {}\n  {}\n  {} {}\n  {}({})"
+                , index, str_quote(leg)
+                , parent
+                , str(pointType), str_quote(point)
+                , type(descendError).__name__, str(descendError))
 
         if pointType is None or point is None:
             pathLen = len(path)
             makePath = (
                 path[:] if index < pathLen else
                 path + [None] * (index + 1 - pathLen))
-            log(DEBUG, "about to point_maker({}, {}, {})."
-                , makePath, index, parent)
+            if __debug__ and logguard.debug:
+                log(DEBUG, "about to point_maker({}, {}, {})."
+                    , makePath, index, parent)
             parent = point_maker(makePath, index, parent)
-            log(DEBUG, "made point {} {}.", parent, parent.__class__)
+            if __debug__ and logguard.debug:
+                log(DEBUG, "made point {} {}.", parent, parent.__class__)
             pointType, point, descendError = descend(parent, leg)
             if (pointType is None
                 and point is None
@@ -500,7 +1016,7 @@ def _insert(parent, path, replacing, value, point_maker, index):
 
         try:
             legValue = _insert(
-                point, path, replacing, value, point_maker, index + 1)
+                point, path, replacing, value, point_maker, index + 1, sliced)
         except:
             log(ERROR, 'Exception in _insert({}, {}, {}, {}, ,{})'
                 , point, path, replacing, value, index + 1)
@@ -509,15 +1025,17 @@ def _insert(parent, path, replacing, value, point_maker, index):
         didSet, parent = _set(parent, leg, legValue, pointType)
 
         if not didSet:
-            log(DEBUG, "setter optimised: {}.", pointType)
+            if __debug__ and logguard.debug:
+                log(DEBUG, "setter optimised: {}.", pointType)
 
     if wasTuple and isinstance(parent, list):
         parent = tuple(parent)
     
     return parent
 
-def _merge(parent, value, point_maker, pointMakerPath):
-    log(DEBUG, "{} {} {}.", parent, value, pointMakerPath)
+def _merge(parent, value, point_maker, pointMakerPath, sliced=True):
+    if __debug__ and logguard.debug:
+        log(DEBUG, "{} {} {}.", parent, value, pointMakerPath)
     if value is None:
         return parent
     try:
@@ -537,16 +1055,21 @@ def _merge(parent, value, point_maker, pointMakerPath):
     pathLen = len(path)
 
     for legKey, legValue in legIterator:
-        log(DEBUG, "iteration {} {}", str_quote(legKey), legValue)
+        if __debug__ and logguard.debug:
+            log(DEBUG, "iteration {} {}", str_quote(legKey), legValue)
         # Not sure about this so it's commented out. It seems that it could skip
         # the point maker if a value happens to be None.
         # if legValue is None:
         #     continue
         path.append(legKey)
-        parent = _insert(parent, path, False, legValue, point_maker, pathLen)
+        # The keys that get appended are never slices so the `sliced` flag from
+        # the original path still applies.
+        parent = _insert(
+            parent, path, False, legValue, point_maker, pathLen, sliced)
         path.pop()
 
-    log(DEBUG, "return {}.", parent)
+    if __debug__ and logguard.debug:
+        log(DEBUG, "return {}.", parent)
     return parent
 
 def _set(parent, key, value, pointType):
@@ -27,6 +27,14 @@ from enum import Enum
 # Reference is here: https://docs.python.org/3.5/library/logging.html
 from logging import DEBUG, INFO, WARNING, ERROR, log
 #
+# Module for the RLock class.
+# https://docs.python.org/3/library/threading.html
+import threading
+#
+# Module for perf_counter_ns, which times the completion processing.
+# https://docs.python.org/3/library/time.html
+import time
+#
 # Local imports.
 #
 # Path Store module.
@@ -36,6 +44,10 @@ try:
 except ImportError:
     import pathstore
 
+from path_store import logguard
+from path_store.accessor import AccessorCache
+from path_store.hosted import InterceptProperty
+from path_store import animation
 from path_store.animation import Animation
 from path_store.blender_game_engine.gameobjectcollection import \
     GameObjectDict, GameObjectList
@@ -76,6 +88,201 @@ def _generic_value(value):
     # dictionary.
     return {}
     
+def generic_copy(value):
+    """\
+    Copy a value from the generic store. Dictionaries and lists are copied all
+    the way down, and tuples become lists. Anything else is returned as is,
+    because it is immutable, or at least is treated that way by the generic
+    store. This is quicker than JSON serialisation, so it can be used to take a
+    snapshot that can be serialised later, without holding a lock.
+    """
+    if isinstance(value, (dict, collections.UserDict)):
+        return {key: generic_copy(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple, collections.UserList)):
+        return [generic_copy(item) for item in value]
+    return value
+
+_plainTypes = (
+    dict, list, tuple, str, int, float, bool, type(None)
+    , collections.UserList, collections.UserDict)
+
+def _is_object(value):
+    # Check whether a value in the principal is a class instance, which has a
+    # dictionary in the generic store, see _generic_value().
+    if isinstance(value, _plainTypes):
+        return False
+    try:
+        value[:]
+        return False
+    except (KeyError, TypeError):
+        return True
+
+def _has_prefix_in(path, paths):
+    # Check whether a path, or any path above it, is in a set of paths.
+    for index in range(len(path) + 1):
+        if path[:index] in paths:
+            return True
+    return False
+
+def _tree(paths):
+    # Make a tree of nested dictionaries from a collection of paths. The leaf
+    # for each path is True. A path that is under another path is left out. An
+    # empty path makes the whole tree True.
+    tree = {}
+    for path in sorted(paths, key=len):
+        if len(path) == 0:
+            return True
+        node = tree
+        for leg in path[:-1]:
+            child = node.get(leg)
+            if child is True:
+                break
+            if child is None:
+                child = {}
+                node[leg] = child
+            node = child
+        else:
+            node[path[-1]] = True
+    return tree
+
+def _share(value, previous, changed=True):
+    # Copy a value from the generic store, like generic_copy(), but reuse any
+    # part of a previous copy that is equal. If the whole value is equal, the
+    # previous copy is returned. If changed is a tree from _tree(), only the
+    # parts of value in the tree are compared. Everything else is assumed to be
+    # the same as in the previous copy.
+    if changed is not True:
+        if (
+            isinstance(value, (dict, collections.UserDict))
+            and isinstance(previous, dict)
+        ):
+            shared = None
+            for key, childChanged in changed.items():
+                if key in value:
+                    if key in previous:
+                        item = _share(value[key], previous[key], childChanged)
+                        if item is previous[key]:
+                            continue
+                    else:
+                        item = generic_copy(value[key])
+                    if shared is None:
+                        shared = dict(previous)
+                    shared[key] = item
+                elif key in previous:
+                    if shared is None:
+                        shared = dict(previous)
+                    del shared[key]
+            return previous if shared is None else shared
+        if (
+            isinstance(value, (list, tuple, collections.UserList))
+            and isinstance(previous, list)
+            and len(value) == len(previous)
+        ):
+            shared = None
+            for index, childChanged in changed.items():
+                if not (isinstance(index, int) and 0 <= index < len(value)):
+                    continue
+                item = _share(value[index], previous[index], childChanged)
+                if item is previous[index]:
+                    continue
+                if shared is None:
+                    shared = list(previous)
+                shared[index] = item
+            return previous if shared is None else shared
+        return _share(value, previous)
+
+    if isinstance(value, (dict, collections.UserDict)):
+        if not isinstance(previous, dict):
+            return generic_copy(value)
+        shared = {}
+        same = len(previous) == len(value)
+        for key, item in value.items():
+            if key in previous:
+                sharedItem = _share(item, previous[key])
+                same = same and sharedItem is previous[key]
+            else:
+                sharedItem = generic_copy(item)
+                same = False
+            shared[key] = sharedItem
+        return previous if same else shared
+    if isinstance(value, (list, tuple, collections.UserList)):
+        if not isinstance(previous, list):
+            return generic_copy(value)
+        shared = []
+        same = len(previous) == len(value)
+        for index, item in enumerate(value):
+            if index < len(previous):
+                sharedItem = _share(item, previous[index])
+                same = same and sharedItem is previous[index]
+            else:
+                sharedItem = generic_copy(item)
+            shared.append(sharedItem)
+        return previous if same else shared
+    if type(value) is type(previous) and value == previous:
+        return previous
+    return value
+
+def generic_changes(previous, value, path=()):
+    """\
+    Generator of the differences between two generic values, typically taken
+    from two GenericSnapshot instances. Parts that are the same object in both
+    are skipped without being compared, so the cost is proportional to the size
+    of the changes. Yields tuples of:
+    
+    -   Path, as a tuple, under the path parameter.
+    -   True if the point was deleted, or False otherwise.
+    -   New value of the point, or None if it was deleted.
+    """
+    if previous is value:
+        return
+    if isinstance(previous, dict) and isinstance(value, dict):
+        for key, item in value.items():
+            if key in previous:
+                yield from generic_changes(previous[key], item, path + (key,))
+            else:
+                yield path + (key,), False, item
+        for key in previous:
+            if key not in value:
+                yield path + (key,), True, None
+        return
+    if (
+        isinstance(previous, list) and isinstance(value, list)
+        and len(previous) == len(value)
+    ):
+        for index, item in enumerate(value):
+            yield from generic_changes(previous[index], item, path + (index,))
+        return
+    if type(previous) is type(value) and previous == value:
+        return
+    yield path, False, value
+
+class GenericSnapshot(object):
+    """\
+    Copy of the whole generic store, published by
+    RestInterface.publish_snapshot(). A snapshot is never changed after it has
+    been published, so it can be read and serialised without holding any lock.
+    Parts of it that didn't change are shared with the previous snapshot.
+    """
+    @property
+    def generic(self):
+        return self._generic
+
+    @property
+    def version(self):
+        """\
+        RestInterface version at the time the snapshot was published. If the
+        interface has a different version now, the structure of the store has
+        changed since.
+        """
+        return self._version
+
+    def get(self, path=None):
+        return pathstore.get(self._generic, path)
+
+    def __init__(self, generic, version):
+        self._generic = generic
+        self._version = version
+
 class RestInterface(object):
     """\
     Class for a RESTful interface onto a principal object, implemented by Path
@@ -86,9 +293,17 @@ class RestInterface(object):
         return self._principal
     
     def get_generic(self, path=None):
-        def populate(point, pathUnused, resultsUnused, second):
+        """\
+        Get the generic value at a path, after refreshing it from the principal.
+        Only the parts of the generic store that could have changed since they
+        were last refreshed are copied from the principal. See mark_dirty().
+        """
+        def populate(point, walkPath, resultsUnused, second):
             # The code makes use of _generic_value(second) but it's unclear that
             # this is necessary.
+            if _is_object(second):
+                self._objects[tuple(walkPath)] = second
+                self._objectPaths[id(second)] = tuple(walkPath)
             
             try:
                 pointType = pathstore.iterify(point)[0]
@@ -122,18 +337,164 @@ class RestInterface(object):
             return True, [] if secondType is pathstore.PointType.LIST else {}
         
         self.check('get_generic 0', path)
-        # Following will populate the generic structure from the principal
-        # structure, but only for paths that exist in the generic structure.
-        if self.principal is not None:
-            self._generic = pathstore.walk(self._generic, populate, path
-                                           , second=self.principal
-                                           , editIterable=True)
-
-        self.check('get_generic 1', path)
-        return_ = pathstore.get(self._generic, path)
+        with self._genericLock:
+            # Following will populate the generic structure from the principal
+            # structure, but only for paths that exist in the generic structure,
+            # and only under the dirty roots.
+            roots = self._take_dirty(tuple(pathstore.pathify(path)))
+            if self.principal is not None:
+                for root in roots:
+                    try:
+                        self._generic = pathstore.walk_iterative(
+                            self._generic, populate, root
+                            , second=self.principal, editIterable=True)
+                    except (IndexError, KeyError, TypeError):
+                        # The root isn't in the generic store, or isn't in the
+                        # principal any more. In either case, there's nothing to
+                        # populate.
+                        pass
+            self._changed.update(roots)
+
+            self.check('get_generic 1', path)
+            return_ = pathstore.get(self._generic, path)
         self.check('get_generic 2', path)
         return return_
     
+    def mark_dirty(self, path):
+        """\
+        Record that the principal could have changed at a path, so that the
+        generic store will be refreshed there by the next get_generic() of the
+        path, or of a path above or below it. The rest_ methods mark their own
+        paths. Call this after changing the principal some other way.
+        """
+        if not isinstance(path, tuple):
+            path = tuple(pathstore.pathify(path))
+        # Appending to a deque is thread-safe, so the generic lock isn't
+        # acquired here, which is on the animation hot path. Buffered paths are
+        # merged into the dirty set under one acquisition, by _merge_dirty().
+        buffer = self._dirtyBuffer
+        buffer.append(path)
+        if len(buffer) >= self._dirtyBufferLimit:
+            with self._genericLock:
+                self._merge_dirty()
+
+    def _merge_dirty(self):
+        # Call only while holding the generic lock. Move the buffered dirty
+        # paths into the dirty set. Paths appended by other threads while this
+        # runs are either moved now or left for the next merge.
+        buffer = self._dirtyBuffer
+        add = self._dirty.add
+        popleft = buffer.popleft
+        try:
+            for _ in range(len(buffer)):
+                add(popleft())
+        except IndexError:
+            pass
+
+    def volatile(self, point):
+        """\
+        Check whether an object in the principal can change other than through
+        this interface, in which case its generic value is refreshed every
+        time. Override in a subclass. The base class returns False.
+        """
+        return False
+
+    def intercept_changed(self, instance):
+        """\
+        Called by hosted.InterceptProperty when one of its properties is set in
+        an instance. If the instance has been seen in the principal, its path is
+        marked dirty.
+        """
+        path = self._objectPaths.get(id(instance))
+        if path is not None:
+            self.mark_dirty(path)
+
+    def _take_dirty(self, path):
+        # Call only while holding the generic lock. Get a list of the roots of
+        # the parts of the generic store under path that need to be refreshed,
+        # and remove the dirty paths that they cover. Each dirty path is first
+        # truncated at the first object in the principal. A dirty path that is
+        # then above path is kept, because only the part under path gets
+        # refreshed.
+        self._merge_dirty()
+        roots = set()
+        kept = set()
+        length = len(path)
+        for dirty in set(self._object_root(dirty) for dirty in self._dirty):
+            if dirty[:length] == path:
+                roots.add(dirty)
+            else:
+                kept.add(dirty)
+                if path[:len(dirty)] == dirty:
+                    roots.add(path)
+
+        for objectPath, object_ in self._objects.items():
+            if (
+                objectPath[:length] == path
+                or path[:len(objectPath)] == objectPath
+            ) and self.volatile(object_):
+                roots.add(max(objectPath, path, key=len))
+        #
+        # Remove roots that are under other roots. Roots are taken shortest
+        # first, so that a root is covered if any of its prefixes is already
+        # in the set.
+        covered = []
+        coveredSet = set()
+        for root in sorted(roots, key=len):
+            if not _has_prefix_in(root, coveredSet):
+                covered.append(root)
+                coveredSet.add(root)
+        self._dirty = set(
+            dirty for dirty in kept if not _has_prefix_in(dirty, coveredSet))
+        return covered
+
+    def _object_root(self, path):
+        # Truncate a path at the first object in the principal, if there is one,
+        # so that the whole object is refreshed. Changing one property of an
+        # object can change others.
+        point = self._principal
+        for index, leg in enumerate(path):
+            if _is_object(point):
+                return path[:index]
+            pointType, point, error = pathstore.descend(point, leg)
+            if error is not None:
+                break
+        return path
+
+    def _structure_changed(self, path, shifted=False):
+        # Bump the version and invalidate the accessors after a change to the
+        # structure of the principal at path. The generic lock is held so that
+        # a thread that holds it sees both changes or neither.
+        with self._genericLock:
+            self._version += 1
+            self._accessors.invalidate(self._principal, path, shifted)
+
+    def _remember(self, path):
+        # Remember the object at a path in the principal, as if it had been seen
+        # when populating the generic store. Returns whether there was one.
+        try:
+            object_ = pathstore.get(self._principal, path)
+        except (IndexError, KeyError, TypeError):
+            return False
+        if not _is_object(object_):
+            return False
+        with self._genericLock:
+            self._objects[path] = object_
+            self._objectPaths[id(object_)] = path
+        return True
+
+    def _forget(self, path):
+        # Forget the objects that were at or under a path.
+        if not isinstance(path, tuple):
+            path = tuple(pathstore.pathify(path))
+        length = len(path)
+        with self._genericLock:
+            for objectPath in [
+                objectPath for objectPath in self._objects
+                if objectPath[:length] == path
+            ]:
+                self._objectPaths.pop(id(self._objects.pop(objectPath)), None)
+
     def load_generic(self, value, path=None):
         path = tuple(pathstore.pathify(path))
 
@@ -141,7 +502,8 @@ class RestInterface(object):
             self._generic = pathstore.replace(
                 self._generic, None, path + tuple(walkPath))
 
-        pathstore.walk(value, populate)
+        with self._genericLock:
+            pathstore.walk(value, populate)
 
     def point_maker(self, path, index, point):
         """\
@@ -150,34 +512,247 @@ class RestInterface(object):
         """
         return pathstore.default_point_maker(path, index, point)
     
+    def rest_select(self, path):
+        """\
+        Get a list of (path, point) tuples for the points in the principal that
+        match a path, which can contain pathstore.Selector legs. See
+        pathstore.select(). Doesn't change the generic store.
+        """
+        return pathstore.select(self.principal, path)
+
+    def select_generic(self, path):
+        """\
+        Like rest_select() but each tuple has the generic value of the point,
+        which is added to the generic store if necessary.
+        """
+        selectedGenerics = []
+        for selected, point in self.rest_select(path):
+            self.rest_get(selected)
+            selectedGenerics.append((selected, self.get_generic(selected)))
+        return selectedGenerics
+
     def rest_patch(self, value, path=None):
+        if pathstore.has_selector(path):
+            for selected, point in self.rest_select(path):
+                self.rest_patch(value, selected)
+            return
         self._principal = pathstore.merge(
             self._principal, value, path, point_maker=self.point_maker)
+        self._structure_changed(path)
+        self._forget(path)
+        self.mark_dirty(path)
         self.load_generic(value, path)
 
     def rest_put(self, value, path=None):
+        if pathstore.has_selector(path):
+            for selected, point in self.rest_select(path):
+                self.rest_put(value, selected)
+            return
+        self._principal = pathstore.replace(
+            self._principal, value, path, point_maker=self.point_maker)
+        self._structure_changed(path)
+        self._forget(path)
+        with self._genericLock:
+            self._generic = pathstore.replace(
+                self._generic, _generic_value(value), path)
+            self.mark_dirty(path)
+
+    def rest_set(self, value, path):
+        """\
+        Set a value at a path that already exists, using the accessor cache if
+        possible. Intended for setting leaf values repeatedly, for example by
+        animation. If the value can't be set by using the cache, falls back to
+        a path store replace, like rest_put, but without updating the generic
+        store.
+        """
+        if self._accessors.set(self._principal, value, path):
+            self.mark_dirty(path)
+            return
         self._principal = pathstore.replace(
             self._principal, value, path, point_maker=self.point_maker)
-        self._generic = pathstore.replace(
-            self._generic, _generic_value(value), path)
+        self._structure_changed(path)
+        self._forget(path)
+        self.mark_dirty(path)
+
+    def rest_setter(self, path):
+        """\
+        Get a callable that sets a value at a path that already exists, like
+        rest_set(), but with the descent and the type of assignment resolved
+        now, so that each call is one bound assignment. Returns None if the
+        path can't be resolved in the accessor cache. The callable is only valid
+        until the version of the interface changes, after which a new one
+        should be got.
+        """
+        accessor = self._accessors.accessor(self._principal, path)
+        if accessor is None:
+            return None
+        setter = accessor.setter()
+        if not isinstance(path, tuple):
+            path = tuple(pathstore.pathify(path))
+        if accessor.intercepted and self._remember(path[:-2]):
+            # The setter notifies the InterceptProperty observers, so
+            # intercept_changed() marks the object that holds the property
+            # dirty, now that it is remembered.
+            return setter
+        mark_dirty = self.mark_dirty
+        def set_value(value):
+            setter(value)
+            mark_dirty(path)
+        return set_value
 
     def rest_get(self, path=None):
-        self._generic = pathstore.merge(self._generic, None, path)
+        # If there is a cached accessor, then the path has been added to the
+        # generic already, since the last change to the structure at the path.
+        if self._accessors.lookup(self._principal, path) is None:
+            with self._genericLock:
+                self._generic = pathstore.merge(self._generic, None, path)
+                self.mark_dirty(path)
         # Near here, should maybe remove it from the _generic if an error was
         # raised by the principal get.
-        return_ = pathstore.get(self.principal, path)
-        return return_
+        return self._accessors.get(self._principal, path)
     
     def rest_walk(self, editor, path=None, results=None):
-        return pathstore.walk(self.principal, editor, path, results)
+        return pathstore.walk_iterative(self.principal, editor, path, results)
     
     def rest_delete(self, path):
-        pathstore.delete(self._generic, path)
-        return pathstore.delete(self.principal, path)
+        if pathstore.has_selector(path):
+            # Delete in reverse order, so that deleting an item from a list
+            # doesn't shift the items that are still to be deleted, and so that
+            # points are deleted before anything that holds them. Return the
+            # deleted points in the order that they were selected though.
+            deleted = [
+                self.rest_delete(selected)
+                for selected, point in reversed(self.rest_select(path))]
+            deleted.reverse()
+            return deleted
+        with self._genericLock:
+            pathstore.delete(self._generic, path)
+        deleted = pathstore.delete(self.principal, path)
+        self._structure_changed(path, shifted=True)
+        path = tuple(pathstore.pathify(path))
+        if len(path) > 0 and isinstance(path[-1], int):
+            # Deleting from a list shifts the items after, so mark the list.
+            path = path[:-1]
+        self._forget(path)
+        self.mark_dirty(path)
+        return deleted
     
+    def rest_insert(self, value, path):
+        """\
+        Insert a value into a list, at the index that is the last leg of the
+        path. The opposite of rest_delete() for a list item, so that, for
+        example, a deletion can be undone.
+        """
+        path = tuple(pathstore.pathify(path))
+        pathstore.get(self.principal, path[:-1]).insert(path[-1], value)
+        self._structure_changed(path, shifted=True)
+        self._forget(path[:-1])
+        self.mark_dirty(path[:-1])
+        with self._genericLock:
+            try:
+                generic = pathstore.get(self._generic, path[:-1])
+            except (IndexError, KeyError, TypeError):
+                return
+            if len(generic) >= path[-1]:
+                generic.insert(path[-1], _generic_value(value))
+    
+    @property
+    def snapshot(self):
+        """\
+        Latest GenericSnapshot that was published, or None if none has been.
+        """
+        return self._snapshot
+
+    def publish_snapshot(self):
+        """\
+        Populate the whole generic store from the principal, then publish a
+        GenericSnapshot of it, and return the snapshot. Call while no other
+        thread can be changing the principal. Publishing is a single reference
+        assignment, so readers of the snapshot property always get a whole
+        snapshot, either the new one or the previous one.
+        """
+        with self._genericLock:
+            self.get_generic()
+            previous = self._snapshot
+            if previous is None:
+                generic = generic_copy(self._generic)
+            else:
+                generic = _share(
+                    self._generic, previous.generic, _tree(self._changed))
+            self._changed = set()
+            self._snapshot = GenericSnapshot(generic, self._version)
+        return self._snapshot
+
+    @property
+    def snapshotStale(self):
+        """\
+        True if the next publish_snapshot() could differ from the latest
+        snapshot, which is the case if none has been published, if the version
+        has changed, if any path is dirty or has been refreshed since, or if a
+        volatile object has been seen in the principal. Otherwise publishing can
+        be skipped.
+        """
+        with self._genericLock:
+            snapshot = self._snapshot
+            if snapshot is None or snapshot.version != self._version:
+                return True
+            if self._dirty or self._dirtyBuffer or self._changed:
+                return True
+            for object_ in self._objects.values():
+                if self.volatile(object_):
+                    return True
+        return False
+
+    @property
+    def version(self):
+        """\
+        Number that changes every time the structure of the principal is changed
+        through this interface, by rest_put(), rest_patch(), rest_delete(),
+        rest_insert(), or by a rest_set() that can't use the accessor cache.
+        """
+        return self._version
+
+    @property
+    def genericLock(self):
+        """\
+        Re-entrant lock that is held while the generic store is changed. GET
+        operations change the generic store, so this lock is needed even by
+        threads that only read the principal. Hold it while copying or
+        serialising a value that was returned from the generic store.
+        """
+        return self._genericLock
+
+    @property
+    def accessors(self):
+        """AccessorCache instance used by this interface."""
+        return self._accessors
+
     def __init__(self):
         self._principal = None
         self._generic = None
+        self._genericLock = threading.RLock()
+        self._version = 0
+        self._snapshot = None
+        #
+        # Paths in the principal that could have changed since the generic
+        # store was refreshed there.
+        self._dirty = set()
+        #
+        # Paths marked dirty since the last merge into the dirty set, and the
+        # length at which mark_dirty() merges them.
+        self._dirtyBuffer = collections.deque()
+        self._dirtyBufferLimit = 4096
+        #
+        # Paths in the generic store that have been refreshed since the last
+        # snapshot was published.
+        self._changed = set()
+        #
+        # Objects that have been seen in the principal, by path, and their paths
+        # by id().
+        self._objects = {}
+        self._objectPaths = {}
+        InterceptProperty.observers.add(self)
+        self._accessors = AccessorCache()
         
         def _pass(*args):
             return
@@ -192,19 +767,39 @@ class PathAnimation(Animation):
     def store(self, store):
         self._store = store
     
+    @property
+    def restInterface(self):
+        """\
+        Optional RestInterface through which the animation is applied. If set,
+        the animated value is set by a setter from rest_setter(), or by
+        rest_set() if there isn't one. Otherwise, the store is descended every
+        time.
+        """
+        return self._restInterface
+    @restInterface.setter
+    def restInterface(self, restInterface):
+        self._restInterface = restInterface
+        self._setterVersion = None
+    
     @property
     def valuePath(self):
         return self._valuePath
     @valuePath.setter
     def valuePath(self, valuePath):
-        self._valuePath = valuePath
+        # Compile the path here, so that the work isn't repeated every time the
+        # animation is applied.
+        self._valuePath = (
+            None if valuePath is None else pathstore.compile_path(valuePath))
+        self._setterVersion = None
     
     @property
     def subjectPath(self):
         return self._subjectPath
     @subjectPath.setter
     def subjectPath(self, subjectPath):
-        self._subjectPath = subjectPath
+        self._subjectPath = (
+            None if subjectPath is None
+            else pathstore.compile_path(subjectPath))
         
     @property
     def delta(self):
@@ -230,10 +825,31 @@ class PathAnimation(Animation):
         Animation.startTime.fset(self, startTime)
     startTime = property(Animation.startTime.fget, _startTimeSetter)
 
+    def apply_value(self, value):
+        """\
+        Set value at the valuePath in the store. If there is a restInterface,
+        the value is set by a setter that is resolved by the first call, and
+        resolved again after the structure of the store has changed.
+        """
+        restInterface = self._restInterface
+        if restInterface is None:
+            pathstore.replace(self.store, value, self.valuePath)
+            return
+        if self._setterVersion != restInterface.version:
+            self._setter = restInterface.rest_setter(self._valuePath)
+            self._setterVersion = restInterface.version
+        if self._setter is not None:
+            try:
+                self._setter(value)
+                return
+            except (AttributeError, IndexError, KeyError, TypeError):
+                self._setter = None
+        restInterface.rest_set(value, self._valuePath)
+
     # Override the setter for nowTime to apply the animation.
     def _nowTimeSetter(self, nowTime):
         Animation.nowTime.fset(self, nowTime)
-        pathstore.replace(self.store, self.get_value(), self.valuePath)
+        self.apply_value(self.get_value())
         # The get_value() could have had the side effect of setting the
         # `complete` flag. It could now be true that all animations on the
         # subject are complete. However, it seems inefficient to check that
@@ -245,17 +861,88 @@ class PathAnimation(Animation):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._store = None
+        self._restInterface = None
         self._valuePath = None
         self._subjectPath = None
         self._subject = None
         self._delta = None
+        #
+        # Setter resolved by apply_value(), and the restInterface version for
+        # which it was resolved.
+        self._setter = None
+        self._setterVersion = None
         self._subject = None
     
-    # It could be handy to cache the parent of the animated point, in order to
-    # minimise the number of path descents. However, it might be the case that
-    # an object in the path has been replaced in between iterations of the
-    # animation. That would stymie caching. Hmm. The `subject` property as
-    # implemented now wouldn't handle replacement.
+    # The parent of the animated point is cached by the rest interface, in order
+    # to minimise the number of path descents. An object in the path could be
+    # replaced in between iterations of the animation, but the rest interface
+    # invalidates its cache when that happens. The `subject` property as
+    # implemented now wouldn't handle replacement though.
+
+class CompletionsReport(object):
+    """\
+    Outcome of one AnimatedRestInterface.set_now_times() call. Iterating gives
+    a tuple for each animation that completed or was stopped, in which:
+    
+    -   First element is the path, as a list.
+    -   Second element is "Stopped" or "Complete".
+    
+    The tree copy of the animations store is only built if the tree property is
+    accessed, or the report is converted to a string. It is built from the store
+    as it is at that time, so access it before the next set_now_times() call.
+    """
+    @property
+    def tree(self):
+        """\
+        Copy of the animation path store structure with either None, "Stopped",
+        "Complete", or "Incomplete" at each node.
+        """
+        if not self._built:
+            self._restInterface.rest_walk(
+                self._add, self._restInterface.animationPath, self)
+            for path, state in self._changes:
+                self._tree = pathstore.merge(self._tree, state, path)
+            self._built = True
+        return self._tree
+
+    @staticmethod
+    def _add(point, path, report):
+        state = None if point is None else (
+            "Stopped" if point.stopped else (
+                "Complete" if point.complete else "Incomplete"))
+        report._tree = pathstore.merge(report._tree, state, path)
+
+    def __iter__(self):
+        return iter(self._changes)
+
+    def __len__(self):
+        return len(self._changes)
+
+    def __str__(self):
+        return str(self.tree)
+
+    def __init__(self, restInterface, completions):
+        self._restInterface = restInterface
+        self._changes = [
+            (path, "Stopped" if point.stopped else "Complete")
+            for path, point in completions]
+        self._tree = None
+        self._built = False
+
+class _VectorWrite(object):
+    """\
+    Items to be set in one sequence point during
+    AnimatedRestInterface.set_now_times(), by one write of the whole sequence.
+    """
+    def __init__(self, parent, setter, path, intercepted):
+        # The sequence point, its bound parent_setter, its path, and whether
+        # setting it notifies the InterceptProperty observers.
+        self.parent = parent
+        self.setter = setter
+        self.path = path
+        self.intercepted = intercepted
+        # Dictionary of the values to set, keyed by index.
+        self.items = {}
 
 class AnimatedRestInterface(RestInterface):
     """\
@@ -277,6 +964,39 @@ class AnimatedRestInterface(RestInterface):
                 Individual game objects.
     """
     
+    @property
+    def batchAnimations(self):
+        """\
+        If True, the animations are kept in an animation.AnimationBatch, which
+        requires NumPy, and set_now_times() evaluates all the active ones in
+        one vectorised pass, without walking the store. The batch is updated
+        when animations are inserted or removed through this interface. If
+        False, each animation is evaluated as it is walked.
+        """
+        return self._batch is not None
+    @batchAnimations.setter
+    def batchAnimations(self, batchAnimations):
+        if batchAnimations:
+            if self._batch is None:
+                if not animation.batch_available():
+                    raise ImportError(
+                        "NumPy is required for batchAnimations.")
+                self._batch = animation.AnimationBatch()
+                self._batchSynced = False
+        elif self._batch is not None:
+            self._batch.clear()
+            self._batch = None
+            self._batchPrefixes = {}
+
+    @property
+    def completionsNs(self):
+        """\
+        Duration, in nanoseconds, of the processing of the completed animations
+        in the last call to set_now_times(). The rest of its duration was the
+        walk that applied the animations.
+        """
+        return self._completionsNs
+
     @property
     def levels(self):
         return self._levels
@@ -284,9 +1004,15 @@ class AnimatedRestInterface(RestInterface):
     def levels(self, levels):
         self._levels = levels
     
+    # Override
+    def volatile(self, point):
+        # An object that has physics can be moved by the physics engine.
+        return getattr(point, 'physics', False) is True
+
     # Override
     def point_maker(self, path, index, point):
-        log(DEBUG, "({}, {}, {}) AnimatedRestInterface", path, index, point)
+        if __debug__ and logguard.debug:
+            log(DEBUG, "({}, {}, {}) AnimatedRestInterface", path, index, point)
         #
         # Next line has index == 3, which is one more than the level at which
         # the animation object is to be created. The index < 3 levels can get a
@@ -295,6 +1021,7 @@ class AnimatedRestInterface(RestInterface):
             if not isinstance(point, PathAnimation):
                 point = PathAnimation()
             point.store = self.principal
+            point.restInterface = self
             return point
 
         # No point creating a point like this because a GameObject can only be
@@ -339,6 +1066,72 @@ class AnimatedRestInterface(RestInterface):
     class WalkResults:
         pass
 
+    # Override
+    def rest_setter(self, path):
+        """\
+        Get a callable that sets a value at a path that already exists, see
+        RestInterface.rest_setter(). If the point is an item of a sequence that
+        isn't a list, like one component of the worldScale Vector of a game
+        object, then values set during set_now_times() are collected instead.
+        At the end of the walk, all the items collected for each sequence are
+        set by one write of the whole sequence.
+        """
+        setter = super().rest_setter(path)
+        if setter is None:
+            return None
+        accessor = self._accessors.accessor(self._principal, path)
+        if (accessor is None
+            or accessor.pointType is not pathstore.PointType.LIST
+            or not isinstance(accessor.leg, int)
+            or isinstance(accessor.parent, (list, dict))
+        ):
+            return setter
+        parent = accessor.parent
+        key = id(parent)
+        leg = accessor.leg
+        parentSetter = accessor.parent_setter()
+        parentPath = tuple(pathstore.pathify(path))[:-1]
+        intercepted = accessor.intercepted
+        def set_item(value):
+            writes = self._vectorWrites
+            if writes is None:
+                setter(value)
+                return
+            write = writes.get(key)
+            if write is None:
+                write = _VectorWrite(
+                    parent, parentSetter, parentPath, intercepted)
+                writes[key] = write
+            write.items[leg] = value
+        return set_item
+
+    def _write_vectors(self, writes):
+        # Set the items collected by the callables from rest_setter(), above,
+        # with one write of each sequence. A sequence that can defer, like the
+        # rotation of a game object, has its items set while deferred instead,
+        # so that it is composed once without reading the other items.
+        for write in writes.values():
+            parent = write.parent
+            try:
+                if getattr(parent, 'deferred', None) is False:
+                    parent.deferred = True
+                    try:
+                        for index, value in write.items.items():
+                            parent[index] = value
+                    finally:
+                        parent.deferred = False
+                else:
+                    values = list(parent[:])
+                    for index, value in write.items.items():
+                        values[index] = value
+                    write.setter(values)
+            except (AttributeError, IndexError, KeyError, TypeError):
+                for index, value in write.items.items():
+                    self.rest_set(value, write.path + (index,))
+                continue
+            if not write.intercepted:
+                self.mark_dirty(write.path)
+
     def _process_completed_animations(self, completions):
         for path, completed in completions:
             #
@@ -354,31 +1147,14 @@ class AnimatedRestInterface(RestInterface):
             if subject is None:
                 continue
             #
-            # There is a subject. The code will walk the animations to see if
-            # there are any more for the same subject. Whatever is discovered
-            # will be set in a results object. (The other attributes of the walk
-            # results object will still be set from the set_now_times first
-            # walk.)
-            self._walkResults.still = False
-            self._walkResults.subject = subject
-            #
-            # Checking subroutine that can be passed to walk().
-            def check(point, path, results):
-                if point is None:
-                    return
-                if (point.subject is results.subject
-                    and not point.complete
-                    and not point.stopped
-                ):
-                    results.still = True
-                    raise StopIteration
-            
-            self.rest_walk(check, self._animationPath, self._walkResults)
+            # There is a subject. The set_now_times walk counted the animations
+            # of each subject that are still active, so checking is a lookup.
+            still = self._walkResults.active.get(id(subject), 0) > 0
             #
             # If there are no other animations, clear the beingAnimated state,
             # which will restore physics to the subject and reset its rotation
             # overrides.
-            if self._walkResults.still:
+            if still:
                 log(DEBUG,
                     'AnimatedRestInterface._process_completed_animations'
                     ' still:\n{} {}.', path, subject)
@@ -391,13 +1167,15 @@ class AnimatedRestInterface(RestInterface):
         tuple of:
         
         -   Boolean for whether there were any completions this time.
-        -   A copy of the animation path store structure with either None,
-            "Complete", or "Incomplete" at each node.
+        -   CompletionsReport instance. Iterating it gives the paths of the
+            animations that completed or were stopped. Its tree property is a
+            copy of the animation path store structure with either None,
+            "Stopped", "Complete", or "Incomplete" at each node.
         '''
         #
-        # The code will walk the animations store twice. First to set the now
-        # time, second to remove any completed animations. The walk results
-        # object is used to collect the outcome.
+        # The code will walk the animations store once, to set the now time,
+        # and then remove any completed animations. The walk results object is
+        # used to collect the outcome.
         #
         # `completions` will be a list of tuples representing animations that
         # completed due to setting the now time. In each tuple:
@@ -406,12 +1184,25 @@ class AnimatedRestInterface(RestInterface):
         # -   Second element is the Animation instance.
         self._walkResults.completions = []
         #
-        # `completionsLog` will be a copy of the animation path store structure
-        # with either None, "Stopped", "Complete", or "Incomplete" at each node.
-        self._walkResults.completionsLog = None
-        #
         self._walkResults.anyCompletions = False
         #
+        # `active` will be a dictionary of the number of animations that are
+        # still active for each subject, keyed by the id() of the subject. All
+        # subjects are referenced by animations in the store, and so stay alive
+        # and keep their id() values, until the completions have been
+        # processed.
+        self._walkResults.active = {}
+        #
+        # Subroutine that records the outcome for one point.
+        def record(point, path, results):
+            if point is not None:
+                if point.complete or point.stopped:
+                    results.anyCompletions = True
+                    results.completions.append((path[:], point))
+                elif point.subject is not None:
+                    key = id(point.subject)
+                    results.active[key] = results.active.get(key, 0) + 1
+        #
         # Checking subroutine that will be passed to walk().
         def set_now(point, path, results):
             if not (point is None or point.complete or point.stopped):
@@ -419,26 +1210,138 @@ class AnimatedRestInterface(RestInterface):
                 # applying the animation, which could have the further side
                 # effect of completing the animation.
                 point.nowTime = nowTime
-            if point is not None and (point.complete or point.stopped):
-                results.anyCompletions = True
-                results.completions.append((path[:], point))
-            logValue = None if point is None else (
-                "Stopped" if point.stopped else (
-                    "Complete" if point.complete else "Incomplete"))
-            results.completionsLog = pathstore.merge(
-                results.completionsLog, logValue, path)
-
-        self.rest_walk(set_now, self._animationPath, self._walkResults)
+            record(point, path, results)
+
         #
-        # In theory, the processing in the following could be done in the
-        # previous walk. However, it uses walk() to check for other animations
-        # of the same subject, and it seemed a bit hazardous to kick off other
-        # walks within a walk. Anyway, this is the second walk.
+        # Values set in the items of sequences, like the components of a
+        # Vector, are collected while the animations are applied, and then set
+        # with one write per sequence.
+        self._vectorWrites = {}
+        try:
+            if self._batch is not None:
+                self._set_now_times_batch(nowTime, record)
+            else:
+                self.rest_walk(set_now, self._animationPath, self._walkResults)
+        finally:
+            writes = self._vectorWrites
+            self._vectorWrites = None
+        self._write_vectors(writes)
+        #
+        # Completions are processed after the walk, because they change the
+        # store, and because the active counts are only complete after every
+        # animation has been visited.
+        start = time.perf_counter_ns()
+        report = CompletionsReport(self, self._walkResults.completions)
         self._process_completed_animations(self._walkResults.completions)
+        self._completionsNs = time.perf_counter_ns() - start
         
-        return (
-            self._walkResults.anyCompletions, self._walkResults.completionsLog)
+        return self._walkResults.anyCompletions, report
     
+    # Override.
+    def _structure_changed(self, path, shifted=False):
+        super()._structure_changed(path, shifted)
+        if self._batch is None or not self._batchSynced:
+            return
+        # Keep the batch in step with the animations in the store. If that
+        # can't be done here, the batch is built again by the next
+        # set_now_times().
+        batch = self._batch
+        path = tuple(pathstore.pathify(path))
+        animationPath = tuple(self._animationPath)
+        length = len(animationPath)
+        if (path[:length] != animationPath
+            and animationPath[:len(path)] != path
+        ):
+            return
+        #
+        # Changes inside an animation, like setting its speed, are packed by
+        # the animation itself.
+        for index in range(length, len(path)):
+            if path[:index] in batch:
+                return
+        #
+        # A deletion from a list could shift animations to other paths.
+        if shifted and len(path) > 0 and isinstance(path[-1], int) and (
+            path[:-1] in self._batchPrefixes
+        ):
+            self._batchSynced = False
+            return
+        if path in batch:
+            self._batch_remove(path)
+        elif path in self._batchPrefixes:
+            self._batchSynced = False
+            return
+        try:
+            point = pathstore.get(self._principal, path)
+        except (IndexError, KeyError, TypeError):
+            return
+        if isinstance(point, Animation):
+            self._batch_add(point, path)
+        elif isinstance(point, (dict, list, tuple)) and len(point) > 0:
+            # Could hold any number of animations.
+            self._batchSynced = False
+
+    def _batch_add(self, point, path):
+        self._batch.add(point, path)
+        prefixes = self._batchPrefixes
+        for index in range(len(path)):
+            prefixes[path[:index]] = prefixes.get(path[:index], 0) + 1
+
+    def _batch_remove(self, path):
+        if self._batch.remove(path) is None:
+            return
+        prefixes = self._batchPrefixes
+        for index in range(len(path)):
+            count = prefixes[path[:index]] - 1
+            if count > 0:
+                prefixes[path[:index]] = count
+            else:
+                del prefixes[path[:index]]
+
+    def _batch_sync(self):
+        # Build the batch again from a walk of the animations.
+        def collect(point, path, results):
+            if isinstance(point, Animation):
+                self._batch_add(point, tuple(path))
+        self._batch.clear()
+        self._batchPrefixes = {}
+        self.rest_walk(collect, self._animationPath)
+        self._batchSynced = True
+
+    def _set_now_times_batch(self, nowTime, record):
+        # Evaluate all the active animations in the batch, then apply them.
+        if not self._batchSynced:
+            self._batch_sync()
+        batch = self._batch
+        points, values = batch.evaluate(nowTime)
+        for point, value in zip(points, values):
+            point.apply_value(value)
+        results = self._walkResults
+        for path, point in batch.finished():
+            record(point, list(path), results)
+        #
+        # The active counts are only needed for the subjects of the completed
+        # animations.
+        if results.anyCompletions:
+            for point in batch.active():
+                record(point, None, results)
+
+    def animation_targets(self):
+        '''\
+        Get a set of the value paths and subject paths of the animations that
+        aren't complete or stopped, as tuples. These are the paths that
+        set_now_times() could change, in addition to the animations.
+        '''
+        def collect(point, path, targets):
+            if point is None or point.complete or point.stopped:
+                return
+            for target in (point.valuePath, point.subjectPath):
+                if target is not None:
+                    targets.add(tuple(target))
+        targets = set()
+        self.rest_walk(collect, self._animationPath, targets)
+        return targets
+
     @property
     def animationPath(self):
         return self._animationPath
@@ -460,12 +1363,21 @@ class AnimatedRestInterface(RestInterface):
         super().__init__(*args, **kwargs)
         # self._GameObject = None
         self._levels = 0
+        #
+        # AnimationBatch, if batchAnimations is True, whether it is in step
+        # with the store, and the number of animations under each path above
+        # an animation in it.
+        self._batch = None
+        self._batchSynced = False
+        self._batchPrefixes = {}
+        self._completionsNs = 0
+        self._vectorWrites = None
         
         self._walkResults = self.WalkResults()
         #
         # Set and populate conventional paths.
-        self._animationPath = ('animations',)
-        self._gameObjectPath = ('root', 'gameObjects')
+        self._animationPath = pathstore.CompiledPath(('animations',))
+        self._gameObjectPath = pathstore.CompiledPath(('root', 'gameObjects'))
         self._gameObjectPathLen = len(self._gameObjectPath)
         for path in (self.animationPath, ): #self.gameObjectPath):
             self.rest_put(None, path)
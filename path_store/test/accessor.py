@@ -0,0 +1,213 @@
+#!/usr/bin/python
+# (c) 2018 Jim Hawkins. MIT licensed, see https://opensource.org/licenses/MIT
+# Part of Blender Driver, see https://github.com/sjjhsjjh/blender-driver
+"""Path Store unit test module. Tests in this module can be run like:
+
+    python3 path_store/test.py TestAccessorCache
+"""
+# Exit if run other than as a module.
+if __name__ == '__main__':
+    print(__doc__)
+    raise SystemExit(1)
+
+# Standard library imports, in alphabetic order.
+#
+# Unit test module.
+# https://docs.python.org/3.5/library/unittest.html
+import unittest
+#
+# Module for Thread and Event classes.
+# https://docs.python.org/3/library/threading.html
+import threading
+#
+# Module for sleep, used to slow down a property getter.
+# https://docs.python.org/3/library/time.html
+import time
+#
+# Local imports.
+#
+# Modules under test.
+from path_store import rest
+
+class Holder(object):
+    def __init__(self, value):
+        self.value = value
+        self.listed = [value, value + 1]
+
+    @property
+    def fresh(self):
+        # Property that returns a new object every time.
+        return [self.value]
+
+class SlowHolder(Holder):
+    @property
+    def slow(self):
+        # Property that takes a while, during which other threads can run.
+        time.sleep(0.0001)
+        return self.value
+
+class TestAccessorCache(unittest.TestCase):
+    def test_get(self):
+        interface = rest.RestInterface()
+        interface.rest_put(Holder(1), ('root', 'a'))
+        self.assertEqual(interface.rest_get(('root', 'a', 'value')), 1)
+        self.assertEqual(len(interface.accessors), 1)
+        self.assertEqual(interface.rest_get(('root', 'a', 'value')), 1)
+        self.assertEqual(interface.rest_get(['root', 'a', 'listed', 1]), 2)
+        self.assertEqual(len(interface.accessors), 2)
+
+        with self.assertRaises(KeyError):
+            interface.rest_get(('root', 'b'))
+        with self.assertRaises(IndexError):
+            interface.rest_get(('root', 'a', 'listed', 2))
+
+    def test_replaced_parent(self):
+        interface = rest.RestInterface()
+        interface.rest_put(Holder(1), ('root', 'a'))
+        self.assertEqual(interface.rest_get(('root', 'a', 'value')), 1)
+        interface.rest_put(Holder(3), ('root', 'a'))
+        self.assertEqual(interface.rest_get(('root', 'a', 'value')), 3)
+        interface.rest_patch({'a': Holder(5)}, 'root')
+        self.assertEqual(interface.rest_get(('root', 'a', 'value')), 5)
+        interface.rest_put(None)
+        with self.assertRaises(TypeError):
+            interface.rest_get(('root', 'a', 'value'))
+
+    def test_tuple_copy(self):
+        interface = rest.RestInterface()
+        interface.rest_put(({'x': 1}, {'x': 2}), ('root', 'tuple'))
+        self.assertEqual(interface.rest_get(('root', 'tuple', 1, 'x')), 2)
+        # Next line causes the tuple to be copied into a list.
+        interface.rest_put({'x': 4}, ('root', 'tuple', 1))
+        self.assertEqual(interface.rest_get(('root', 'tuple', 1, 'x')), 4)
+
+    def test_delete_shift(self):
+        interface = rest.RestInterface()
+        for index in range(3):
+            interface.rest_put(Holder(index), ('root', 'list', index))
+        self.assertEqual(interface.rest_get(('root', 'list', 1, 'value')), 1)
+        interface.rest_delete(('root', 'list', 0))
+        self.assertEqual(interface.rest_get(('root', 'list', 1, 'value')), 2)
+        interface.rest_delete(('root', 'list', 1, 'value'))
+        with self.assertRaises(TypeError):
+            interface.rest_get(('root', 'list', 1, 'value'))
+
+    def test_threads(self):
+        # Gets on other threads, while the structure is changed on this one,
+        # only raise the usual path errors, and don't leave an accessor for a
+        # parent that has been replaced in the cache. The slow holder makes
+        # each descent wait, so that the threads interleave inside the cache.
+        interface = rest.RestInterface()
+        for index in range(3):
+            interface.rest_put(SlowHolder(index), ('root', 'list', index))
+        errors = []
+        done = threading.Event()
+        def get():
+            while not done.is_set():
+                for index in range(3):
+                    try:
+                        interface.rest_get(('root', 'list', index, 'slow'))
+                    except (AttributeError, IndexError, KeyError, TypeError):
+                        pass
+                    except Exception as error:
+                        errors.append(error)
+        threads = [threading.Thread(target=get) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        try:
+            for cycle in range(100):
+                interface.rest_delete(('root', 'list', 0))
+                interface.rest_patch(
+                    {'list': [SlowHolder(cycle), SlowHolder(cycle + 1)]}
+                    , 'root')
+                interface.rest_put(SlowHolder(cycle + 2), ('root', 'list', 2))
+        finally:
+            done.set()
+            for thread in threads:
+                thread.join()
+        self.assertEqual(errors, [])
+        for index in range(3):
+            self.assertEqual(
+                interface.rest_get(('root', 'list', index, 'slow')), 99 + index)
+
+    def test_fresh_property(self):
+        interface = rest.RestInterface()
+        holder = Holder(6)
+        interface.rest_put(holder, ('root', 'a'))
+        self.assertEqual(interface.rest_get(('root', 'a', 'fresh', 0)), 6)
+        self.assertEqual(len(interface.accessors), 0)
+        holder.value = 7
+        self.assertEqual(interface.rest_get(('root', 'a', 'fresh', 0)), 7)
+
+    def test_set(self):
+        interface = rest.RestInterface()
+        holder = Holder(1)
+        interface.rest_put(holder, ('root', 'a'))
+        interface.rest_set(8, ('root', 'a', 'listed', 0))
+        self.assertEqual(holder.listed, [8, 2])
+        self.assertEqual(len(interface.accessors), 1)
+        interface.rest_set(9, ('root', 'a', 'listed', 0))
+        self.assertEqual(holder.listed, [9, 2])
+
+        # Setting a path that doesn't exist yet falls back to replace.
+        interface.rest_set(10, ('root', 'b', 0))
+        self.assertEqual(interface.rest_get(('root', 'b')), [10])
+
+    def test_rest_setter(self):
+        interface = rest.RestInterface()
+        holder = Holder(1)
+        interface.rest_put(holder, ('root', 'a'))
+        self.assertEqual(interface.rest_get(('root', 'a', 'value')), 1)
+        set_listed = interface.rest_setter(('root', 'a', 'listed', 1))
+        set_value = interface.rest_setter(('root', 'a', 'value'))
+        set_listed(5)
+        set_value(6)
+        self.assertEqual(holder.listed, [1, 5])
+        self.assertEqual(holder.value, 6)
+        self.assertEqual(interface.get_generic(('root', 'a', 'value')), 6)
+        self.assertIsNone(interface.rest_setter(('root', 'b', 0)))
+
+    def test_animation_setter(self):
+        interface = rest.AnimatedRestInterface()
+        interface.rest_put(Holder(0), ('root', 'a'))
+        interface.rest_put({
+            'valuePath': ('root', 'a', 'listed', 1),
+            'speed': 1.0,
+            'targetValue': 10.0
+        }, ('animations', 'test', 0))
+        animation = interface.rest_get(('animations', 'test', 0))
+        animation.startTime = 0.0
+        interface.set_now_times(1.0)
+        setter = animation._setter
+        self.assertIsNotNone(setter)
+        interface.set_now_times(2.0)
+        self.assertIs(animation._setter, setter)
+        self.assertEqual(interface.rest_get(('root', 'a', 'listed', 1)), 3.0)
+        #
+        # A change to the structure causes the setter to be resolved again.
+        interface.rest_put(0, ('root', 'b'))
+        interface.set_now_times(3.0)
+        self.assertIsNot(animation._setter, setter)
+        self.assertEqual(interface.rest_get(('root', 'a', 'listed', 1)), 4.0)
+
+    def test_animation(self):
+        interface = rest.AnimatedRestInterface()
+        interface.rest_put(Holder(0), ('root', 'a'))
+        interface.rest_put({
+            'valuePath': ('root', 'a', 'listed', 0),
+            'speed': 1.0,
+            'targetValue': 10.0
+        }, ('animations', 'test', 0))
+        animation = interface.rest_get(('animations', 'test', 0))
+        self.assertIs(animation.restInterface, interface)
+        animation.startTime = 0.0
+
+        interface.set_now_times(1.0)
+        self.assertEqual(interface.rest_get(('root', 'a', 'listed', 0)), 1.0)
+        #
+        # Replace the object that is the parent of the animated value. The
+        # animation must then apply to the new object.
+        holder = Holder(0)
+        interface.rest_put(holder, ('root', 'a'))
+        interface.set_now_times(2.0)
+        self.assertEqual(holder.listed[0], 2.0)
@@ -0,0 +1,198 @@
+#!/usr/bin/python
+# (c) 2018 Jim Hawkins. MIT licensed, see https://opensource.org/licenses/MIT
+# Part of Blender Driver, see https://github.com/sjjhsjjh/blender-driver
+"""Path Store unit test module. Tests in this module can be run like:
+
+    python3 path_store/test.py TestAnimationBatch
+"""
+# Exit if run other than as a module.
+if __name__ == '__main__':
+    print(__doc__)
+    raise SystemExit(1)
+
+# Standard library imports, in alphabetic order.
+#
+# Module for mathematical operations.
+# https://docs.python.org/3.5/library/math.html
+from math import pi, radians
+#
+# Unit test module.
+# https://docs.python.org/3.5/library/unittest.html
+import unittest
+#
+# Local imports.
+#
+# Modules under test.
+import animation
+from path_store import rest
+
+def make_animation(
+    startValue, speed, targetValue, modulo, startTime=1.0, nowTime=2.5
+):
+    made = animation.Animation()
+    made.startValue = startValue
+    made.speed = speed
+    made.targetValue = targetValue
+    made.modulo = modulo
+    made.startTime = startTime
+    made.nowTime = nowTime
+    return made
+
+@unittest.skipUnless(animation.batch_available(), "NumPy isn't available.")
+class TestAnimationBatch(unittest.TestCase):
+    def test_values(self):
+        parameters = []
+        for startValue in (0.0, 1.0, -2.5, 3, 350.0, radians(350.0)):
+            for speed in (0.5, 1.0, -1.0, -0.25, 0.0, 2):
+                for targetValue in (None, 0.0, 2.0, -1.5, 10, 5.0, pi):
+                    for modulo in (None, 0, 360.0, radians(360.0), 2.0):
+                        parameters.append(
+                            (startValue, speed, targetValue, modulo))
+        for nowTime in (1.0, 1.5, 2.5, 4.0, 100.0):
+            expected = []
+            for parameter in parameters:
+                scalar = make_animation(*parameter, nowTime=nowTime)
+                expected.append(
+                    (scalar.get_value(), scalar.completionTime))
+
+            batch = [
+                make_animation(*parameter, nowTime=nowTime)
+                for parameter in parameters]
+            values = animation.get_values(batch)
+            for parameter, value, made, (expectedValue, expectedTime) in zip(
+                parameters, values, batch, expected
+            ):
+                self.assertEqual(
+                    (value, type(value), made.completionTime)
+                    , (expectedValue, type(expectedValue), expectedTime)
+                    , (parameter, nowTime))
+
+    def test_fallback(self):
+        # All int parameters, which give an int value from get_value().
+        made = make_animation(1, 2, None, None, 0, 3)
+        self.assertEqual(animation.get_values([made]), [7])
+        self.assertIsInstance(animation.get_values([made])[0], int)
+        #
+        # Missing speed raises the same as get_value().
+        made = make_animation(1.0, None, None, None)
+        with self.assertRaises(TypeError):
+            animation.get_values([made])
+
+        self.assertEqual(animation.get_values([]), [])
+
+    def test_persistent(self):
+        batch = animation.AnimationBatch()
+        batch.vectorMinimum = 0
+        made = [
+            make_animation(0.0, 1.0, 2.0, None, 0.0, 0.0)
+            , make_animation(1.0, -1.0, None, None, 0.0, 0.0)
+            , make_animation(0, 1, 10, None, 0, 0)]
+        for index, animation_ in enumerate(made):
+            batch.add(animation_, ('key', index))
+        self.assertEqual(len(batch), 3)
+        with self.assertRaises(ValueError):
+            animation.AnimationBatch().add(made[0], 'other')
+
+        points, values = batch.evaluate(1.5)
+        self.assertEqual(points, made)
+        self.assertEqual(values, [1.5, -0.5, 1.5])
+        #
+        # Setting a parameter packs it again, and an int now time with all int
+        # parameters gives an int value, same as get_value().
+        made[1].speed = 2.0
+        points, values = batch.evaluate(1)
+        self.assertEqual(values, [1.0, 3.0, 1])
+        self.assertIsInstance(values[2], int)
+        #
+        # Completed and stopped animations aren't evaluated again.
+        made[2].stopped = True
+        points, values = batch.evaluate(2.5)
+        self.assertEqual(points, made[:2])
+        self.assertEqual(values, [2.0, 6.0])
+        self.assertEqual(made[0].completionTime, 2.5)
+        self.assertEqual(
+            batch.finished(), [(('key', 0), made[0]), (('key', 2), made[2])])
+        self.assertEqual(batch.active(), [made[1]])
+        #
+        # Setting the target makes it active again.
+        made[0].targetValue = 5.0
+        self.assertEqual(batch.active(), made[:2])
+        #
+        # Removing leaves the rest in order, including after compaction.
+        self.assertIs(batch.remove(('key', 0)), made[0])
+        self.assertIsNone(batch.remove(('key', 0)))
+        self.assertEqual(batch.active(), [made[1]])
+        made[0].speed = 3.0
+        batch.remove(('key', 1))
+        self.assertEqual(len(batch), 1)
+        self.assertIs(batch.get(('key', 2)), made[2])
+        batch.add(made[0], ('key', 3))
+        self.assertEqual(
+            batch.finished(), [(('key', 2), made[2])])
+        batch.clear()
+        self.assertEqual(len(batch), 0)
+        batch.add(made[2], ('key', 2))
+
+    def test_rest_changes(self):
+        # Animations inserted, changed, deleted, and completed while set_now
+        # times runs give the same outcome with and without the batch.
+        outcomes = []
+        for batchAnimations in (False, True):
+            interface = rest.AnimatedRestInterface()
+            interface.batchAnimations = batchAnimations
+            if batchAnimations:
+                interface._batch.vectorMinimum = 0
+            interface.rest_put([0.0] * 6, ('root', 'numbers'))
+            def put(index, speed, target):
+                interface.rest_put({
+                    'valuePath': ('root', 'numbers', index),
+                    'speed': speed,
+                    'targetValue': target
+                }, ('animations', 'test', index))
+            for index in range(3):
+                put(index, 1.0 + index, 10.0)
+            outcome = []
+            for tick in range(12):
+                nowTime = tick * 0.5
+                if tick == 2:
+                    put(3, -1.0, -2.0)
+                    put(4, 1.0, None)
+                if tick == 3:
+                    interface.rest_set(4.0, ('animations', 'test', 4, 'speed'))
+                if tick == 4:
+                    interface.rest_delete(('animations', 'test', 1))
+                if tick == 5:
+                    interface.rest_put(
+                        True, ('animations', 'test', 0, 'stopped'))
+                if tick == 6:
+                    put(5, 2.0, 100.0)
+                anyCompletions, report = interface.set_now_times(nowTime)
+                outcome.append((anyCompletions, sorted(
+                    (tuple(path), state) for path, state in report)
+                    , list(interface.rest_get(('root', 'numbers')))))
+            outcomes.append(outcome)
+        self.assertEqual(outcomes[0], outcomes[1])
+
+    def test_rest_interface(self):
+        outcomes = []
+        for batchAnimations in (False, True):
+            interface = rest.AnimatedRestInterface()
+            interface.batchAnimations = batchAnimations
+            interface.rest_put([0.0, 10.0, 350.0], ('root', 'numbers'))
+            for index, (speed, target, modulo) in enumerate((
+                (1.0, 2.0, None), (-3.0, 4.0, None), (10.0, 5.0, 360.0)
+            )):
+                interface.rest_put({
+                    'valuePath': ('root', 'numbers', index),
+                    'speed': speed,
+                    'targetValue': target,
+                    'modulo': modulo
+                }, ('animations', 'test', index))
+            outcome = []
+            for nowTime in (0.0, 0.5, 1.0, 1.5, 2.0, 2.5):
+                anyCompletions, report = interface.set_now_times(nowTime)
+                outcome.append((anyCompletions, str(report), list(
+                    interface.rest_get(('root', 'numbers')))))
+            outcomes.append(outcome)
+        self.assertEqual(outcomes[0], outcomes[1])
+        self.assertEqual(outcomes[1][-1][2], [2.0, 4.0, 5.0])
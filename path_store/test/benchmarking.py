@@ -0,0 +1,59 @@
+#!/usr/bin/python
+# (c) 2018 Jim Hawkins. MIT licensed, see https://opensource.org/licenses/MIT
+# Part of Blender Driver, see https://github.com/sjjhsjjh/blender-driver
+"""Path Store unit test module. Tests in this module can be run like:
+
+    python3 path_store/test.py TestBenchmark
+"""
+# Exit if run other than as a module.
+if __name__ == '__main__':
+    print(__doc__)
+    raise SystemExit(1)
+
+# Standard library imports, in alphabetic order.
+#
+# Unit test module.
+# https://docs.python.org/3.5/library/unittest.html
+import unittest
+#
+# Local imports.
+#
+# Module under test.
+from path_store import benchmark
+
+class TestBenchmark(unittest.TestCase):
+    def test_cases(self):
+        benchmark_ = benchmark.Benchmark(
+            'test', None, {'width': (1, 2), 'batch': (False,)})
+        self.assertEqual(list(benchmark_.cases()), [
+            ('test[batch=False,width=1]', {'batch': False, 'width': 1}),
+            ('test[batch=False,width=2]', {'batch': False, 'width': 2})])
+        self.assertEqual(benchmark.case_name('test', {}), 'test')
+
+    def test_measure(self):
+        calls = []
+        result = benchmark.measure(lambda: calls.append(None), 0.001, 3)
+        self.assertEqual(result['repeat'], 3)
+        self.assertGreater(result['loops'], 0)
+        self.assertGreaterEqual(len(calls), result['loops'] * 3)
+        self.assertLessEqual(result['best'], result['median'])
+        #
+        # A workload with a setup passes the return value of the setup to the
+        # timed callable, every time.
+        states = []
+        setups = []
+        def setup():
+            setups.append(None)
+            return len(setups)
+        benchmark.measure((setup, states.append), 0.001, 2)
+        self.assertEqual(states, list(range(1, len(setups) + 1)))
+
+    def test_compare(self):
+        def results(**times):
+            return {'format': benchmark.FORMAT, 'results': {
+                name: {'best': time} for name, time in times.items()}}
+        comparisons, regressions = benchmark.compare(
+            results(a=1.0, b=1.0, c=1.0), results(a=1.05, b=1.5, d=1.0), 0.1)
+        self.assertEqual(comparisons, [
+            ('a', 1.0, 1.05, 1.05), ('b', 1.0, 1.5, 1.5)])
+        self.assertEqual(regressions, ['b'])
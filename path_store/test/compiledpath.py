@@ -0,0 +1,121 @@
+#!/usr/bin/python
+# (c) 2018 Jim Hawkins. MIT licensed, see https://opensource.org/licenses/MIT
+# Part of Blender Driver, see https://github.com/sjjhsjjh/blender-driver
+"""Path Store unit test module. Tests in this module can be run like:
+
+    python3 path_store/test.py TestCompiledPath
+"""
+# Exit if run other than as a module.
+if __name__ == '__main__':
+    print(__doc__)
+    raise SystemExit(1)
+
+# Standard library imports, in alphabetic order.
+#
+# Unit test module.
+# https://docs.python.org/3.5/library/unittest.html
+import unittest
+#
+# Local imports.
+#
+# Utilities.
+from path_store.test.principal import Principal
+#
+# Modules under test.
+import pathstore
+
+class TestCompiledPath(unittest.TestCase):
+    def test_construct(self):
+        path = pathstore.CompiledPath(('root', 'gameObjects', 0, 'worldScale'))
+        self.assertEqual(path, ('root', 'gameObjects', 0, 'worldScale'))
+        self.assertEqual(len(path), 4)
+        self.assertEqual(path.legTypes, (
+            pathstore.LegType.STRING, pathstore.LegType.STRING
+            , pathstore.LegType.NUMBER, pathstore.LegType.STRING))
+        self.assertEqual(path.slices, ())
+
+        self.assertEqual(pathstore.CompiledPath(), ())
+        self.assertEqual(pathstore.CompiledPath(None), ())
+        self.assertEqual(pathstore.CompiledPath('single'), ('single',))
+        self.assertEqual(pathstore.CompiledPath(3), (3,))
+
+        compiled = pathstore.compile_path(path)
+        self.assertIs(compiled, path)
+        compiled = pathstore.compile_path(['ab', 1])
+        self.assertIsInstance(compiled, pathstore.CompiledPath)
+        self.assertEqual(compiled, ('ab', 1))
+
+    def test_split(self):
+        path = pathstore.CompiledPath.split(
+            "/api/root/gameObjects/1:3/x", skip=1)
+        self.assertEqual(path, ('root', 'gameObjects', slice(1, 3), 'x'))
+        self.assertEqual(path.slices, (2,))
+        self.assertIs(path.legTypes[2], pathstore.LegType.SLICE)
+        self.assertEqual(
+            path, tuple(pathstore.pathify_split("api/root/gameObjects/1:3/x"
+                                                , skip=1)))
+
+    def test_get(self):
+        principal = {'ab': [Principal("zero"), Principal("one")]}
+        path = pathstore.CompiledPath(('ab', 1, 'testAttr', 1))
+        self.assertEqual(pathstore.get(principal, path), "n")
+        self.assertEqual(
+            pathstore.get(principal, path)
+            , pathstore.get(principal, list(path)))
+
+        path = pathstore.CompiledPath(('ab', 2))
+        with self.assertRaises(IndexError) as context:
+            pathstore.get(principal, path)
+        with self.assertRaises(IndexError) as contextList:
+            pathstore.get(principal, list(path))
+        self.assertEqual(str(context.exception), str(contextList.exception))
+
+        path = pathstore.CompiledPath(('ab', slice(None), 'testAttr', 0))
+        self.assertEqual(pathstore.get(principal, path), ["z", "o"])
+
+    def test_replace_merge(self):
+        path = pathstore.CompiledPath(('ab', 2, 'cd'))
+        principal = pathstore.replace(None, 5, path)
+        self.assertEqual(principal, {'ab': [None, None, {'cd': 5}]})
+        principal = pathstore.merge(principal, {'ef': 6}, path[:2])
+        self.assertEqual(
+            principal, {'ab': [None, None, {'cd': 5, 'ef': 6}]})
+        principal = pathstore.merge(
+            principal, {'gh': 7}, pathstore.CompiledPath(path[:2]))
+        self.assertEqual(
+            principal, {'ab': [None, None, {'cd': 5, 'ef': 6, 'gh': 7}]})
+
+        principal['ab'][1] = {}
+        path = pathstore.CompiledPath(('ab', slice(1, None), 'cd'))
+        principal = pathstore.replace(principal, 8, path)
+        self.assertEqual(
+            principal
+            , {'ab': [None, {'cd': 8}, {'cd': 8, 'ef': 6, 'gh': 7}]})
+
+    def test_delete(self):
+        principal = {'ab': [0, 1, 2], 'cd': 3}
+        path = pathstore.CompiledPath(('ab', 1))
+        self.assertEqual(pathstore.delete(principal, path), 1)
+        self.assertEqual(principal, {'ab': [0, 2], 'cd': 3})
+        self.assertEqual(
+            pathstore.delete(principal, pathstore.CompiledPath('cd')), 3)
+        self.assertEqual(principal, {'ab': [0, 2]})
+
+    def test_walk(self):
+        principal = {'ab': [0, 1, 2], 'cd': 3}
+        results = []
+        def editor(point, path, resultsUnused):
+            results.append(tuple(path))
+            return True, point + 10
+        principal = pathstore.walk(
+            principal, editor, pathstore.CompiledPath(('ab',)))
+        self.assertEqual(results, [('ab', 0), ('ab', 1), ('ab', 2)])
+        self.assertEqual(principal, {'ab': [10, 11, 12], 'cd': 3})
+
+    def test_edit_leg(self):
+        # Replacing a leg of a compiled path creates a list copy, like any other
+        # tuple.
+        principal = {'path': pathstore.CompiledPath(('ab', 'cd'))}
+        principal = pathstore.replace(principal, 'ef', ('path', 1))
+        self.assertEqual(principal['path'], ('ab', 'ef'))
+        self.assertNotIsInstance(principal['path'], pathstore.CompiledPath)
@@ -0,0 +1,670 @@
+#!/usr/bin/python
+# (c) 2018 Jim Hawkins. MIT licensed, see https://opensource.org/licenses/MIT
+# Part of Blender Driver, see https://github.com/sjjhsjjh/blender-driver
+"""Path Store unit test module. Tests in this module can be run like:
+
+    python3 path_store/test.py TestHeadlessMathutils
+    python3 path_store/test.py TestTickWorker
+    python3 path_store/test.py TestTickCalls
+"""
+# Exit if run other than as a module.
+if __name__ == '__main__':
+    print(__doc__)
+    raise SystemExit(1)
+
+# Standard library imports, in alphabetic order.
+#
+# Module for reading the durations file.
+# https://docs.python.org/3/library/csv.html
+import csv
+#
+# Module for mathematical constants and comparisons.
+# https://docs.python.org/3/library/math.html
+from math import isclose, pi
+#
+# Module for the module registry, in which the stand-ins are installed.
+# https://docs.python.org/3/library/sys.html
+import sys
+#
+# Module for the temporary durations file.
+# https://docs.python.org/3/library/tempfile.html
+import tempfile
+#
+# Module for the Events that hold the tick worker.
+# https://docs.python.org/3/library/threading.html
+import threading
+#
+# Module for perf_counter and sleep.
+# https://docs.python.org/3/library/time.html
+import time
+#
+# Unit test module.
+# https://docs.python.org/3.5/library/unittest.html
+import unittest
+#
+# Local imports.
+#
+# Headless stand-in modules. They are only installed as mathutils and bge while
+# the tests in this module run, see setUpModule(), so the modules that import
+# mathutils and bge are imported there too.
+import blender_driver.headless
+from blender_driver.headless.bge.types import KX_Scene
+from blender_driver.headless.mathutils import Euler, Matrix, Quaternion, Vector
+from blender_driver.timingutils import TickTimings
+#
+# Modules under test.
+from path_store.hosted import InterceptProperty
+from path_store.rest import AnimatedRestInterface
+
+# Modules in sys.modules before setUpModule(), which tearDownModule() restores.
+_savedModules = None
+
+def setUpModule():
+    global _savedModules, application_http, thread, tick
+    global get_game_object_subclass, Rotation, RotationXYZ
+    _savedModules = dict(sys.modules)
+    blender_driver.headless.install()
+    from blender_driver.headless import tick
+    from blender_driver.application import thread
+    import blender_driver.application.http as application_http
+    from path_store.blender_game_engine.gameobject import \
+        get_game_object_subclass
+    from path_store.blender_game_engine.rotation import Rotation, RotationXYZ
+
+def tearDownModule():
+    # Remove the stand-ins, and the modules that were imported with them, and
+    # put back anything that they replaced.
+    for name in tuple(sys.modules.keys()):
+        if name not in _savedModules:
+            del sys.modules[name]
+    sys.modules.update(_savedModules)
+
+class TestHeadlessMathutils(unittest.TestCase):
+    def assertSequenceClose(self, first, second):
+        self.assertEqual(len(first), len(second))
+        for index, value in enumerate(first):
+            self.assertTrue(
+                isclose(value, second[index], abs_tol=1e-9)
+                , "{} != {} at {}".format(first, second, index))
+
+    def test_euler_round_trip(self):
+        for order in ('XYZ', 'XZY', 'YXZ', 'YZX', 'ZXY', 'ZYX'):
+            euler = Euler((0.3, -1.1, 2.5), order)
+            matrix = euler.to_matrix()
+            #
+            # Same as applying the axis rotations in the order.
+            composed = Matrix.Identity(3)
+            for axis in order:
+                composed.rotate(Matrix.Rotation(
+                    euler['XYZ'.index(axis)], 3, axis))
+            for row, composedRow in zip(matrix, composed):
+                self.assertSequenceClose(row, composedRow)
+            self.assertSequenceClose(matrix.to_euler(order), euler)
+            self.assertSequenceClose(
+                matrix.to_quaternion().to_euler(order), euler)
+
+    def test_rotate(self):
+        vector = Vector((1.0, 0.0, 0.0))
+        vector.rotate(Quaternion((0.0, 0.0, 1.0), pi / 2.0))
+        self.assertSequenceClose(vector, (0.0, 1.0, 0.0))
+        self.assertSequenceClose(
+            Matrix.Rotation(pi / 2.0, 4, 'Z') * Vector((1.0, 0.0, 0.0))
+            , (0.0, 1.0, 0.0))
+        #
+        # Matrix rotate multiplies on the left.
+        matrix = Matrix.Rotation(pi / 2.0, 3, 'X')
+        matrix.rotate(Matrix.Rotation(pi / 2.0, 3, 'Z'))
+        self.assertEqual(matrix, Matrix.Rotation(pi / 2.0, 3, 'Z')
+                         * Matrix.Rotation(pi / 2.0, 3, 'X'))
+
+    def test_vector(self):
+        vector = Vector((3.0, 4.0, 0.0))
+        self.assertEqual(vector.magnitude, 5.0)
+        self.assertEqual(vector * Vector((1.0, 1.0, 1.0)), 7.0)
+        self.assertEqual(vector + (1, 1, 1), Vector((4.0, 5.0, 1.0)))
+        self.assertEqual(vector.resized(2), Vector((3.0, 4.0)))
+        self.assertEqual(Vector((1.0, 0.0)).angle(Vector((0.0, 0.0)), 9.0), 9.0)
+        with self.assertRaises(ValueError):
+            Vector((1.0, 0.0)).angle(Vector((0.0, 0.0)))
+        frozen = vector.copy().freeze()
+        with self.assertRaises(AttributeError):
+            frozen[0] = 1.0
+        copy = frozen.copy()
+        copy[0] = 1.0
+        self.assertEqual(copy[:], (1.0, 4.0, 0.0))
+
+class OrientationHost(object):
+    def _get_orientation(self):
+        return self.orientation
+    def _set_orientation(self, orientation):
+        self.orientation = orientation
+        self.sets += 1
+
+    def __init__(self, Class):
+        self.orientation = Matrix.Identity(3)
+        self.sets = 0
+        self.rotation = Class(self._get_orientation, self._set_orientation)
+
+class TestHeadlessRotation(unittest.TestCase):
+    def assertMatrixClose(self, first, second):
+        for row, secondRow in zip(first, second):
+            for value, secondValue in zip(row, secondRow):
+                self.assertTrue(isclose(value, secondValue, abs_tol=1e-9)
+                                , "{} != {}".format(first, second))
+
+    def test_deferred(self):
+        for Class in (Rotation, RotationXYZ):
+            sliced = OrientationHost(Class)
+            sliced.rotation[:] = (0.3, -0.2, 1.1)
+            host = OrientationHost(Class)
+            host.rotation.deferred = True
+            host.rotation[0] = 0.3
+            host.rotation[1] = -0.2
+            host.rotation[2] = 1.1
+            self.assertEqual(host.sets, 0)
+            self.assertEqual(host.rotation[:], [0.3, -0.2, 1.1])
+            host.rotation.flush()
+            self.assertEqual(host.sets, 1)
+            self.assertMatrixClose(host.orientation, sliced.orientation)
+            host.rotation.flush()
+            self.assertEqual(host.sets, 1)
+            #
+            # Deleting applies anything deferred first.
+            host.rotation[2] = 0.0
+            del host.rotation[:]
+            self.assertEqual(host.sets, 2)
+            host.rotation.deferred = False
+            host.rotation[2] = 0.5
+            self.assertEqual(host.sets, 3)
+
+    def test_deferred_repeated(self):
+        # Setting the same item again while deferred replaces the value that
+        # was pending, same as setting it twice without deferring.
+        for Class in (Rotation, RotationXYZ):
+            immediate = OrientationHost(Class)
+            immediate.rotation[0] = 0.1
+            immediate.rotation[0] = 0.2
+            host = OrientationHost(Class)
+            host.rotation.deferred = True
+            host.rotation[0] = 0.1
+            host.rotation[1] = 0.3
+            host.rotation[0] = 0.2
+            host.rotation[1] = 0.3
+            host.rotation.deferred = False
+            self.assertEqual(host.sets, 1)
+            immediate.rotation[1] = 0.3
+            self.assertMatrixClose(host.orientation, immediate.orientation)
+            del host.rotation[:]
+            self.assertTrue(isclose(host.rotation[0], 0.2))
+
+    def test_deferred_slice(self):
+        # Setting items one at a time while deferred has the same result as
+        # setting them with one slice, even past the point at which the
+        # decomposition of the Y rotation switches direction.
+        for Class in (Rotation, RotationXYZ):
+            sliced = OrientationHost(Class)
+            sliced.rotation[:] = (0.3, 2.0, 0.0)
+            sliced.rotation[0:2] = (0.4, 2.1)
+            host = OrientationHost(Class)
+            host.rotation[:] = (0.3, 2.0, 0.0)
+            host.rotation.deferred = True
+            host.rotation[0] = 0.4
+            host.rotation[1] = 2.1
+            host.rotation.deferred = False
+            self.assertMatrixClose(host.orientation, sliced.orientation)
+
+    def test_cached(self):
+        host = OrientationHost(Rotation)
+        host.rotation[:] = (0.0, 0.0, pi / 2.0)
+        matrix = host.rotation.matrix
+        self.assertIsNot(matrix, host.orientation)
+        self.assertMatrixClose(matrix, Matrix.Rotation(pi / 2.0, 3, 'Z'))
+        self.assertMatrixClose(
+            host.rotation.quaternion.to_matrix(), host.orientation)
+        #
+        # Setting the same values keeps the cache but still sets the host.
+        host.rotation[2] = pi / 2.0
+        self.assertIs(host.rotation.matrix, matrix)
+        self.assertEqual(host.sets, 2)
+        host.rotation[2] = 0.0
+        self.assertIsNot(host.rotation.matrix, matrix)
+        self.assertMatrixClose(host.orientation, Matrix.Identity(3))
+
+class TestHeadlessGameObject(unittest.TestCase):
+    def setUp(self):
+        blender_driver.headless.reset()
+        self.scene = KX_Scene()
+        self.GameObject = get_game_object_subclass(blender_driver.headless.bge)
+
+    def test_item_set(self):
+        object_ = self.GameObject(self.scene.addObject('cube'))
+        self.assertEqual(self.scene.objects, [
+            self.scene.active_camera, object_])
+        object_.worldPosition[1] = 2.5
+        object_.worldScale[2] = 0.5
+        self.assertEqual(object_.worldPosition[:], (0.0, 2.5, 0.0))
+        self.assertEqual(object_.worldScale[:], (1.0, 1.0, 0.5))
+        object_.rotation[2] = pi / 2.0
+        self.assertTrue(isclose(object_.rotation[2], pi / 2.0))
+        self.assertTrue(isclose(object_.worldOrientation[1][0], 1.0))
+
+    def test_parent(self):
+        parent = self.GameObject(self.scene.addObject('cube'))
+        child = self.scene.addObject('cube')
+        child.worldPosition = (1.0, 0.0, 0.0)
+        child.setParent(parent)
+        self.assertEqual(parent.children, [child])
+        parent.worldPosition = (0.0, 0.0, 3.0)
+        parent.worldOrientation = Matrix.Rotation(pi / 2.0, 3, 'Z')
+        for value, expected in zip(child.worldPosition, (0.0, 1.0, 3.0)):
+            self.assertTrue(isclose(value, expected, abs_tol=1e-9))
+        parent.endObject()
+        self.assertTrue(child.invalid)
+        self.assertEqual(self.scene.objects, [self.scene.active_camera])
+
+class TestHeadlessVectorWrites(unittest.TestCase):
+    def setUp(self):
+        blender_driver.headless.reset()
+        self.scene = KX_Scene()
+        self.GameObject = get_game_object_subclass(blender_driver.headless.bge)
+        self.changes = []
+        InterceptProperty.observers.add(self)
+
+    def tearDown(self):
+        InterceptProperty.observers.discard(self)
+
+    def intercept_changed(self, instance):
+        self.changes.append(instance)
+
+    def test_components(self):
+        interface = AnimatedRestInterface()
+        object_ = self.GameObject(self.scene.addObject('cube'))
+        path = ('root', 'gameObjects', 0)
+        interface.rest_put(object_, path)
+        for name in ('worldScale', 'rotation'):
+            for dimension in range(2):
+                animationPath = ('animations', name, dimension)
+                interface.rest_put({
+                    'valuePath': path + (name, dimension),
+                    'speed': 0.5,
+                    'targetValue': 10.0
+                }, animationPath)
+                interface.rest_put(0.0, animationPath + ('startTime',))
+
+        for tick in range(1, 4):
+            del self.changes[:]
+            interface.set_now_times(float(tick))
+            #
+            # One whole Vector write per tick, instead of one per component.
+            self.assertEqual(self.changes, [object_])
+            self.assertEqual(object_.worldScale[:], (
+                1.0 + 0.5 * tick, 1.0 + 0.5 * tick, 1.0))
+            self.assertTrue(isclose(object_.rotation[0], 0.5 * tick))
+            self.assertTrue(isclose(object_.rotation[1], 0.5 * tick))
+            self.assertTrue(isclose(object_.rotation[2], 0.0, abs_tol=1e-9))
+        #
+        # Outside set_now_times, the setters write straight away.
+        setter = interface.rest_setter(path + ('worldScale', 2))
+        setter(4.0)
+        self.assertEqual(object_.worldScale[2], 4.0)
+
+def start_application():
+    # Headless tick harness Application, with simulated time, and without any
+    # game objects.
+    scene = tick.bge.logic.getCurrentScene()
+    application = tick.Application({'arguments': {'applicationSwitches': []}})
+    application.game_constructor(scene, scene.addObject('gateway'))
+    application.game_initialise()
+    application.simulatedPerf = 0.0
+    return application
+
+def run_application_tick(application, perf):
+    # Run one tick of an Application from start_application(), and wait for it
+    # to finish.
+    application.simulatedPerf = perf
+    application.tickDone.clear()
+    application.game_tick()
+    application.tickDone.wait()
+
+class TestHeadlessTick(unittest.TestCase):
+    def setUp(self):
+        blender_driver.headless.reset()
+
+    def test_run(self):
+        summary = tick.run(
+            ticks=12, warmup=3, rate=60.0, objects=4, cursors=1, cameras=1)
+        self.assertEqual(summary['ticks'], 12)
+        self.assertEqual(summary['skipped'], 0)
+        self.assertLessEqual(summary['p50'], summary['p95'])
+        self.assertLessEqual(summary['p95'], summary['p99'])
+        self.assertLessEqual(summary['p99'], summary['max'])
+        phases = summary['phases']
+        self.assertEqual(phases['run']['count'], 12)
+        self.assertEqual(phases['snapshot']['count'], 12)
+        self.assertLessEqual(phases['update']['max'], phases['run']['max'])
+
+    def test_snapshot(self):
+        application = start_application()
+        def run_tick(perf):
+            run_application_tick(application, perf)
+            self.assertIsNone(application.tickError)
+        restInterface = application._restInterface
+        try:
+            application.simulatedPerf = 0.0
+            application.populate(objects=2, animate=('position',))
+            #
+            # Nothing has read the snapshot, so the tick doesn't publish one.
+            run_tick(0.1)
+            self.assertIsNone(restInterface.snapshot)
+            self.assertIsNone(application.published_snapshot())
+            #
+            # The read causes the next tick to publish.
+            run_tick(0.2)
+            published = application.published_snapshot()
+            self.assertIsNotNone(published)
+            self.assertIs(published, restInterface.snapshot)
+            self.assertEqual(published.get(
+                ('root', 'gameObjects', 0, 'worldPosition', 0)), 0.1)
+            #
+            # The animation changes the store in every tick. The snapshot has
+            # been read since it was published, so the next tick withdraws it,
+            # without publishing.
+            run_tick(0.3)
+            self.assertIsNone(application.published_snapshot())
+            self.assertIs(restInterface.snapshot, published)
+            run_tick(0.4)
+            self.assertEqual(application.published_snapshot().get(
+                ('root', 'gameObjects', 0, 'worldPosition', 0)), 0.2)
+        finally:
+            application.game_terminate()
+
+    def test_summary(self):
+        summary = tick.summary(
+            [0.5] + [float(value) / 1000.0 for value in range(1, 101)]
+            , 100.0, warmup=1)
+        self.assertEqual(summary['ticks'], 100)
+        self.assertEqual(summary['p50'], 0.05)
+        self.assertEqual(summary['p99'], 0.099)
+        self.assertEqual(summary['overruns'], 90)
+
+class TestTickWorker(unittest.TestCase):
+    def setUp(self):
+        blender_driver.headless.reset()
+        self.application = None
+
+    def tearDown(self):
+        if self.application is not None:
+            self.application.gate.set()
+            self.application.game_terminate()
+
+    def start(self, tickPolicy):
+        # Application whose game_tick_run() waits for its gate to be set, so
+        # that ticks can be made to arrive while the worker is busy.
+        class Application(thread.Application):
+            def game_tick_run(self):
+                self.runs.append(self.tickPerf + self._gameInitialisePerf)
+                self.started.set()
+                self.gate.wait(5.0)
+                if self.raiseNext is not None:
+                    exception, self.raiseNext = self.raiseNext, None
+                    raise exception
+
+            def tick_skipped(self):
+                self.skips += 1
+
+        scene = blender_driver.headless.bge.logic.getCurrentScene()
+        application = Application({'arguments': {'applicationSwitches': [
+            '--tickPolicy', tickPolicy]}})
+        application.game_constructor(scene, scene.addObject('gateway'))
+        application.runs = []
+        application.skips = 0
+        application.started = threading.Event()
+        application.gate = threading.Event()
+        application.raiseNext = None
+        application.game_initialise()
+        self.application = application
+        return application
+
+    def run_busy(self, application, ticks):
+        # Run one tick, and then signal the number of ticks while it is still
+        # running. Returns the perf_counter() times from just before each of
+        # those ticks was signalled.
+        application.gate.clear()
+        application.started.clear()
+        application.game_tick()
+        self.assertTrue(application.started.wait(5.0))
+        signalled = []
+        for tick in range(ticks):
+            signalled.append(time.perf_counter())
+            application.game_tick()
+        return signalled
+
+    def release(self, application, runs):
+        # Let the tick worker run until it is idle, then check the number of
+        # runs in total.
+        application.gate.set()
+        deadline = time.perf_counter() + 5.0
+        while time.perf_counter() < deadline:
+            with application._tickCondition:
+                if (application._tickPending is None
+                    and not application._tickBusy):
+                    break
+            time.sleep(0.01)
+        self.assertEqual(len(application.runs), runs)
+
+    def test_skip(self):
+        application = self.start('skip')
+        self.run_busy(application, 3)
+        self.assertEqual(application.skippedTicks, 3)
+        self.assertEqual(application.skips, 3)
+        self.release(application, 1)
+        #
+        # The skipped ticks weren't run later. The count is reset by the next
+        # tick that runs.
+        self.assertEqual(application.skippedTicks, 3)
+        application.game_tick()
+        self.release(application, 2)
+        self.assertEqual(application.skippedTicks, 0)
+
+    def test_queue(self):
+        application = self.start('queue')
+        signalled = self.run_busy(application, 3)
+        #
+        # The first tick that arrived while busy was queued, and the others
+        # were skipped.
+        self.assertEqual(application.skippedTicks, 2)
+        self.assertEqual(application.skips, 2)
+        self.release(application, 2)
+        self.assertEqual(application.skippedTicks, 0)
+        #
+        # The queued tick has the time that it arrived.
+        self.assertGreaterEqual(application.runs[1], signalled[0])
+        self.assertLess(application.runs[1], signalled[1])
+
+    def test_latest(self):
+        application = self.start('latest')
+        signalled = self.run_busy(application, 3)
+        #
+        # Each tick that arrived while busy replaced the queued one, which was
+        # skipped.
+        self.assertEqual(application.skippedTicks, 2)
+        self.assertEqual(application.skips, 2)
+        self.release(application, 2)
+        self.assertGreaterEqual(application.runs[1], signalled[2])
+
+    def test_raise(self):
+        application = self.start('skip')
+        application.raiseNext = ValueError("In the tick.")
+        self.run_busy(application, 0)
+        self.release(application, 1)
+        #
+        # The exception from the worker is raised on the next tick, on the
+        # thread that signals the ticks, once.
+        with self.assertRaises(ValueError):
+            application.game_tick()
+        application.game_tick()
+        self.release(application, 2)
+
+    def test_raise_skipped(self):
+        application = self.start('skip')
+        def tick_skipped():
+            raise KeyError("In tick_skipped.")
+        application.tick_skipped = tick_skipped
+        self.run_busy(application, 1)
+        self.release(application, 1)
+        with self.assertRaises(KeyError):
+            application.game_tick()
+
+    def test_terminate(self):
+        # Ticks after termination are ignored, and the worker finishes.
+        application = self.start('queue')
+        self.run_busy(application, 1)
+        self.application = None
+        application.gate.set()
+        application.game_terminate()
+        self.assertFalse(application._tickWorker.is_alive())
+        application.game_tick()
+        self.assertLessEqual(len(application.runs), 2)
+
+class TestTickCalls(unittest.TestCase):
+    def setUp(self):
+        blender_driver.headless.reset()
+        self.application = start_application()
+        self.terminated = False
+
+    def tearDown(self):
+        if not self.terminated:
+            self.application.game_terminate()
+
+    def terminate(self):
+        self.terminated = True
+        self.application.game_terminate()
+
+    def test_next_tick(self):
+        application = self.application
+        calls = []
+        def call(value):
+            calls.append(value)
+            #
+            # Called with the whole store write locked.
+            self.assertFalse(application.pathLocks.storeLock.acquire(False))
+            return value
+        first = application.call_in_tick(lambda: call(1))
+        second = application.call_in_tick(lambda: call(2))
+        self.assertEqual((first, second), (1, 2))
+        self.assertEqual(calls, [])
+        self.assertEqual(application.tickCallsQueued, 2)
+        self.assertEqual(application.tickCallsApplied, 0)
+        run_application_tick(application, 0.1)
+        self.assertEqual(calls, [1, 2])
+        self.assertEqual(application.tickCallsApplied, 2)
+        #
+        # Each call is only made once.
+        run_application_tick(application, 0.2)
+        self.assertEqual(calls, [1, 2])
+
+    def test_exception(self):
+        # An exception from one call doesn't stop the others, or the tick.
+        application = self.application
+        calls = []
+        def fail():
+            raise ValueError("In the call.")
+        application.call_in_tick(lambda: calls.append(1))
+        application.call_in_tick(fail)
+        application.call_in_tick(lambda: calls.append(3))
+        run_application_tick(application, 0.1)
+        self.assertIsNone(application.tickError)
+        self.assertEqual(calls, [1, 3])
+        self.assertEqual(application.tickCallsApplied, 3)
+
+    def wait_in_thread(self, call, interval=0.05):
+        # Start a thread that waits for a DeferredCall, like an HTTP worker.
+        # Returns the thread and a list that gets the return value of the wait.
+        waited = []
+        thread = threading.Thread(target=lambda: waited.append(
+            call.wait(self.application.terminating, interval)))
+        thread.start()
+        return thread, waited
+
+    def test_deferred_result(self):
+        call = application_http.DeferredCall(lambda: 'result')
+        self.application.call_in_tick(call)
+        thread, waited = self.wait_in_thread(call)
+        time.sleep(0.1)
+        self.assertEqual(waited, [])
+        run_application_tick(self.application, 0.1)
+        thread.join(5.0)
+        self.assertEqual(waited, [True])
+        self.assertEqual((call.result, call.error), ('result', None))
+
+    def test_deferred_exception(self):
+        error = KeyError('missing')
+        def fail():
+            raise error
+        call = application_http.DeferredCall(fail)
+        self.application.call_in_tick(call)
+        thread, waited = self.wait_in_thread(call)
+        run_application_tick(self.application, 0.1)
+        thread.join(5.0)
+        self.assertEqual(waited, [True])
+        self.assertIsNone(call.result)
+        self.assertIs(call.error, error)
+
+    def test_terminate(self):
+        # Calls that are queued when the application terminates are made then,
+        # and their waiters get the results.
+        application = self.application
+        calls = []
+        call = application_http.DeferredCall(lambda: calls.append(1) or 'done')
+        sequence = application.call_in_tick(call)
+        thread, waited = self.wait_in_thread(call)
+        self.terminate()
+        thread.join(5.0)
+        self.assertEqual(waited, [True])
+        self.assertEqual(call.result, 'done')
+        self.assertEqual(calls, [1])
+        self.assertEqual(application.tickCallsApplied, sequence)
+        #
+        # A call queued after that is never made, and its waiter gives up.
+        late = application_http.DeferredCall(lambda: calls.append(2))
+        application.call_in_tick(late)
+        thread, waited = self.wait_in_thread(late, 0.01)
+        thread.join(5.0)
+        self.assertEqual(waited, [False])
+        self.assertEqual(calls, [1])
+
+class TestTickTimings(unittest.TestCase):
+    def test_ring(self):
+        timings = TickTimings(('first', 'second'), 3)
+        for tick in range(5):
+            timings.begin(float(tick))
+            timings.record('first', tick * 1000000)
+            if tick % 2 == 0:
+                timings.record('second', 1000000)
+                timings.record('second', 2000000)
+        self.assertEqual(timings.ticks, 5)
+        self.assertEqual(timings.total(('first', 'second')), 7000000)
+        self.assertEqual(timings.rows(), [
+            (3, 2.0, 2000000, 3000000),
+            (4, 3.0, 3000000, None),
+            (5, 4.0, 4000000, 3000000)])
+        summary = timings.summary()
+        self.assertEqual(summary['ticks'], 5)
+        self.assertEqual(summary['phases']['first'], {
+            'count': 3, 'mean': 3.0, 'p50': 3.0, 'p95': 4.0, 'p99': 4.0,
+            'max': 4.0})
+        self.assertEqual(summary['phases']['second']['count'], 2)
+
+    def test_csv(self):
+        timings = TickTimings(('first', 'second'))
+        timings.begin(0.5)
+        timings.record('second', 7)
+        with tempfile.TemporaryDirectory() as directory:
+            path = directory + '/timings.csv'
+            timings.write_csv(path)
+            with open(path, newline='') as file_:
+                self.assertEqual(list(csv.reader(file_)), [
+                    ['tick', 'tickPerf', 'first', 'second'],
+                    ['1', '0.5', '', '7']])
+        with self.assertRaises(ValueError):
+            TickTimings(('first',), 0)
@@ -0,0 +1,732 @@
+#!/usr/bin/python
+# (c) 2018 Jim Hawkins. MIT licensed, see https://opensource.org/licenses/MIT
+# Part of Blender Driver, see https://github.com/sjjhsjjh/blender-driver
+"""Path Store unit test module. Tests in this module can be run like:
+
+    python3 path_store/test.py TestPooledHTTPServer
+    python3 path_store/test.py TestWebSocket
+    python3 path_store/test.py TestAsyncHTTPApplication
+    python3 path_store/test.py TestDeferredWrites
+    python3 path_store/test.py TestEventFeed
+"""
+# Exit if run other than as a module.
+if __name__ == '__main__':
+    print(__doc__)
+    raise SystemExit(1)
+
+# Standard library imports, in alphabetic order.
+#
+# Module for the HTTP client, and the request handler base class.
+# https://docs.python.org/3/library/http.client.html
+# https://docs.python.org/3/library/http.server.html
+import http.client
+from http.server import BaseHTTPRequestHandler
+#
+# Module for JavaScript Object Notation (JSON) strings.
+# https://docs.python.org/3.5/library/json.html
+import json
+#
+# Modules for the website directory, which the application changes to.
+# https://docs.python.org/3/library/os.html
+# https://docs.python.org/3/library/os.path.html
+import os
+import os.path
+#
+# Module for the module registry, in which the stand-ins are installed.
+# https://docs.python.org/3/library/sys.html
+import sys
+#
+# Module for connecting without sending a request, and for socket pairs.
+# https://docs.python.org/3/library/socket.html
+import socket
+#
+# Module for draining the event queues.
+# https://docs.python.org/3/library/queue.html
+import queue
+#
+# Module for packing and unpacking WebSocket frame headers.
+# https://docs.python.org/3/library/struct.html
+import struct
+#
+# Module for the website directory.
+# https://docs.python.org/3/library/tempfile.html
+import tempfile
+#
+# Module for the server and shutdown threads.
+# https://docs.python.org/3/library/threading.html
+import threading
+#
+# Module for timing the shutdown.
+# https://docs.python.org/3/library/time.html
+import time
+#
+# Unit test module.
+# https://docs.python.org/3.5/library/unittest.html
+import unittest
+#
+# Module for parsing the application URL.
+# https://docs.python.org/3/library/urllib.parse.html
+import urllib.parse
+#
+# Local imports.
+#
+# Path store REST interface, which publishes the snapshots.
+from path_store.rest import RestInterface
+#
+# Headless stand-in modules. They are only installed while the tests in this
+# module run, see setUpModule(), so the module under test is imported there too.
+import blender_driver.headless
+
+# Modules in sys.modules before setUpModule(), which tearDownModule() restores.
+_savedModules = None
+
+def setUpModule():
+    global _savedModules, application_http, application_asynchttp
+    _savedModules = dict(sys.modules)
+    blender_driver.headless.install()
+    import blender_driver.application.http as application_http
+    import blender_driver.application.asynchttp as application_asynchttp
+
+def tearDownModule():
+    for name in tuple(sys.modules.keys()):
+        if name not in _savedModules:
+            del sys.modules[name]
+    sys.modules.update(_savedModules)
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    #
+    # Long enough that the tests would fail if shutting down waited for it.
+    timeout = 60.0
+
+    def do_GET(self):
+        body = self.path.encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+class TestPooledHTTPServer(unittest.TestCase):
+    def setUp(self):
+        self.server = application_http.PooledHTTPServer(
+            ("localhost", 0), KeepAliveHandler, 1)
+        self.server.timeout = 0.5
+        self.thread = threading.Thread(
+            target=self.server.serve_forever, args=(0.1,))
+        self.thread.start()
+        self.connections = []
+
+    def tearDown(self):
+        for connection in self.connections:
+            connection.close()
+        if self.thread.is_alive():
+            self.server.shutdown()
+        self.server.server_close()
+
+    def connect(self):
+        connection = http.client.HTTPConnection(
+            *self.server.server_address, timeout=10.0)
+        self.connections.append(connection)
+        return connection
+
+    def get(self, connection, path):
+        connection.request('GET', path)
+        response = connection.getresponse()
+        self.assertEqual(response.status, 200)
+        return response.read().decode('utf-8')
+
+    def test_keep_alive(self):
+        connection = self.connect()
+        self.assertEqual(self.get(connection, '/one'), '/one')
+        self.assertEqual(self.get(connection, '/two'), '/two')
+
+    def test_shutdown_during_keep_alive(self):
+        # The only worker is held by a kept-alive connection. The next
+        # connection fills the queue, and the one after that leaves the accept
+        # loop waiting for a worker.
+        kept = self.connect()
+        self.assertEqual(self.get(kept, '/kept'), '/kept')
+        for index in range(2):
+            waiting = socket.create_connection(self.server.server_address)
+            self.connections.append(waiting)
+        time.sleep(0.2)
+
+        start = time.perf_counter()
+        shutdown = threading.Thread(target=self.server.shutdown)
+        shutdown.start()
+        shutdown.join(5.0)
+        self.assertFalse(shutdown.is_alive())
+        self.thread.join(5.0)
+        self.assertFalse(self.thread.is_alive())
+        self.server.server_close()
+        self.assertLess(time.perf_counter() - start, 5.0)
+        for worker in self.server._workers:
+            self.assertFalse(worker.is_alive())
+        #
+        # The kept-alive connection has been shut down by the server.
+        with self.assertRaises((http.client.HTTPException, OSError)):
+            self.get(kept, '/after')
+
+def client_frame(opcode, payload, fin=True, mask=b'\x37\xfa\x21\x3d'):
+    # Frame as sent by a WebSocket client, which masks it unless mask is None.
+    length = len(payload)
+    first = (0x80 if fin else 0) | opcode
+    maskBit = 0 if mask is None else 0x80
+    if length < 126:
+        header = struct.pack('!BB', first, maskBit | length)
+    elif length < 1 << 16:
+        header = struct.pack('!BBH', first, maskBit | 126, length)
+    else:
+        header = struct.pack('!BBQ', first, maskBit | 127, length)
+    if mask is None:
+        return header + payload
+    return header + mask + bytes(
+        byte ^ mask[index % 4] for index, byte in enumerate(payload))
+
+class TestWebSocket(unittest.TestCase):
+    def setUp(self):
+        self.server, self.client = socket.socketpair()
+        self.server.settimeout(5.0)
+        self.client.settimeout(5.0)
+        self.webSocket = application_http.WebSocket(self.server)
+
+    def tearDown(self):
+        self.server.close()
+        self.client.close()
+
+    def reconnect(self):
+        self.tearDown()
+        self.setUp()
+
+    def read_exactly(self, length):
+        data = bytearray()
+        while len(data) < length:
+            chunk = self.client.recv(length - len(data))
+            self.assertNotEqual(len(chunk), 0)
+            data.extend(chunk)
+        return bytes(data)
+
+    def read_frame(self):
+        # Read a frame sent by the server, which mustn't be masked. Returns a
+        # tuple of the FIN flag, the opcode, and the payload.
+        first, second = self.read_exactly(2)
+        self.assertEqual(second & 0x80, 0)
+        length = second & 0x7F
+        if length == 126:
+            length = struct.unpack('!H', self.read_exactly(2))[0]
+        elif length == 127:
+            length = struct.unpack('!Q', self.read_exactly(8))[0]
+        return bool(first & 0x80), first & 0x0F, self.read_exactly(length)
+
+    def receive_messages(self):
+        # Receive until some messages or the end, for payloads that take more
+        # than one read.
+        while True:
+            messages = self.webSocket.receive()
+            if messages is None or len(messages) > 0:
+                return messages
+
+    def test_accept_key(self):
+        # Sample values from RFC 6455, section 1.3.
+        self.assertEqual(
+            application_http.WebSocket.accept_key('dGhlIHNhbXBsZSBub25jZQ==')
+            , 's3pPLMBiTxaQ9kYGzzhZRbK+xOo=')
+        self.assertEqual(
+            application_http.WebSocket.accept_key(
+                ' dGhlIHNhbXBsZSBub25jZQ==\r\n')
+            , 's3pPLMBiTxaQ9kYGzzhZRbK+xOo=')
+
+    def test_unmask(self):
+        WebSocket = application_http.WebSocket
+        mask = b'\x37\xfa\x21\x3d'
+        for payload in (b'', b'H', b'Hello', bytes(range(256)) * 3):
+            masked = bytes(
+                byte ^ mask[index % 4] for index, byte in enumerate(payload))
+            self.assertEqual(WebSocket._unmask(masked, mask), payload)
+            self.assertEqual(
+                WebSocket._unmask(WebSocket._unmask(payload, mask), mask)
+                , payload)
+
+    def test_lengths(self):
+        # 7-bit, 16-bit, and 64-bit lengths, at and around the boundaries,
+        # both received and sent.
+        for length in (0, 1, 125, 126, 127, 65535, 65536, 70000):
+            text = ('abcdefghij' * (length // 10 + 1))[:length]
+            sender = threading.Thread(target=self.client.sendall, args=(
+                client_frame(application_http.WebSocket.TEXT
+                             , text.encode('utf-8')),))
+            sender.start()
+            self.assertEqual(self.receive_messages(), [text], length)
+            sender.join()
+
+            frame = application_http.WebSocket._frame(
+                application_http.WebSocket.TEXT, text.encode('utf-8'))
+            headerLength = (
+                2 if length < 126 else 4 if length < 65536 else 10)
+            self.assertEqual(len(frame), headerLength + length)
+            sender = threading.Thread(target=self.webSocket.send, args=(text,))
+            sender.start()
+            self.assertEqual(
+                self.read_frame()
+                , (True, application_http.WebSocket.TEXT
+                   , text.encode('utf-8')))
+            sender.join()
+
+    def test_several_and_partial(self):
+        TEXT = application_http.WebSocket.TEXT
+        self.client.sendall(
+            client_frame(TEXT, b'one') + client_frame(TEXT, b'two'))
+        self.assertEqual(self.webSocket.receive(), ['one', 'two'])
+        #
+        # A frame that arrives in parts completes a message when its last part
+        # arrives.
+        frame = client_frame(TEXT, '\u00e9t\u00e9'.encode('utf-8'))
+        for start, end in ((0, 1), (1, 4), (4, 7)):
+            self.client.sendall(frame[start:end])
+            self.assertEqual(self.webSocket.receive(), [])
+        self.client.sendall(frame[7:])
+        self.assertEqual(self.webSocket.receive(), ['\u00e9t\u00e9'])
+
+    def test_unmasked(self):
+        # Client frames must be masked, otherwise the server closes the
+        # connection with a protocol error.
+        self.client.sendall(client_frame(
+            application_http.WebSocket.TEXT, b'open', mask=None))
+        self.assertIsNone(self.webSocket.receive())
+        self.assertTrue(self.webSocket.closed)
+        self.assertEqual(self.read_frame(), (
+            True, application_http.WebSocket.CLOSE, struct.pack('!H', 1002)))
+
+    def test_fragmented(self):
+        WebSocket = application_http.WebSocket
+        self.client.sendall(b''.join((
+            client_frame(WebSocket.TEXT, b'Hel', fin=False)
+            , client_frame(WebSocket.PING, b'ping')
+            , client_frame(WebSocket.CONTINUATION, b'lo, ', fin=False)
+            , client_frame(WebSocket.PONG, b'')
+            , client_frame(WebSocket.CONTINUATION, b'world')
+            , client_frame(WebSocket.TEXT, b'next'))))
+        self.assertEqual(self.webSocket.receive(), ['Hello, world', 'next'])
+        #
+        # The ping in the middle of the message got a pong with its payload.
+        self.assertEqual(
+            self.read_frame(), (True, WebSocket.PONG, b'ping'))
+        #
+        # Fragments can arrive in separate reads.
+        self.client.sendall(client_frame(WebSocket.TEXT, b'a', fin=False))
+        self.assertEqual(self.webSocket.receive(), [])
+        self.client.sendall(client_frame(WebSocket.CONTINUATION, b'b'))
+        self.assertEqual(self.webSocket.receive(), ['ab'])
+
+    def test_fragment_errors(self):
+        WebSocket = application_http.WebSocket
+        for frames, code in (
+            ((client_frame(WebSocket.CONTINUATION, b'x'),), 1002)
+            , ((client_frame(WebSocket.TEXT, b'x', fin=False)
+                , client_frame(WebSocket.TEXT, b'y')), 1002)
+            , ((client_frame(WebSocket.BINARY, b'x'),), 1003)
+            , ((client_frame(WebSocket.TEXT, b'\xff'),), 1007)
+        ):
+            self.reconnect()
+            self.client.sendall(b''.join(frames))
+            self.assertIsNone(self.webSocket.receive(), code)
+            self.assertEqual(self.read_frame(), (
+                True, WebSocket.CLOSE, struct.pack('!H', code)))
+
+    def test_oversize(self):
+        WebSocket = application_http.WebSocket
+        self.webSocket.maxMessage = 100
+        self.client.sendall(client_frame(WebSocket.TEXT, b'x' * 100))
+        self.assertEqual(self.webSocket.receive(), ['x' * 100])
+        #
+        # A frame whose length is too big is rejected from its header,
+        # without waiting for the payload.
+        self.client.sendall(client_frame(WebSocket.TEXT, b'x' * 101)[:10])
+        self.assertIsNone(self.webSocket.receive())
+        self.assertEqual(self.read_frame(), (
+            True, WebSocket.CLOSE, struct.pack('!H', 1009)))
+        #
+        # So is a 64-bit length.
+        self.reconnect()
+        self.client.sendall(struct.pack('!BBQ', 0x81, 0xFF, 1 << 40))
+        self.assertIsNone(self.webSocket.receive())
+        self.assertEqual(self.read_frame(), (
+            True, WebSocket.CLOSE, struct.pack('!H', 1009)))
+        #
+        # A message whose fragments are too big together is rejected too.
+        self.reconnect()
+        self.webSocket.maxMessage = 100
+        self.client.sendall(
+            client_frame(WebSocket.TEXT, b'x' * 60, fin=False)
+            + client_frame(WebSocket.CONTINUATION, b'x' * 60))
+        self.assertIsNone(self.webSocket.receive())
+        self.assertEqual(self.read_frame(), (
+            True, WebSocket.CLOSE, struct.pack('!H', 1009)))
+
+    def test_close_handshake(self):
+        WebSocket = application_http.WebSocket
+        #
+        # Messages before the close frame are returned, and the close frame is
+        # echoed with its code.
+        self.client.sendall(
+            client_frame(WebSocket.TEXT, b'last')
+            + client_frame(WebSocket.CLOSE, struct.pack('!H', 1001)))
+        self.assertEqual(self.webSocket.receive(), ['last'])
+        self.assertTrue(self.webSocket.closed)
+        self.assertEqual(self.read_frame(), (
+            True, WebSocket.CLOSE, struct.pack('!H', 1001)))
+        self.assertIsNone(self.webSocket.receive())
+        #
+        # Closing again doesn't send another close frame.
+        self.webSocket.close()
+        self.client.settimeout(0.1)
+        with self.assertRaises(socket.timeout):
+            self.client.recv(1)
+
+    def test_close_without_code(self):
+        WebSocket = application_http.WebSocket
+        self.client.sendall(client_frame(WebSocket.CLOSE, b''))
+        self.assertIsNone(self.webSocket.receive())
+        self.assertEqual(self.read_frame(), (
+            True, WebSocket.CLOSE, struct.pack('!H', 1000)))
+
+    def test_end_of_stream(self):
+        self.client.shutdown(socket.SHUT_WR)
+        self.assertIsNone(self.webSocket.receive())
+        self.assertTrue(self.webSocket.closed)
+
+    def test_server_close(self):
+        self.webSocket.close(1001)
+        self.assertTrue(self.webSocket.closed)
+        self.assertEqual(self.read_frame(), (
+            True, application_http.WebSocket.CLOSE, struct.pack('!H', 1001)))
+        self.assertIsNone(self.webSocket.receive())
+
+class ApplicationRoundTrip(object):
+    # Tests of an HTTP Application, running on the headless stand-ins, with
+    # ticks signalled by a thread. Mixed in to a TestCase subclass for each
+    # Application class.
+    switches = ()
+
+    def make_application(self, settings):
+        raise NotImplementedError()
+
+    def setUp(self):
+        blender_driver.headless.reset()
+        self.cwd = os.getcwd()
+        self.website = tempfile.TemporaryDirectory()
+        with open(os.path.join(self.website.name, 'index.html'), 'w') as file_:
+            file_.write('<p>Index</p>')
+        with open(os.path.join(self.website.name, 'style.css'), 'w') as file_:
+            file_.write('p {}')
+
+        scene = blender_driver.headless.bge.logic.getCurrentScene()
+        self.application = self.make_application({'arguments': {
+            'applicationSwitches': ['--directory', self.website.name]
+            + list(self.switches)}})
+        self.application.game_constructor(scene, scene.addObject('gateway'))
+        self.application.game_initialise()
+        self.stopTicks = threading.Event()
+        self.ticker = threading.Thread(target=self.tick)
+        self.ticker.start()
+        address = urllib.parse.urlsplit(self.application.url)
+        self.connection = http.client.HTTPConnection(
+            address.hostname, address.port, timeout=10.0)
+
+    def tick(self):
+        while not self.stopTicks.wait(0.01):
+            self.application.game_tick()
+
+    def tearDown(self):
+        self.connection.close()
+        self.stopTicks.set()
+        self.ticker.join()
+        try:
+            self.application.game_terminate()
+        finally:
+            os.chdir(self.cwd)
+            self.website.cleanup()
+
+    def request(self, method, path, value=None):
+        # Returns a tuple of the status, the content type, and the body.
+        body = None if value is None else json.dumps(value)
+        self.connection.request(method, path, body)
+        response = self.connection.getresponse()
+        return (
+            response.status, response.getheader('Content-Type')
+            , response.read())
+
+    def get_json(self, path):
+        status, contentType, body = self.request('GET', path)
+        self.assertEqual(status, 200, path)
+        self.assertTrue(contentType.startswith('application/json'))
+        return json.loads(body.decode('utf-8'))
+
+    def test_round_trip(self):
+        # The tick walks the game objects, which are put first, as they would
+        # be in a scene.
+        self.assertEqual(
+            self.request('PUT', '/api/root/gameObjects', {})[0], 200)
+        self.assertEqual(
+            self.request('PUT', '/api/root/numbers', [1, 2, 3])[0], 200)
+        self.assertEqual(self.get_json('/api/root/numbers'), [1, 2, 3])
+        self.assertEqual(
+            self.request('PUT', '/api/root/numbers/1', 'two')[0], 200)
+        self.assertEqual(self.get_json('/api/root/numbers/1'), 'two')
+        self.assertEqual(self.request('GET', '/api/root/missing')[0], 404)
+        #
+        # Later GETs are served from a snapshot, once a tick has published one,
+        # and get the same value.
+        for index in range(5):
+            self.assertEqual(self.get_json('/api/root/numbers'), [1, 'two', 3])
+            time.sleep(0.01)
+        self.assertIsNotNone(self.application.published_snapshot())
+
+    def test_static(self):
+        status, contentType, body = self.request('GET', '/')
+        self.assertEqual((status, body), (200, b'<p>Index</p>'))
+        self.assertTrue(contentType.startswith('text/html'))
+        status, contentType, body = self.request('GET', '/style.css')
+        self.assertEqual((status, body), (200, b'p {}'))
+        self.assertTrue(contentType.startswith('text/css'))
+        self.assertEqual(self.request('GET', '/missing.html')[0], 404)
+        #
+        # A path can't go above the website directory.
+        self.assertEqual(self.request('GET', '/../style.css')[0], 200)
+        self.assertEqual(self.request(
+            'GET', '/../' + os.path.basename(self.website.name) + '/style.css'
+            )[0], 404)
+        self.assertEqual(self.request('GET', '/../../../etc/hostname')[0], 404)
+
+class TestHTTPApplication(ApplicationRoundTrip, unittest.TestCase):
+    def make_application(self, settings):
+        return application_http.Application(settings)
+
+    def test_terminate(self):
+        # The server thread finishes, even with a connection kept alive.
+        self.assertEqual(
+            self.request('PUT', '/api/root/number', 1)[0], 200)
+        self.stopTicks.set()
+        self.ticker.join()
+        self.application.game_terminate()
+        self.assertFalse(any(
+            thread.name.startswith('http_')
+            for thread in threading.enumerate()))
+        self.application.game_terminate = lambda: None
+
+class TestDeferredWrites(ApplicationRoundTrip, unittest.TestCase):
+    # The round trip tests pass with deferred writes too, which are applied at
+    # the start of the next tick.
+    switches = ('--deferWrites',)
+
+    def make_application(self, settings):
+        return application_http.Application(settings)
+
+    def test_no_wait(self):
+        status, contentType, body = self.request(
+            'PUT', '/api/root/number?wait=false', 1)
+        self.assertEqual(status, 202)
+        sequence = json.loads(body.decode('utf-8'))['sequence']
+        self.assertEqual(self.get_json('/api/_applied')['queued'], sequence)
+        deadline = time.perf_counter() + 5.0
+        while self.get_json('/api/_applied')['applied'] < sequence:
+            self.assertLess(time.perf_counter(), deadline)
+            time.sleep(0.01)
+        self.assertEqual(self.get_json('/api/root/number'), 1)
+
+    def test_error(self):
+        # The status of a deferred write that fails reaches the client.
+        self.assertEqual(self.request('DELETE', '/api/root/missing')[0], 404)
+        self.assertEqual(
+            self.request('PUT', '/api/root/number', 1)[0], 200)
+        self.assertEqual(self.request('DELETE', '/api/root/number')[0], 200)
+
+    def test_terminate(self):
+        # A write that was accepted but not yet applied isn't lost when the
+        # application terminates.
+        self.stopTicks.set()
+        self.ticker.join()
+        self.assertEqual(self.request(
+            'PUT', '/api/root/number?wait=false', 2)[0], 202)
+        self.connection.close()
+        self.application.game_terminate()
+        self.application.game_terminate = lambda: None
+        self.assertEqual(
+            self.application._restInterface.rest_get(('root', 'number')), 2)
+
+class TestAsyncHTTPApplication(ApplicationRoundTrip, unittest.TestCase):
+    def make_application(self, settings):
+        return application_asynchttp.Application(settings)
+
+    def test_static_thread(self):
+        # Static files are read on the static threads, not on the loop.
+        threads = []
+        read_static = self.application._read_static
+        def recording(url):
+            threads.append(threading.current_thread().name)
+            return read_static(url)
+        self.application._read_static = recording
+        self.assertEqual(self.request('GET', '/style.css')[0], 200)
+        self.assertEqual(len(threads), 1)
+        self.assertTrue(threads[0].startswith('http_static'), threads)
+
+    def test_terminate(self):
+        self.assertEqual(self.request('GET', '/')[0], 200)
+        self.stopTicks.set()
+        self.ticker.join()
+        self.application.game_terminate()
+        self.assertFalse(any(
+            thread.name.startswith('http_')
+            for thread in threading.enumerate()))
+        self.application.game_terminate = lambda: None
+
+class TestEventFeed(unittest.TestCase):
+    def setUp(self):
+        self.restInterface = RestInterface()
+        self.restInterface.rest_put(
+            {'a': 1, 'b': [1, 2], 'c': {'d': 'e'}}, ('root',))
+        self.feed = application_http.EventFeed()
+        self.snapshot = None
+
+    def publish(self):
+        previous = self.snapshot
+        self.snapshot = self.restInterface.publish_snapshot()
+        self.feed.publish(previous, self.snapshot)
+
+    def events(self, subscription):
+        # Drain the queue of a subscription. Returns a list of the changes in
+        # each event.
+        events = []
+        while True:
+            try:
+                event = subscription.queue.get_nowait()
+            except queue.Empty:
+                return events
+            events.append(json.loads(event.text())['changes'])
+
+    def test_changes(self):
+        subscription = self.feed.subscribe((('root',),))
+        #
+        # The first event has the whole value.
+        self.publish()
+        self.assertEqual(self.events(subscription), [[{
+            'path': ['root'], 'value': {'a': 1, 'b': [1, 2], 'c': {'d': 'e'}}
+        }]])
+        #
+        # After that, only the changes, including deletions.
+        self.restInterface.rest_put(2, ('root', 'a'))
+        self.restInterface.rest_put('f', ('root', 'c', 'd'))
+        self.publish()
+        self.assertEqual(self.events(subscription), [sorted([
+            {'path': ['root', 'a'], 'value': 2},
+            {'path': ['root', 'c', 'd'], 'value': 'f'}
+        ], key=lambda change: change['path'])])
+        self.restInterface.rest_delete(('root', 'c'))
+        self.restInterface.rest_put(3, ('root', 'b', 1))
+        self.publish()
+        self.assertEqual(self.events(subscription), [[
+            {'path': ['root', 'b', 1], 'value': 3},
+            {'path': ['root', 'c'], 'deleted': True}]])
+        #
+        # No event if nothing changed, even if the snapshot was published.
+        self.publish()
+        self.assertEqual(self.events(subscription), [])
+        #
+        # A list that changes length is sent whole.
+        self.restInterface.rest_put([1, 3, 4], ('root', 'b'))
+        self.publish()
+        self.assertEqual(self.events(subscription), [[
+            {'path': ['root', 'b'], 'value': [1, 3, 4]}]])
+
+    def test_missing_path(self):
+        # The first event says that a path that isn't in the store is deleted,
+        # after that there's only an event if it changes.
+        subscription = self.feed.subscribe((('root', 'x'),))
+        self.publish()
+        self.assertEqual(self.events(subscription), [[
+            {'path': ['root', 'x'], 'deleted': True}]])
+        self.publish()
+        self.assertEqual(self.events(subscription), [])
+        self.restInterface.rest_put({'y': 1}, ('root', 'x'))
+        self.publish()
+        self.assertEqual(self.events(subscription), [[
+            {'path': ['root', 'x'], 'value': {'y': 1}}]])
+        self.restInterface.rest_delete(('root', 'x'))
+        self.publish()
+        self.assertEqual(self.events(subscription), [[
+            {'path': ['root', 'x'], 'deleted': True}]])
+
+    def test_subscribers(self):
+        self.publish()
+        self.assertEqual(self.feed.subscribers, 0)
+        both = self.feed.subscribe((('root', 'a'), ('root', 'c')))
+        onlyA = self.feed.subscribe((('root', 'a'),))
+        onlyB = self.feed.subscribe((('root', 'b'),))
+        self.assertEqual(self.feed.subscribers, 3)
+        #
+        # Each subscription gets the changes under its own paths, and nothing
+        # if there aren't any.
+        self.restInterface.rest_put(2, ('root', 'a'))
+        self.restInterface.rest_put('f', ('root', 'c', 'd'))
+        self.publish()
+        self.assertEqual(self.events(both), [[
+            {'path': ['root', 'a'], 'value': 2},
+            {'path': ['root', 'c', 'd'], 'value': 'f'}]])
+        self.assertEqual(self.events(onlyA), [[
+            {'path': ['root', 'a'], 'value': 2}]])
+        self.assertEqual(self.events(onlyB), [])
+        #
+        # Unsubscribing stops the events to that subscription only.
+        self.feed.unsubscribe(onlyA)
+        self.assertEqual(self.feed.subscribers, 2)
+        self.restInterface.rest_put(3, ('root', 'a'))
+        self.publish()
+        self.assertEqual(self.events(onlyA), [])
+        self.assertEqual(self.events(both), [[
+            {'path': ['root', 'a'], 'value': 3}]])
+
+    def test_slow_subscriber(self):
+        self.publish()
+        slow = self.feed.subscribe((('root', 'a'),))
+        fast = self.feed.subscribe((('root', 'a'),))
+        size = self.feed._queueSize
+        for value in range(size + 3):
+            self.restInterface.rest_put(value, ('root', 'a'))
+            self.publish()
+            self.assertEqual(self.events(fast), [[
+                {'path': ['root', 'a'], 'value': value}]])
+        #
+        # The slow subscription's queue filled up, so it missed some changes,
+        # and is marked for a resync.
+        self.assertTrue(slow.resync)
+        self.assertFalse(fast.resync)
+        self.assertEqual(self.events(slow), [
+            [{'path': ['root', 'a'], 'value': value}]
+            for value in range(size)])
+        #
+        # The next publish sends it the whole value, even though nothing
+        # changed, then it gets changes again.
+        self.publish()
+        self.assertEqual(self.events(slow), [[
+            {'path': ['root', 'a'], 'value': size + 2}]])
+        self.assertEqual(self.events(fast), [])
+        self.assertFalse(slow.resync)
+        self.restInterface.rest_put(-1, ('root', 'a'))
+        self.publish()
+        self.assertEqual(self.events(slow), [[
+            {'path': ['root', 'a'], 'value': -1}]])
+
+    def test_event_encoding(self):
+        event = application_http.EventFeed.Event(
+            [{'path': ['root', 'a'], 'value': 1}])
+        self.assertEqual(json.loads(event.text()), {
+            'changes': [{'path': ['root', 'a'], 'value': 1}]})
+        self.assertEqual(
+            event.data(), b'data: ' + event.text().encode('utf-8') + b'\n\n')
+        #
+        # Encoded once, however many subscriptions send it.
+        self.assertIs(event.text(), event.text())
+        self.assertIs(event.data(), event.data())
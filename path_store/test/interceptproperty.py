@@ -394,6 +394,43 @@ class TestInterceptProperty(unittest.TestCase):
         self.assertIs(intercept, principal.destinationReadOnly)
         self.assertEqual([5,7,3,4], principal.destinationReadOnly[:])
     
+    def test_item_setter(self):
+        list_ = [1,2]
+        principal = Principal((1,2), list_, ReadOnly([1,2]))
+        #
+        # Getting the callable doesn't set anything. Destination that can be
+        # set at the item level is set in place, and observers are notified
+        # once for each set.
+        changes = []
+        class Observer(object):
+            def intercept_changed(self, instance):
+                changes.append(instance)
+        observer = Observer()
+        InterceptProperty.observers.add(observer)
+        try:
+            set_item = principal.destinationList.item_setter(1)
+            self.assertEqual(changes, [])
+            set_item(3)
+            self.assertEqual(changes, [principal])
+        finally:
+            InterceptProperty.observers.discard(observer)
+        self.assertIs(list_, principal.destination.destinationList)
+        self.assertEqual([1,3], list_)
+        #
+        # Destinations that can't be set at the item level are replaced, and
+        # keep their class.
+        for name in ('destinationTuple', 'destinationReadOnly'):
+            underlaying = getattr(principal.destination, name)
+            set_item = getattr(principal, name).item_setter(0)
+            self.assertIs(underlaying, getattr(principal.destination, name))
+            set_item(5)
+            self.assertIsNot(underlaying, getattr(principal.destination, name))
+            self.assertIsInstance(
+                getattr(principal.destination, name), underlaying.__class__)
+            self.assertEqual([5,2], list(getattr(principal, name)[:]))
+            set_item(6)
+            self.assertEqual([6,2], list(getattr(principal, name)[:]))
+
     def test_list_destination_setitem(self):
         list_ = [1,2]
         principal = Principal(tuple(), list_, tuple())
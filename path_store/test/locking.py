@@ -0,0 +1,139 @@
+#!/usr/bin/python
+# (c) 2018 Jim Hawkins. MIT licensed, see https://opensource.org/licenses/MIT
+# Part of Blender Driver, see https://github.com/sjjhsjjh/blender-driver
+"""Path Store unit test module. Tests in this module can be run like:
+
+    python3 path_store/test.py TestPathLocks
+"""
+# Exit if run other than as a module.
+if __name__ == '__main__':
+    print(__doc__)
+    raise SystemExit(1)
+
+# Standard library imports, in alphabetic order.
+#
+# Module for Thread and Event classes.
+# https://docs.python.org/3/library/threading.html
+import threading
+#
+# Unit test module.
+# https://docs.python.org/3.5/library/unittest.html
+import unittest
+#
+# Local imports.
+#
+# Modules under test.
+from path_store import locking
+from path_store import rest
+
+class Attempts(object):
+    # Tries to enter context managers on other threads. The threads are joined
+    # in finish(), which must be called after releasing any locks that they
+    # could be waiting for.
+    def acquired(self, manager):
+        # Return whether the context manager could be entered without waiting
+        # for long.
+        entered = threading.Event()
+        def run():
+            with manager:
+                entered.set()
+        thread = threading.Thread(target=run)
+        thread.start()
+        self._threads.append(thread)
+        return entered.wait(0.2)
+
+    def finish(self):
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+
+    def __init__(self):
+        self._threads = []
+
+class TestPathLocks(unittest.TestCase):
+    def test_read_write_lock(self):
+        lock = locking.ReadWriteLock()
+        self.assertEqual(lock.acquire_read(), 0.0)
+        self.assertEqual(lock.acquire_read(), 0.0)
+        self.assertIsNone(lock.acquire_write(False))
+        lock.release_read()
+        lock.release_read()
+        self.assertEqual(lock.acquire_write(False), 0.0)
+        self.assertIsNone(lock.acquire_read(False))
+        self.assertIsNone(lock.acquire_write(False))
+        lock.release_write()
+        self.assertEqual(lock.writes, 1)
+
+    def test_subtree(self):
+        locks = locking.PathLocks(('animations', ('root', 'gameObjects')))
+        self.assertEqual(locks.subtree(('animations', 'a', 0)), ('animations',))
+        self.assertEqual(
+            locks.subtree(('root', 'gameObjects')), ('root', 'gameObjects'))
+        self.assertIsNone(locks.subtree(('root',)))
+        self.assertIsNone(locks.subtree(()))
+        self.assertEqual(locks.subtree(
+            rest.pathstore.CompiledPath.split('root/gameObjects/*/name'))
+            , ('root', 'gameObjects'))
+        self.assertIsNone(locks.subtree(
+            rest.pathstore.CompiledPath.split('root/*/name')))
+
+        self.assertTrue(locks.covers(
+            ('animations', ('root', 'gameObjects')), (('animations', 'a'),)))
+        self.assertFalse(locks.covers(
+            ('animations',), (('root', 'gameObjects', 0),)))
+        self.assertTrue(locks.covers(
+            ('animations', ('root', 'numbers')), (('root', 'gameObjects', 0),)))
+
+        with self.assertRaises(ValueError):
+            locking.PathLocks(('root', ('root', 'gameObjects')))
+
+    def test_exclusion(self):
+        locks = locking.PathLocks(('animations', ('root', 'gameObjects')))
+        gameObject = ('root', 'gameObjects', 0)
+        attempts = Attempts()
+        with locks.write('animations', owner='tick'):
+            # Readers and writers of other subtrees, and of paths outside any
+            # subtree, don't wait.
+            self.assertTrue(attempts.acquired(locks.read(gameObject)))
+            self.assertTrue(attempts.acquired(locks.write(gameObject)))
+            self.assertTrue(attempts.acquired(locks.read(('root', 'a'))))
+            #
+            # Readers of the subtree, or above it, and writers outside any
+            # subtree, wait.
+            self.assertFalse(attempts.acquired(
+                locks.read(('animations', 'a'))))
+            self.assertFalse(attempts.acquired(locks.read(())))
+            self.assertFalse(attempts.acquired(locks.write(('root', 'a'))))
+            self.assertFalse(attempts.acquired(locks.storeLock))
+        attempts.finish()
+
+        with locks.read(gameObject), locks.read(('root', 'a')):
+            self.assertTrue(attempts.acquired(locks.read(())))
+            self.assertFalse(attempts.acquired(locks.write(gameObject)))
+        attempts.finish()
+
+        contention = locks.contention
+        self.assertEqual(contention['tick']['write']['acquisitions'], 1)
+        self.assertEqual(contention['tick']['write']['contended'], 0)
+        self.assertEqual(contention[None]['read']['contended'], 2)
+        self.assertGreater(contention[None]['read']['waitSeconds'], 0.0)
+
+    def test_animation_targets(self):
+        interface = rest.AnimatedRestInterface()
+        interface.rest_put(0.0, ('root', 'number'))
+        version = interface.version
+        interface.rest_put({
+            'valuePath': ('root', 'number'),
+            'subjectPath': ('root', 'gameObjects', 1),
+            'speed': 1.0,
+            'targetValue': 1.0
+        }, ('animations', 'test', 0))
+        self.assertNotEqual(interface.version, version)
+        self.assertEqual(interface.animation_targets(), {
+            ('root', 'number'), ('root', 'gameObjects', 1)})
+
+        version = interface.version
+        interface.rest_set(0.5, ('root', 'number'))
+        self.assertEqual(interface.version, version)
+        interface.rest_get(('animations', 'test', 0)).stopped = True
+        self.assertEqual(interface.animation_targets(), set())
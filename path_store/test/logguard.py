@@ -0,0 +1,76 @@
+#!/usr/bin/python
+# (c) 2018 Jim Hawkins. MIT licensed, see https://opensource.org/licenses/MIT
+# Part of Blender Driver, see https://github.com/sjjhsjjh/blender-driver
+"""\
+Path Store unit test module. Tests in this module can be run like:
+
+    python3 path_store/test.py TestLogGuard
+"""
+# Exit if run other than as a module.
+if __name__ == '__main__':
+    print(__doc__)
+    raise SystemExit(1)
+
+# Standard library imports, in alphabetic order.
+#
+# Module for levelled logging messages.
+# https://docs.python.org/3.5/library/logging.html
+import logging
+#
+# Unit test module.
+# https://docs.python.org/3.5/library/unittest.html
+import unittest
+#
+# Local imports.
+#
+# Modules under test.
+from path_store import logguard
+import pathstore
+
+class TestLogGuard(unittest.TestCase):
+    def setUp(self):
+        self.level = logging.root.level
+
+    def tearDown(self):
+        logging.root.setLevel(self.level)
+        logguard.refresh()
+
+    def test_refresh(self):
+        logging.root.setLevel(logging.INFO)
+        self.assertFalse(logguard.refresh())
+        self.assertFalse(logguard.debug)
+        self.assertTrue(logguard.info)
+        logging.root.setLevel(logging.DEBUG)
+        #
+        # Guards don't change until refresh.
+        self.assertFalse(logguard.debug)
+        self.assertTrue(logguard.refresh())
+        self.assertTrue(logguard.debug)
+
+    def test_guarded_arguments(self):
+        # Arguments of the guarded log calls in the descent aren't evaluated
+        # when DEBUG is disabled.
+        class Principal(object):
+            def __init__(self):
+                self.strings = 0
+            def __str__(self):
+                self.strings += 1
+                return "principal"
+
+        principal = Principal()
+        logging.root.setLevel(logging.INFO)
+        logguard.refresh()
+        parent = pathstore.replace({'key': principal}, 1, ['key'])
+        self.assertEqual(parent, {'key': 1})
+        self.assertEqual(principal.strings, 0)
+        #
+        # Same replacement with DEBUG enabled evaluates the arguments, which
+        # shows that the test would catch an unguarded call.
+        logging.root.setLevel(logging.DEBUG)
+        logguard.refresh()
+        logging.disable(logging.DEBUG)
+        try:
+            pathstore.replace({'key': principal}, 1, ['key'])
+        finally:
+            logging.disable(logging.NOTSET)
+        self.assertGreater(principal.strings, 0)
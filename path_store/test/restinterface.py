@@ -25,6 +25,7 @@ from unittest.mock import call, Mock
 # Modules under test.
 from path_store import rest
 from path_store.blender_game_engine import gameobjectcollection
+from path_store.hosted import InterceptProperty
 
 class MockGameObject(Mock):
     def endObject(self):
@@ -86,3 +87,303 @@ class TestRestInterface(unittest.TestCase):
         self.assertEqual(
             interface.rest_get(interface.gameObjectPath), [None, None, None])
         self.assertEqual(mock.endObject.call_args_list, [call()])
+
+    def test_being_animated(self):
+        class Subject(object):
+            def __init__(self):
+                self.beingAnimated = False
+                self.x = 0.0
+                self.y = 0.0
+
+        interface = rest.AnimatedRestInterface()
+        subjects = (Subject(), Subject())
+        for index, subject in enumerate(subjects):
+            interface.rest_put(subject, ('root', 'subjects', index))
+        #
+        # Subject zero has two animations, which complete at different times.
+        # Subject one has one animation.
+        for name, index, dimension, target in (
+            ('fast', 0, 'x', 1.0), ('slow', 0, 'y', 3.0), ('other', 1, 'x', 2.0)
+        ):
+            interface.rest_put({
+                'subjectPath': ('root', 'subjects', index),
+                'valuePath': ('root', 'subjects', index, dimension),
+                'startValue': 0.0,
+                'speed': 1.0,
+                'targetValue': target
+            }, ('animations', name, 0))
+            interface.rest_get(('animations', name, 0)).startTime = 0.0
+        self.assertTrue(subjects[0].beingAnimated)
+        self.assertTrue(subjects[1].beingAnimated)
+
+        anyCompletions, log = interface.set_now_times(1.5)
+        self.assertTrue(anyCompletions)
+        self.assertEqual(list(log), [(['animations', 'fast', 0], "Complete")])
+        self.assertEqual(log.tree, {'animations': {
+            'fast': ["Complete"], 'slow': ["Incomplete"]
+            , 'other': ["Incomplete"]}})
+        self.assertIsNone(interface.rest_get(('animations', 'fast', 0)))
+        self.assertTrue(subjects[0].beingAnimated)
+        self.assertTrue(subjects[1].beingAnimated)
+
+        anyCompletions, log = interface.set_now_times(2.5)
+        self.assertIsNone(interface.rest_get(('animations', 'other', 0)))
+        self.assertTrue(subjects[0].beingAnimated)
+        self.assertFalse(subjects[1].beingAnimated)
+        #
+        # Stopping an animation counts as completion.
+        interface.rest_get(('animations', 'slow', 0)).stopped = True
+        anyCompletions, log = interface.set_now_times(2.6)
+        self.assertTrue(anyCompletions)
+        self.assertEqual(str(log), str({'animations': {
+            'fast': [None], 'slow': ["Stopped"], 'other': [None]}}))
+        #
+        # Nothing changes in the next tick.
+        anyCompletions, log = interface.set_now_times(2.7)
+        self.assertFalse(anyCompletions)
+        self.assertEqual(len(log), 0)
+        self.assertIsNone(interface.rest_get(('animations', 'slow', 0)))
+        self.assertFalse(subjects[0].beingAnimated)
+        self.assertEqual(subjects[0].y, 2.5)
+
+    def test_insert(self):
+        interface = rest.RestInterface()
+        for index in range(3):
+            interface.rest_put(index * 10, ('root', 'list', index))
+        self.assertEqual(interface.rest_get(('root', 'list', 2)), 20)
+        self.assertEqual(interface.get_generic(('root', 'list')), [0, 10, 20])
+
+        deleted = interface.rest_delete(('root', 'list', 1))
+        self.assertEqual(interface.rest_get(('root', 'list', 1)), 20)
+        interface.rest_insert(deleted, ('root', 'list', 1))
+        self.assertEqual(interface.principal['root']['list'], [0, 10, 20])
+        self.assertEqual(interface.rest_get(('root', 'list', 2)), 20)
+        self.assertEqual(interface.get_generic(('root', 'list')), [0, 10, 20])
+
+    def test_generic_copy(self):
+        interface = rest.RestInterface()
+        interface.rest_put(1.5, ('root', 'a', 0))
+        interface.rest_put("text", ('root', 'b', 'c'))
+        interface.rest_put((2, 3), ('root', 'd'))
+        generic = interface.get_generic()
+        copy = rest.generic_copy(generic)
+        self.assertEqual(copy, {'root': {
+            'a': [1.5], 'b': {'c': "text"}, 'd': [2, 3]}})
+        self.assertIsNot(copy['root'], generic['root'])
+        self.assertIsNot(copy['root']['a'], generic['root']['a'])
+        #
+        # Changes to the store don't affect the copy.
+        interface.rest_put(2.5, ('root', 'a', 0))
+        interface.rest_delete(('root', 'b', 'c'))
+        self.assertEqual(copy['root']['a'], [1.5])
+        self.assertEqual(copy['root']['b'], {'c': "text"})
+
+    def test_snapshot(self):
+        interface = rest.RestInterface()
+        self.assertIsNone(interface.snapshot)
+        interface.rest_put([1.5, 2.5], ('root', 'a'))
+        interface.rest_put({'c': "text"}, ('root', 'b'))
+        first = interface.publish_snapshot()
+        self.assertIs(interface.snapshot, first)
+        self.assertEqual(first.version, interface.version)
+        self.assertEqual(first.get(('root', 'a', 1)), 2.5)
+        #
+        # Nothing changed, so the whole snapshot is shared.
+        second = interface.publish_snapshot()
+        self.assertIsNot(second, first)
+        self.assertIs(second.generic, first.generic)
+        #
+        # Only the changed parts are copied. Setting a value doesn't change
+        # the version, but does change the next snapshot.
+        interface.rest_set(3.5, ('root', 'a', 0))
+        self.assertEqual(interface.version, second.version)
+        third = interface.publish_snapshot()
+        self.assertEqual(third.get(('root', 'a')), [3.5, 2.5])
+        self.assertEqual(second.get(('root', 'a')), [1.5, 2.5])
+        self.assertIs(third.get(('root', 'b')), second.get(('root', 'b')))
+        #
+        # A structural change does change the version.
+        interface.rest_put(4, ('root', 'b', 'd'))
+        self.assertNotEqual(interface.version, third.version)
+        fourth = interface.publish_snapshot()
+        self.assertEqual(fourth.get(('root', 'b')), {'c': "text", 'd': 4})
+        self.assertEqual(third.get(('root', 'b')), {'c': "text"})
+
+    def test_snapshot_stale(self):
+        interface = rest.RestInterface()
+        self.assertTrue(interface.snapshotStale)
+        interface.rest_put([1.5, 2.5], ('root', 'a'))
+        interface.publish_snapshot()
+        self.assertFalse(interface.snapshotStale)
+        #
+        # Setting a value makes it stale without changing the version.
+        interface.rest_set(3.5, ('root', 'a', 0))
+        self.assertTrue(interface.snapshotStale)
+        interface.publish_snapshot()
+        self.assertFalse(interface.snapshotStale)
+        #
+        # So does marking a path dirty, or a structural change.
+        interface.mark_dirty(('root', 'a'))
+        self.assertTrue(interface.snapshotStale)
+        interface.publish_snapshot()
+        self.assertFalse(interface.snapshotStale)
+        interface.rest_put(4, ('root', 'b'))
+        self.assertTrue(interface.snapshotStale)
+        interface.publish_snapshot()
+        self.assertFalse(interface.snapshotStale)
+        #
+        # A volatile object keeps it stale.
+        class Moving(object):
+            def __init__(self):
+                self.position = 0.0
+
+        interface.volatile = lambda point: isinstance(point, Moving)
+        interface.rest_put(Moving(), ('root', 'c'))
+        interface.publish_snapshot()
+        self.assertTrue(interface.snapshotStale)
+
+    def test_dirty(self):
+        class Counted(object):
+            # Object with a property that counts how many times it is read.
+            def __init__(self):
+                self.reads = 0
+                self._value = 1.0
+            @property
+            def value(self):
+                self.reads += 1
+                return self._value
+            @value.setter
+            def value(self, value):
+                self._value = value
+
+        interface = rest.RestInterface()
+        counted = Counted()
+        interface.rest_put(counted, ('root', 'counted'))
+        interface.rest_put(2.0, ('root', 'number'))
+        interface.rest_get(('root', 'counted', 'value'))
+        self.assertEqual(
+            interface.get_generic(('root', 'counted', 'value')), 1.0)
+        self.assertEqual(interface.get_generic(), {'root': {
+            'counted': {'value': 1.0}, 'number': 2.0}})
+        reads = counted.reads
+        #
+        # The object hasn't changed, so it isn't read again.
+        self.assertEqual(
+            interface.get_generic(('root', 'counted')), {'value': 1.0})
+        self.assertEqual(interface.get_generic()['root']['number'], 2.0)
+        self.assertEqual(counted.reads, reads)
+        #
+        # Setting through the interface marks the whole object dirty.
+        interface.rest_set(3.0, ('root', 'counted', 'value'))
+        self.assertEqual(
+            interface.get_generic(('root', 'counted')), {'value': 3.0})
+        self.assertGreater(counted.reads, reads)
+        #
+        # Changing the object directly isn't seen, until it is marked.
+        counted.value = 4.0
+        self.assertEqual(
+            interface.get_generic(('root', 'counted')), {'value': 3.0})
+        interface.mark_dirty(('root', 'counted', 'value'))
+        self.assertEqual(
+            interface.get_generic(('root', 'counted')), {'value': 4.0})
+        #
+        # A volatile object is refreshed every time.
+        interface.volatile = lambda point: point is counted
+        counted.value = 5.0
+        self.assertEqual(
+            interface.get_generic(('root', 'counted')), {'value': 5.0})
+        #
+        # Deleting from a list refreshes the whole list.
+        for index in range(3):
+            interface.rest_put(index + 1, ('root', 'list', index))
+        self.assertEqual(interface.get_generic(('root', 'list')), [1, 2, 3])
+        interface.rest_delete(('root', 'list', 0))
+        self.assertEqual(interface.get_generic(('root', 'list')), [2, 3])
+
+    def test_dirty_roots(self):
+        interface = rest.RestInterface()
+        for index in range(3):
+            interface.rest_put(
+                {'a': index, 'b': [index]}, ('root', 'things', index))
+        interface.get_generic()
+        for index in range(3):
+            interface.principal['root']['things'][index]['a'] = index + 10
+            interface.mark_dirty(('root', 'things', index, 'a'))
+        interface.mark_dirty(('root', 'things', 1))
+        interface.mark_dirty(('root', 'things', 1, 'b', 0))
+        #
+        # Dirty paths under a dirty root are covered by it, and the paths that
+        # aren't under the path got are kept.
+        self.assertEqual(interface._take_dirty(('root', 'things', 1)), [
+            ('root', 'things', 1)])
+        self.assertEqual(interface._dirty, set((
+            ('root', 'things', 0, 'a'), ('root', 'things', 2, 'a'))))
+        #
+        # The kept paths are still refreshed by the next get.
+        generic = interface.get_generic(('root', 'things'))
+        self.assertEqual((generic[0]['a'], generic[2]['a']), (10, 12))
+        #
+        # Paths marked past the buffer limit are merged straight away.
+        interface._dirtyBufferLimit = 2
+        interface.mark_dirty(('root', 'things', 0))
+        self.assertEqual(len(interface._dirtyBuffer), 1)
+        interface.mark_dirty(('root', 'things', 2))
+        self.assertEqual(len(interface._dirtyBuffer), 0)
+        self.assertIn(('root', 'things', 2), interface._dirty)
+
+    def test_intercept_changed(self):
+        # Observers are notified of sets of InterceptProperty instances.
+        class Principal(object):
+            def __init__(self):
+                self._destination = [0, 0]
+
+            @InterceptProperty()
+            def destination(self):
+                return self._destination
+            @destination.intercept_getter
+            def destination(self):
+                return self._intercepted
+            @destination.intercept_setter
+            def destination(self, value):
+                self._intercepted = value
+            @destination.destination_setter
+            def destination(self, value):
+                self._destination = value
+
+        interface = rest.RestInterface()
+        principal = Principal()
+        interface.rest_put(principal, ('root', 'principal'))
+        path = ('root', 'principal', 'destination', 1)
+        interface.rest_get(path)
+        self.assertEqual(interface.get_generic(path), 0)
+        principal.destination[1] = 2
+        self.assertEqual(interface.get_generic(path), 2)
+        principal.destination = [3, 4]
+        self.assertEqual(interface.get_generic(path), 4)
+        #
+        # A setter from rest_setter() marks the object dirty once, by the
+        # notification.
+        setter = interface.rest_setter(path)
+        setter(5)
+        self.assertEqual(
+            list(interface._dirtyBuffer), [('root', 'principal')])
+        self.assertEqual(interface.get_generic(path), 5)
+
+    def test_generic_changes(self):
+        interface = rest.RestInterface()
+        interface.rest_put([1.5, 2.5], ('root', 'a'))
+        interface.rest_put({'c': "text"}, ('root', 'b'))
+        interface.rest_put(1, ('root', 'e'))
+        first = interface.publish_snapshot()
+        self.assertEqual(list(rest.generic_changes(
+            first.generic, interface.publish_snapshot().generic)), [])
+
+        interface.rest_set(3.5, ('root', 'a', 1))
+        interface.rest_put(4, ('root', 'b', 'd'))
+        interface.rest_delete(('root', 'e'))
+        second = interface.publish_snapshot()
+        self.assertEqual(sorted(rest.generic_changes(
+            first.get(('root',)), second.get(('root',)), ('root',))), [
+                (('root', 'a', 1), False, 3.5),
+                (('root', 'b', 'd'), False, 4),
+                (('root', 'e'), True, None)])
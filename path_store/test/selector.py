@@ -0,0 +1,132 @@
+#!/usr/bin/python
+# (c) 2018 Jim Hawkins. MIT licensed, see https://opensource.org/licenses/MIT
+# Part of Blender Driver, see https://github.com/sjjhsjjh/blender-driver
+"""Path Store unit test module. Tests in this module can be run like:
+
+    python3 path_store/test.py TestSelect
+"""
+# Exit if run other than as a module.
+if __name__ == '__main__':
+    print(__doc__)
+    raise SystemExit(1)
+
+# Standard library imports, in alphabetic order.
+#
+# Unit test module.
+# https://docs.python.org/3.5/library/unittest.html
+import unittest
+#
+# Local imports.
+#
+# Utilities.
+from path_store.test.principal import Principal
+#
+# Modules under test.
+import pathstore
+from path_store import rest
+
+class TestSelect(unittest.TestCase):
+    def test_split(self):
+        self.assertEqual(
+            list(pathstore.pathify_split("root/*/**/a[b=true][c!=\"d\"]")), [
+                'root', pathstore.Wildcard(), pathstore.RecursiveWildcard()
+                , 'a', pathstore.Predicate('b', True)
+                , pathstore.Predicate('c', "d", True)])
+        self.assertEqual(
+            list(pathstore.pathify_split("*[name=word]")), [
+                pathstore.Wildcard(), pathstore.Predicate('name', "word")])
+        with self.assertRaises(ValueError):
+            list(pathstore.pathify_split("[name]"))
+
+        path = pathstore.CompiledPath.split("root/*[physics=false]/x")
+        self.assertEqual(path.selectors, (1, 2))
+        self.assertTrue(pathstore.has_selector(path))
+        self.assertTrue(pathstore.has_selector(list(path)))
+        self.assertFalse(pathstore.has_selector(('root', 1, slice(None))))
+        self.assertEqual(str(path[2]), '[physics=false]')
+
+    def test_abstract(self):
+        # The base class has no select() so it can't be constructed.
+        with self.assertRaises(TypeError):
+            pathstore.Selector()
+
+    def test_wildcard(self):
+        parent = {'list': [{'a': 1}, None, {'a': 2}, {'b': 3}], 'c': 4}
+        selected = pathstore.select(parent, ('list', pathstore.Wildcard()))
+        self.assertEqual(
+            [path for path, point in selected]
+            , [('list', 0), ('list', 2), ('list', 3)])
+        self.assertIsInstance(selected[0][0], pathstore.CompiledPath)
+        self.assertIs(selected[1][1], parent['list'][2])
+
+        # Legs that can't be descended don't match, rather than raising.
+        selected = pathstore.select(
+            parent, pathstore.CompiledPath.split("list/*/a"))
+        self.assertEqual(
+            selected, [(('list', 0, 'a'), 1), (('list', 2, 'a'), 2)])
+        self.assertEqual(pathstore.select(parent, "nothing"), [])
+        self.assertEqual(pathstore.select(parent, "c/*"), [])
+
+        selected = pathstore.select(parent, ('list', slice(1, 3)))
+        self.assertEqual(
+            selected, [(('list', 1), None), (('list', 2), {'a': 2})])
+
+    def test_recursive(self):
+        shared = {'x': 1}
+        parent = {'a': [shared, {'b': shared}], 'c': 2}
+        selected = pathstore.select(parent, pathstore.RecursiveWildcard())
+        self.assertEqual([path for path, point in selected], [
+            (), ('a',), ('a', 0), ('a', 0, 'x'), ('a', 1), ('c',)])
+        #
+        # Each point is matched once even with more than one recursion.
+        selected = pathstore.select(parent, pathstore.CompiledPath.split(
+            "**/**/x"))
+        self.assertEqual(selected, [(('a', 0, 'x'), 1)])
+
+    def test_predicate(self):
+        principals = [Principal("one"), Principal("two"), Principal("three")]
+        principals[0].physics = True
+        principals[2].physics = True
+        parent = {'objects': principals}
+        selected = pathstore.select(parent, pathstore.CompiledPath.split(
+            "objects/*[physics=true]/testAttr"))
+        self.assertEqual(
+            selected, [(('objects', 0, 'testAttr'), "one")
+                       , (('objects', 2, 'testAttr'), "three")])
+        selected = pathstore.select(parent, pathstore.CompiledPath.split(
+            "objects/*/[physics!=true]"))
+        self.assertEqual(selected, [(('objects', 1), principals[1])])
+
+    def test_rest_interface(self):
+        # The rest module imports pathstore from the path_store package, which
+        # is a different module object to the one imported here, so its
+        # classes are used for the paths.
+        interface = rest.RestInterface()
+        # Leaf values are put individually because a dictionary that is put
+        # is shared by the principal and generic stores.
+        for index in range(4):
+            interface.rest_put(
+                index % 2 == 0, ('root', 'objects', index, 'physics'))
+            interface.rest_put(index, ('root', 'objects', index, 'mass'))
+        path = rest.pathstore.CompiledPath.split("root/objects/*[physics=true]")
+        interface.rest_patch({'mass': 10}, path)
+        self.assertEqual(
+            [point['mass'] for point in interface.rest_get(('root', 'objects'))]
+            , [10, 1, 10, 3])
+        self.assertEqual(interface.select_generic(path), [
+            (('root', 'objects', 0), {'physics': True, 'mass': 10})
+            , (('root', 'objects', 2), {'physics': True, 'mass': 10})])
+
+        interface.rest_put(5, rest.pathstore.CompiledPath.split(
+            "root/objects/*/[physics=false]/mass"))
+        self.assertEqual(
+            [point['mass'] for point in interface.rest_get(('root', 'objects'))]
+            , [10, 5, 10, 5])
+
+        deleted = interface.rest_delete(path)
+        self.assertEqual(
+            deleted, [{'physics': True, 'mass': 10}] * 2)
+        self.assertEqual(interface.rest_get(('root', 'objects')), [
+            {'physics': False, 'mass': 5}, {'physics': False, 'mass': 5}])
+        self.assertEqual(
+            interface.get_generic(('root', 'objects', 1, 'mass')), 5)
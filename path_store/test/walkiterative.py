@@ -0,0 +1,122 @@
+#!/usr/bin/python
+# (c) 2018 Jim Hawkins. MIT licensed, see https://opensource.org/licenses/MIT
+# Part of Blender Driver, see https://github.com/sjjhsjjh/blender-driver
+"""Path Store unit test module. Tests in this module can be run like:
+
+    python3 path_store/test.py TestWalkIterative
+"""
+# Exit if run other than as a module.
+if __name__ == '__main__':
+    print(__doc__)
+    raise SystemExit(1)
+
+# Standard library imports, in alphabetic order.
+#
+# Module for deep copying.
+# https://docs.python.org/3.5/library/copy.html
+import copy
+#
+# Unit test module.
+# https://docs.python.org/3.5/library/unittest.html
+import unittest
+#
+# Local imports.
+#
+# Modules under test.
+import pathstore
+
+# Structures to walk.
+principals = (
+    4, [], (), [2, 3], ['d', ['a', 'b'], 'c'],
+    {'a': 1, 'b': [1, (2, 3), {'c': 4}]},
+    ((1, 2), (3, (4, 5))),
+    {'x': (1, [2, (3, 4)])})
+
+def editor_append(point, path, results):
+    results.append((point, tuple(path)))
+
+def editor_replace_leaf(point, path, results):
+    results.append(tuple(path))
+    if isinstance(point, int):
+        return True, point * 10
+
+def editor_replace_iterable(point, path, results):
+    results.append(tuple(path))
+    if isinstance(point, tuple):
+        return True, list(point) + ['new']
+    if isinstance(point, int):
+        return True, point + 1
+
+def editor_stop(point, path, results):
+    results.append(tuple(path))
+    if len(results) >= 3:
+        raise StopIteration
+    if isinstance(point, int):
+        return True, -point
+
+def editor_false(point, path, results):
+    results.append(tuple(path))
+    return False, None
+
+def editor_second(point, path, results, second):
+    results.append((point, second, tuple(path)))
+    return True, second
+
+class TestWalkIterative(unittest.TestCase):
+    def compare(self, principal, editor, path=None, second=None
+                , editIterable=False):
+        principals = (copy.deepcopy(principal), copy.deepcopy(principal))
+        results = ([], [])
+        returns = []
+        for index, walker in enumerate(
+            (pathstore.walk, pathstore.walk_iterative)
+        ):
+            returns.append(walker(
+                principals[index], editor, path, results[index], second
+                , editIterable))
+        self.assertEqual(returns[0], returns[1])
+        self.assertIs(type(returns[0]), type(returns[1]))
+        self.assertEqual(results[0], results[1])
+        self.assertEqual(principals[0], principals[1])
+
+    def test_compatible(self):
+        for principal in principals:
+            for editIterable in (False, True):
+                for editor in (
+                    editor_append, editor_replace_leaf
+                    , editor_replace_iterable, editor_stop, editor_false
+                ):
+                    with self.subTest(principal=principal
+                                      , editIterable=editIterable
+                                      , editor=editor.__name__):
+                        self.compare(
+                            principal, editor, editIterable=editIterable)
+                with self.subTest(principal=principal
+                                  , editIterable=editIterable
+                                  , editor=editor_second.__name__):
+                    self.compare(
+                        principal, editor_second, None
+                        , copy.deepcopy(principal), editIterable)
+
+    def test_path(self):
+        principal = {'a': 1, 'b': [1, (2, 3), {'c': 4}]}
+        for path in ('b', ('b', 1), ['b', 2, 'c']):
+            with self.subTest(path=path):
+                self.compare(principal, editor_replace_iterable, path)
+                self.compare(principal, editor_append, path
+                             , editIterable=True)
+
+    def test_leaf_classification(self):
+        class Leaf:
+            pass
+        results = []
+        pathstore.walk_iterative([Leaf(), Leaf(), 'str'], editor_append
+                                 , results=results)
+        self.assertEqual([path for point, path in results]
+                         , [(0,), (1,), (2,)])
+
+    def test_errors(self):
+        with self.assertRaises(TypeError) as context:
+            pathstore.walk_iterative(4, editor_append, 0, [])
+        self.assertEqual(
+            str(context.exception), "Couldn't get point for 0 in 4")
@@ -14,6 +14,47 @@ export default class UserInterface {
         
         this._cameraControls = new CameraControls(this);
         this._cursorControls = new CursorControls(this);
+
+        this.open_socket();
+    }
+    
+    open_socket() {
+        // Operations are sent over a WebSocket when it's open, and as separate
+        // HTTP requests otherwise. The server sends a response message with
+        // the same id for each operation.
+        this._socket = undefined;
+        this._socketID = 0;
+        this._socketRequests = new Map();
+        const url = new URL(this.api_path(['_socket']), window.location.href);
+        url.protocol = (url.protocol === 'https:' ? 'wss:' : 'ws:');
+        const socket = new WebSocket(url.href);
+        socket.addEventListener('open', () => this._socket = socket);
+        socket.addEventListener('message', event => {
+            const message = JSON.parse(event.data);
+            const request = this._socketRequests.get(message.id);
+            if (request !== undefined) {
+                this._socketRequests.delete(message.id);
+                request.resolve(message);
+            }
+        });
+        socket.addEventListener('close', () => {
+            this._socket = undefined;
+            this._socketRequests.forEach(request => request.reject(
+                new Error("WebSocket closed.")));
+            this._socketRequests.clear();
+        });
+    }
+    
+    socket_send(method, path, value) {
+        return new Promise((resolve, reject) => {
+            const id = ++this._socketID;
+            this._socketRequests.set(id, {"resolve": resolve, "reject": reject});
+            const message = {"id": id, "method": method, "path": path};
+            if (value !== undefined) {
+                message.value = value;
+            }
+            this._socket.send(JSON.stringify(message));
+        });
     }
     
     clear_fetch_counts() {
@@ -493,9 +534,14 @@ export default class UserInterface {
     
     fetch(method, ...parameters) {
         this.add_fetch_count(method);
+        const value = (method === "DELETE" ? undefined : parameters.shift());
+        if (this._socket !== undefined) {
+            return this.socket_send(method, parameters.join('/'), value)
+            .then(() => "");
+        }
         const options = {"method": method};
-        if (method !== "DELETE") {
-            options.body = JSON.stringify(parameters.shift());
+        if (value !== undefined) {
+            options.body = JSON.stringify(value);
         }
         return fetch(this.api_path(parameters), options)
         .then(response => response.text());
@@ -503,6 +549,14 @@ export default class UserInterface {
     
     get(...path) {
         this.add_fetch_count("get");
+        if (this._socket !== undefined) {
+            return this.socket_send("GET", path.join('/'))
+            .then(message => (
+                message.status === 200 ?
+                message.value :
+                Promise.reject(new Error(`Status ${message.status}.`))
+            ));
+        }
         return fetch(this.api_path(path))
         .then(response => response.json())
         .catch(reason => Promise.reject(reason));